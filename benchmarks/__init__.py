@@ -0,0 +1,3 @@
+#!/usr/bin/env python
+
+'''Micro benchmarks for the Hyperwallet SDK. Run each module with ``python -m``.'''
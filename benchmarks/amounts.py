@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+'''
+Compare ways of totalling the amounts of a large list result per currency:
+float(), Decimal and integer minor units (hyperwallet.amounts), the latter
+also from a ColumnarResult. Reports the time of each and whether its totals
+are exact.
+
+Usage::
+
+    $ python -m benchmarks.amounts --rows 1000000
+'''
+
+import argparse
+from decimal import Decimal
+from timeit import default_timer
+
+import six
+
+from hyperwallet import ColumnarResult, Receipt, amounts
+from benchmarks.common import report
+
+CURRENCIES = ('USD', 'EUR', 'JPY', 'KWD')
+
+
+def makeAmounts(rows):
+
+    values = []
+    currencies = []
+    for i in range(rows):
+        currency = CURRENCIES[i % len(CURRENCIES)]
+        decimals = amounts.currencyDecimals(currency)
+        units = (i * 7919) % 10 ** (decimals + 4)
+        values.append(str(amounts.fromMinorUnits(units, currency)))
+        currencies.append(currency)
+    return values, currencies
+
+
+def sumFloats(values, currencies):
+
+    totals = {}
+    for (value, currency) in zip(values, currencies):
+        totals[currency] = totals.get(currency, 0.0) + float(value)
+    return totals
+
+
+def sumDecimals(values, currencies):
+
+    totals = {}
+    for (value, currency) in zip(values, currencies):
+        totals[currency] = totals.get(currency, Decimal(0)) + Decimal(value)
+    return totals
+
+
+def inMinorUnits(total, currency):
+
+    if isinstance(total, six.integer_types):
+        return total
+    if isinstance(total, float):
+        total = Decimal(repr(total))
+    return total.scaleb(amounts.currencyDecimals(currency))
+
+
+def timed(function):
+
+    start = default_timer()
+    value = function()
+    return value, default_timer() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    values, currencies = makeAmounts(args.rows)
+    exact, _ = timed(lambda: sumDecimals(values, currencies))
+    expected = dict(
+        (currency, int(total.scaleb(amounts.currencyDecimals(currency))))
+        for (currency, total) in exact.items()
+    )
+
+    def isExact(totals):
+        return all(
+            inMinorUnits(totals[currency], currency) == units
+            for (currency, units) in expected.items()
+        )
+
+    results = {'rows': args.rows}
+    for (name, function) in (
+        ('float', lambda: sumFloats(values, currencies)),
+        ('decimal', lambda: sumDecimals(values, currencies)),
+        ('minorUnits', lambda: amounts.sumMinorUnits(values, currencies))
+    ):
+        totals, seconds = timed(function)
+        results[name] = {'seconds': round(seconds, 3), 'exact': isExact(totals)}
+
+    rows = [{'amount': value, 'currency': currency} for (value, currency) in zip(values, currencies)]
+    columns = ColumnarResult(Receipt, rows)
+    del rows
+    totals, seconds = timed(lambda: columns.sumMinorUnits())
+    results['columnarMinorUnits'] = {'seconds': round(seconds, 3), 'exact': isExact(totals)}
+
+    report('amounts', results)
+
+
+if __name__ == '__main__':
+    main()
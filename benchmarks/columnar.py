@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+'''
+Compare a list of Receipt models with a ColumnarResult for a large receipts
+listing: the memory each holds, summing amounts by currency and filtering.
+
+The receipts are parsed from one JSON response, like the list endpoints do,
+and only the result is kept. Usage::
+
+    $ python -m benchmarks.columnar --rows 200000
+'''
+
+import argparse
+import gc
+import json
+import tracemalloc
+from timeit import default_timer
+
+from hyperwallet import ColumnarResult, Receipt
+from benchmarks.common import report
+
+CURRENCIES = ('USD', 'CAD', 'EUR', 'GBP', 'JPY')
+TYPES = ('PAYMENT', 'TRANSFER_TO_BANK_ACCOUNT', 'CARD_ACTIVATION_FEE', 'TRANSFER_REVERSAL')
+
+
+def makeResponse(rows):
+
+    return json.dumps({'data': [
+        {
+            'journalId': str(51660665 + i),
+            'type': TYPES[i % len(TYPES)],
+            'createdOn': '2017-11-01T17:08:58',
+            'entry': 'CREDIT' if i % 3 else 'DEBIT',
+            'sourceToken': 'act-12345',
+            'destinationToken': 'usr-%08d' % (i % 1000),
+            'amount': '%d.%02d' % (i % 500, i % 100),
+            'fee': '0.00',
+            'currency': CURRENCIES[i % len(CURRENCIES)],
+            'details': {'clientPaymentId': 'ABC%d' % i, 'payeeName': 'John Smith'}
+        }
+        for i in range(rows)
+    ]})
+
+
+def build(text, factory):
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    began = default_timer()
+    result = factory(json.loads(text)['data'])
+    seconds = default_timer() - began
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return result, retained, seconds
+
+
+def timed(function):
+
+    start = default_timer()
+    value = function()
+    return value, default_timer() - start
+
+
+def sumModels(receipts):
+
+    totals = {}
+    for receipt in receipts:
+        totals[receipt.currency] = totals.get(receipt.currency, 0.0) + float(receipt.amount)
+    return totals
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    text = makeResponse(args.rows)
+    results = {'rows': args.rows}
+
+    models, retained, seconds = build(text, lambda rows: [Receipt(x) for x in rows])
+    totals, sumSeconds = timed(lambda: sumModels(models))
+    filtered, filterSeconds = timed(lambda: [x for x in models if x.currency == 'USD' and x.entry == 'CREDIT'])
+    results['models'] = {
+        'retainedBytes': retained,
+        'buildSeconds': round(seconds, 3),
+        'sumByCurrencySeconds': round(sumSeconds, 4),
+        'filterSeconds': round(filterSeconds, 4),
+        'filteredRows': len(filtered)
+    }
+    del models, filtered
+
+    columns, retained, seconds = build(text, lambda rows: ColumnarResult(Receipt, rows))
+    columnTotals, sumSeconds = timed(lambda: columns.sum('amount', by='currency'))
+    filtered, filterSeconds = timed(lambda: columns.filter(currency='USD', entry='CREDIT'))
+    results['columnar'] = {
+        'retainedBytes': retained,
+        'buildSeconds': round(seconds, 3),
+        'sumByCurrencySeconds': round(sumSeconds, 4),
+        'filterSeconds': round(filterSeconds, 4),
+        'filteredRows': len(filtered)
+    }
+
+    assert all(abs(totals[currency] - columnTotals[currency]) < 1e-6 * abs(totals[currency]) for currency in totals)
+
+    report('columnar', results)
+
+
+if __name__ == '__main__':
+    main()
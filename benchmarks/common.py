@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+'''Helpers shared by the benchmark modules'''
+
+import json
+import os
+import platform
+import sys
+from timeit import default_timer
+
+import hyperwallet
+
+
+RESOURCES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'hyperwallet',
+    'tests',
+    'resources'
+)
+
+
+def resource(name):
+    '''
+    Return the path of a file in the test resources directory.
+    '''
+
+    return os.path.join(RESOURCES, name)
+
+
+def measure(function, repeat):
+    '''
+    Call function repeat times and return the mean duration in seconds.
+    '''
+
+    start = default_timer()
+    for _ in range(repeat):
+        function()
+    return (default_timer() - start) / repeat
+
+
+def report(name, results):
+    '''
+    Print the results of a benchmark as one JSON document so runs can be
+    compared across releases.
+    '''
+
+    json.dump({
+        'benchmark': name,
+        'sdkVersion': hyperwallet.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results
+    }, sys.stdout, indent=4, sort_keys=True)
+    sys.stdout.write('\n')
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+'''
+Measure encrypted-mode throughput with and without the process pool.
+
+Runs sign+encrypt and decrypt+verify round trips with the keys from the test
+resources, from several threads in the calling process, from the same
+threads through Encryption(processes=N), and as batches through the
+CryptoPool. Usage::
+
+    $ python -m benchmarks.cryptopool --messages 400 --threads 8 --processes 4
+'''
+
+import argparse
+import multiprocessing
+import threading
+from timeit import default_timer
+
+from hyperwallet.utils.cryptopool import CryptoPool
+from hyperwallet.utils.encryption import Encryption
+from benchmarks.common import report, resource
+
+
+def runThreads(encryption, messages, threads):
+
+    def work(count):
+        for i in range(count):
+            encryption.decrypt(encryption.encrypt('{"amount":"10.00","index":%d}' % i))
+
+    workers = [
+        threading.Thread(target=work, args=(messages // threads,))
+        for _ in range(threads)
+    ]
+    start = default_timer()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return default_timer() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--messages', type=int, default=400)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--processes', type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+
+    encryptionData = {
+        'clientPrivateKeySetLocation': resource('private-jwkset1'),
+        'hyperwalletKeySetLocation': resource('public-jwkset1')
+    }
+    messages = args.messages - args.messages % args.threads
+
+    results = {}
+
+    encryption = Encryption(**encryptionData)
+    encryption.reloadKeySets()
+    seconds = runThreads(encryption, messages, args.threads)
+    results['threads'] = {'messages': messages, 'roundTripsPerSecond': round(messages / seconds, 1)}
+
+    pooled = Encryption(processes=args.processes, **encryptionData)
+    pooled.decrypt(pooled.encrypt('warm up'))
+    seconds = runThreads(pooled, messages, args.threads)
+    results['processPool'] = {'messages': messages, 'roundTripsPerSecond': round(messages / seconds, 1)}
+    pooled.close()
+
+    pool = CryptoPool(encryptionData, args.processes)
+    pool.decryptMany(pool.encryptMany(['warm up'] * args.processes))
+    start = default_timer()
+    pool.decryptMany(pool.encryptMany(['{"amount":"10.00","index":%d}' % i for i in range(messages)]))
+    seconds = default_timer() - start
+    results['processPoolBatch'] = {'messages': messages, 'roundTripsPerSecond': round(messages / seconds, 1)}
+    pool.close()
+
+    for result in results.values():
+        result.update(threads=args.threads, processes=args.processes)
+
+    report('cryptopool', results)
+
+
+if __name__ == '__main__':
+    main()
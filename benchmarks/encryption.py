@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+'''
+Measure what encrypted mode costs per call, across payload sizes.
+
+Times Encryption.encrypt/decrypt round trips with the JWK key sets from the
+test resources and breaks them down into their phases: signing, key
+wrapping, content encryption, key unwrapping, content decryption,
+verification and expiry checks. The results are printed as JSON so they can
+be compared across releases. Usage::
+
+    $ python -m benchmarks.encryption --sizes 1024,1048576 --repeat 20
+'''
+
+import argparse
+import json
+import time
+
+from jwcrypto import jws as cryptoJWS
+from jwcrypto.common import base64url_decode, json_encode
+from jwcrypto.jwa import JWA
+
+from hyperwallet.utils.encryption import Encryption
+from hyperwallet.utils.keyset import JwkKeySet
+from benchmarks.common import measure, report, resource
+
+DEFAULT_SIZES = '1024,16384,131072,1048576,5242880'
+
+
+def loadKeySet(path):
+
+    with open(path) as f:
+        return JwkKeySet(json.load(f))
+
+
+def makePayload(size):
+
+    prefix, suffix = '{"data":"', '"}'
+    return prefix + 'x' * max(0, size - len(prefix) - len(suffix)) + suffix
+
+
+def benchmarkSize(size, repeat, profile):
+
+    encryption = Encryption(
+        profile['clientPrivateKeySetLocation'],
+        profile['hyperwalletKeySetLocation'],
+        encryptionAlgorithm=profile['encryptionAlgorithm'],
+        signAlgorithm=profile['signAlgorithm']
+    )
+    signKey = loadKeySet(profile['clientPrivateKeySetLocation']).findByAlgorithm(profile['signAlgorithm'])
+    wrapKey = loadKeySet(profile['hyperwalletKeySetLocation']).findByAlgorithm(profile['encryptionAlgorithm'])
+    unwrapKey = loadKeySet(profile['clientPrivateKeySetLocation']).findByAlgorithm(profile['encryptionAlgorithm'])
+    verifyKey = loadKeySet(profile['hyperwalletKeySetLocation']).findByAlgorithm(profile['signAlgorithm'])
+
+    body = makePayload(size)
+    signAlg = JWA.signing_alg(profile['signAlgorithm'])
+    keyAlg = JWA.keymgmt_alg(profile['encryptionAlgorithm'])
+    encAlg = JWA.encryption_alg('A256CBC-HS512')
+    jweHeaders = {'alg': profile['encryptionAlgorithm'], 'enc': 'A256CBC-HS512'}
+    aad = json_encode(jweHeaders).encode('utf-8')
+
+    def sign():
+        token = cryptoJWS.JWS(body.encode('utf-8'))
+        token.add_signature(signKey.key, None, json_encode({
+            'alg': profile['signAlgorithm'],
+            'kid': signKey.kid,
+            'exp': int(time.time()) + 300
+        }))
+        return token.serialize(True)
+
+    signedBody = sign()
+    wrapped = keyAlg.wrap(wrapKey.key, encAlg.wrap_key_size, None, jweHeaders)
+    unwrapHeaders = dict(jweHeaders, **wrapped.get('header', {}))
+    iv, ciphertext, tag = encAlg.encrypt(wrapped['cek'], aad, signedBody.encode('utf-8'))
+    encodedHeader, encodedPayload, encodedSignature = signedBody.split('.')
+    signingInput = (encodedHeader + '.' + encodedPayload).encode('utf-8')
+    signature = base64url_decode(encodedSignature)
+    encryptedBody = encryption.encrypt(body)
+
+    phases = {
+        'signing': sign,
+        'keyWrapping': lambda: keyAlg.wrap(wrapKey.key, encAlg.wrap_key_size, None, jweHeaders),
+        'contentEncryption': lambda: encAlg.encrypt(wrapped['cek'], aad, signedBody.encode('utf-8')),
+        'keyUnwrapping': lambda: keyAlg.unwrap(unwrapKey.key, encAlg.wrap_key_size, wrapped.get('ek', b''), unwrapHeaders),
+        'contentDecryption': lambda: encAlg.decrypt(wrapped['cek'], aad, iv, ciphertext, tag),
+        'verification': lambda: signAlg.verify(verifyKey.key, signingInput, signature),
+        'expiryCheck': lambda: encryption.checkJwsExpiration(signedBody),
+        'encrypt': lambda: encryption.encrypt(body),
+        'decrypt': lambda: encryption.decrypt(encryptedBody)
+    }
+
+    result = {'payloadBytes': len(body), 'repeat': repeat}
+    for (name, function) in sorted(phases.items()):
+        function()
+        result[name + 'Microseconds'] = round(measure(function, repeat) * 1e6, 2)
+
+    return result
+
+
+PROFILES = {
+    'RSA': {
+        'clientPrivateKeySetLocation': resource('private-jwkset1'),
+        'hyperwalletKeySetLocation': resource('public-jwkset1'),
+        'encryptionAlgorithm': 'RSA-OAEP-256',
+        'signAlgorithm': 'RS256'
+    },
+    'EC': {
+        'clientPrivateKeySetLocation': resource('private-jwkset-ec'),
+        'hyperwalletKeySetLocation': resource('public-jwkset-ec'),
+        'encryptionAlgorithm': 'ECDH-ES',
+        'signAlgorithm': 'ES256'
+    }
+}
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--profile', choices=sorted(PROFILES), action='append')
+    args = parser.parse_args()
+
+    results = []
+    for name in args.profile or sorted(PROFILES):
+        for size in [int(size) for size in args.sizes.split(',')]:
+            # Fewer repetitions for large payloads to keep the run short.
+            repeat = max(3, args.repeat * 65536 // max(size, 65536))
+            result = benchmarkSize(size, repeat, PROFILES[name])
+            result['profile'] = name
+            results.append(result)
+
+    report('encryption', results)
+
+
+if __name__ == '__main__':
+    main()
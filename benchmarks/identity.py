@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+'''
+Walk a list of payments and fetch the User of each destination, with and
+without an identity map scope, counting the GET requests sent and the memory
+held by the fetched users. Requests are answered in process by a stand-in
+for the API client, so only the SDK side is measured.
+
+Usage::
+
+    $ python -m benchmarks.identity --payments 100000 --users 1000
+'''
+
+import argparse
+import gc
+import json
+import tracemalloc
+from timeit import default_timer
+
+import hyperwallet
+from benchmarks.common import report
+from benchmarks.models import ROWS
+
+
+class StandIn(object):
+
+    def __init__(self):
+
+        self.text = json.dumps(ROWS['User'][1])
+        self.gets = 0
+
+    def doGet(self, path, params=None):
+
+        self.gets += 1
+        data = json.loads(self.text)
+        data['token'] = path.rsplit('/', 1)[-1]
+        return data
+
+
+def walk(api, payments):
+
+    return [(payment, api.getUser(payment.destinationToken)) for payment in payments]
+
+
+def run(api, payments, scoped):
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    began = default_timer()
+    if scoped:
+        with api.identityMap():
+            pairs = walk(api, payments)
+    else:
+        pairs = walk(api, payments)
+    seconds = default_timer() - began
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del pairs
+    return retained, seconds
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--payments', type=int, default=100000)
+    parser.add_argument('--users', type=int, default=1000)
+    args = parser.parse_args()
+
+    payments = [
+        hyperwallet.Payment({'token': 'pmt-%08d' % i, 'destinationToken': 'usr-%08d' % (i % args.users)})
+        for i in range(args.payments)
+    ]
+
+    results = {'payments': args.payments, 'users': args.users}
+    for scoped in (False, True):
+        api = hyperwallet.Api('username', 'password', 'prg-12345')
+        api.apiClient = StandIn()
+        retained, seconds = run(api, payments, scoped)
+        results['identityMap' if scoped else 'plain'] = {
+            'gets': api.apiClient.gets,
+            'retainedBytes': retained,
+            'seconds': round(seconds, 3)
+        }
+
+    report('identity', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+'''
+Measure the memory held by large Receipt, Payment and User list results with
+and without interning the values of their enum-like attributes, and the time
+it takes to build them.
+
+The rows are parsed from one JSON response, like the list endpoints do, and
+only the models are kept. Usage::
+
+    $ python -m benchmarks.interning --rows 200000
+'''
+
+import argparse
+import gc
+import json
+import tracemalloc
+from timeit import default_timer
+
+from hyperwallet import Payment, Receipt, User, interning
+from hyperwallet.interning import INTERNED_FIELDS, internRows
+from benchmarks.common import report
+
+CURRENCIES = ('USD', 'CAD', 'EUR', 'GBP', 'JPY')
+COUNTRIES = ('US', 'CA', 'FR', 'GB', 'JP')
+
+
+def makeRow(model, i):
+
+    if model is Receipt:
+        return {
+            'journalId': str(51660665 + i),
+            'type': ('PAYMENT', 'TRANSFER_TO_BANK_ACCOUNT', 'CARD_ACTIVATION_FEE')[i % 3],
+            'createdOn': '2017-11-01T17:08:58',
+            'entry': 'CREDIT' if i % 3 else 'DEBIT',
+            'sourceToken': 'act-12345',
+            'destinationToken': 'usr-%08d' % (i % 1000),
+            'amount': '%d.%02d' % (i % 500, i % 100),
+            'fee': '0.00',
+            'currency': CURRENCIES[i % len(CURRENCIES)]
+        }
+
+    if model is Payment:
+        return {
+            'token': 'pmt-%08d' % i,
+            'status': ('COMPLETED', 'PENDING', 'FAILED')[i % 3],
+            'createdOn': '2017-11-01T17:08:58',
+            'amount': '20.00',
+            'currency': CURRENCIES[i % len(CURRENCIES)],
+            'clientPaymentId': 'ABC%d' % i,
+            'purpose': 'OTHER',
+            'destinationToken': 'usr-%08d' % (i % 1000),
+            'programToken': 'prg-83836cdf-2ce2-4696-8bc5-f1b86077238c'
+        }
+
+    return {
+        'token': 'usr-%08d' % i,
+        'status': ('ACTIVATED', 'PRE_ACTIVATED', 'LOCKED')[i % 3],
+        'verificationStatus': 'NOT_REQUIRED',
+        'createdOn': '2017-10-30T22:15:45',
+        'clientUserId': 'C%d' % i,
+        'profileType': 'INDIVIDUAL' if i % 4 else 'BUSINESS',
+        'firstName': 'John',
+        'lastName': 'Smith',
+        'email': 'john%d@company.com' % i,
+        'country': COUNTRIES[i % len(COUNTRIES)],
+        'language': 'en',
+        'gender': 'MALE' if i % 2 else 'FEMALE',
+        'programToken': 'prg-83836cdf-2ce2-4696-8bc5-f1b86077238c'
+    }
+
+
+def build(model, text, intern):
+
+    fields = [field for field in INTERNED_FIELDS if hasattr(model, field)]
+    interning._values.clear()
+    rows = json.loads(text)['data']
+    if intern:
+        rows = internRows(rows, fields)
+    return [model(x) for x in rows]
+
+
+def retainedBytes(model, text, intern):
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    models = build(model, text, intern)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del models
+    return retained
+
+
+def buildSeconds(model, text, intern):
+
+    gc.collect()
+    began = default_timer()
+    models = build(model, text, intern)
+    seconds = default_timer() - began
+    del models
+    return seconds
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    results = {}
+    for model in (Receipt, Payment, User):
+        text = json.dumps({'data': [makeRow(model, i) for i in range(args.rows)]})
+        for intern in (False, True):
+            retained = retainedBytes(model, text, intern)
+            seconds = buildSeconds(model, text, intern)
+            results['{}{}'.format(model.__name__, 'Interned' if intern else '')] = {
+                'rows': args.rows,
+                'bytesPerInstance': round(float(retained) / args.rows, 1),
+                'buildSeconds': round(seconds, 3)
+            }
+
+    report('interning', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+'''
+Measure the per-call key setup of encrypted requests.
+
+Compares building the signing and encryption keys and their protected headers
+from the raw JWK key sets on every call with looking them up in a prepared
+JwkKeySet. Usage::
+
+    $ python -m benchmarks.keyset --calls 2000
+'''
+
+import argparse
+import json
+import time
+
+from jwcrypto import jwk
+from jwcrypto.common import json_encode
+
+from hyperwallet.utils.keyset import JwkKeySet
+from benchmarks.common import measure, report, resource
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(resource('private-jwkset1')) as f:
+        privateText = f.read()
+    with open(resource('public-jwkset1')) as f:
+        publicText = f.read()
+
+    def findByAlgorithm(keySet, algorithm):
+        for key in keySet['keys']:
+            if key['alg'] == algorithm:
+                return key
+
+    def unprepared():
+        signKey = findByAlgorithm(json.loads(privateText), 'RS256')
+        jwk.JWK(**signKey).get_op_key('sign')
+        json_encode({'alg': 'RS256', 'kid': signKey['kid'], 'exp': int(time.time())})
+        encryptKey = findByAlgorithm(json.loads(publicText), 'RSA-OAEP-256')
+        jwk.JWK(**encryptKey).get_op_key('wrapKey')
+        json_encode({'alg': 'RSA-OAEP-256', 'enc': 'A256CBC-HS512', 'typ': 'JWE', 'kid': encryptKey['kid']})
+
+    privateKeySet = JwkKeySet(json.loads(privateText))
+    publicKeySet = JwkKeySet(json.loads(publicText))
+
+    def prepared():
+        privateKeySet.findByAlgorithm('RS256').key.get_op_key('sign')
+        publicKeySet.findByAlgorithm('RSA-OAEP-256').key.get_op_key('wrapKey')
+
+    results = {}
+    for (name, function) in (('unprepared', unprepared), ('prepared', prepared)):
+        function()
+        results[name] = {
+            'calls': args.calls,
+            'meanMicroseconds': round(measure(function, args.calls) * 1e6, 2)
+        }
+
+    report('keyset', results)
+
+
+if __name__ == '__main__':
+    main()
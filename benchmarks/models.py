@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+'''
+Measure the memory held per model instance for User, Receipt and Payment, and
+the time it takes to build one.
+
+Each row is parsed from JSON on its own, like the rows of a list response, and
+only the models are kept, so the retained memory includes whatever the model
+keeps of its source dictionary. Construction is timed on already parsed rows.
+Usage::
+
+    $ python -m benchmarks.models --rows 10000
+'''
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from hyperwallet import HyperwalletModel, Payment, Receipt, User
+from benchmarks.common import measure, report
+
+ROWS = {
+    'User': (User, {
+        'token': 'usr-f9154016-94e8-4686-a840-075688ac07b5',
+        'status': 'PRE_ACTIVATED',
+        'verificationStatus': 'NOT_REQUIRED',
+        'createdOn': '2017-10-30T22:15:45',
+        'clientUserId': 'CSK7b8Ffch',
+        'profileType': 'INDIVIDUAL',
+        'firstName': 'John',
+        'lastName': 'Smith',
+        'dateOfBirth': '1991-01-01',
+        'email': 'john@company.com',
+        'addressLine1': '123 Main Street',
+        'city': 'New York',
+        'stateProvince': 'NY',
+        'country': 'US',
+        'postalCode': '10016',
+        'language': 'en',
+        'programToken': 'prg-83836cdf-2ce2-4696-8bc5-f1b86077238c',
+        'links': [{
+            'params': {'rel': 'self'},
+            'href': 'https://api.sandbox.hyperwallet.com/rest/v3/users/usr-f9154016-94e8-4686-a840-075688ac07b5'
+        }]
+    }),
+    'Receipt': (Receipt, {
+        'journalId': '51660665',
+        'type': 'PAYMENT',
+        'createdOn': '2017-11-01T17:08:58',
+        'entry': 'CREDIT',
+        'sourceToken': 'act-12345',
+        'destinationToken': 'usr-f9154016-94e8-4686-a840-075688ac07b5',
+        'amount': '20.00',
+        'fee': '0.00',
+        'currency': 'USD',
+        'details': {
+            'clientPaymentId': 'ABC1234',
+            'payeeName': 'John Smith'
+        }
+    }),
+    'Payment': (Payment, {
+        'token': 'pmt-87939c73-ff0a-4011-970e-3de855347ea7',
+        'status': 'COMPLETED',
+        'createdOn': '2017-11-01T17:08:58',
+        'amount': '20.00',
+        'currency': 'USD',
+        'clientPaymentId': 'ABC1234',
+        'purpose': 'OTHER',
+        'expiresOn': '2018-05-01T00:00:00',
+        'destinationToken': 'usr-f9154016-94e8-4686-a840-075688ac07b5',
+        'programToken': 'prg-83836cdf-2ce2-4696-8bc5-f1b86077238c',
+        'links': [{
+            'params': {'rel': 'self'},
+            'href': 'https://api.sandbox.hyperwallet.com/rest/v3/payments/pmt-87939c73-ff0a-4011-970e-3de855347ea7'
+        }]
+    })
+}
+
+
+def retainedBytes(model, text, rows):
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    models = [model(json.loads(text)) for _ in range(rows)]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del models
+    return retained
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10000)
+    args = parser.parse_args()
+
+    results = {}
+    for (name, (model, row)) in sorted(ROWS.items()):
+        text = json.dumps(row)
+        for keepRawJson in (True, False):
+            HyperwalletModel.keepRawJson = keepRawJson
+            retained = retainedBytes(model, text, args.rows)
+            data = json.loads(text)
+            results['{}{}'.format(name, '' if keepRawJson else 'WithoutRawJson')] = {
+                'rows': args.rows,
+                'bytesPerInstance': round(float(retained) / args.rows, 1),
+                'constructMicroseconds': round(measure(lambda: model(data), args.rows) * 1e6, 3)
+            }
+    HyperwalletModel.keepRawJson = True
+
+    report('models', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+'''
+Compare ways of shipping a large list of User, Payment and Receipt models to
+a cache or another process: the size of the payload and the time to encode
+and decode it. The baselines are JSON strings re-parsed into models and the
+pickled source dictionaries, which is what pickling a model amounts to.
+
+Usage::
+
+    $ python -m benchmarks.packing --rows 100000
+'''
+
+import argparse
+import gc
+import json
+import pickle
+from timeit import default_timer
+
+from hyperwallet import packModels, unpackModels
+from hyperwallet.packing import MSGPACK, PICKLE, _msgpack
+from benchmarks.common import report
+from benchmarks.models import ROWS
+
+
+def encodeJson(models):
+
+    return json.dumps([model.asDict() for model in models])
+
+
+def decodeJson(model, data):
+
+    return [model(row) for row in json.loads(data)]
+
+
+def encodeDicts(models):
+
+    return pickle.dumps([(type(model), model._raw_json) for model in models], pickle.HIGHEST_PROTOCOL)
+
+
+def decodeDicts(data):
+
+    return [model(row) for (model, row) in pickle.loads(data)]
+
+
+def timed(function):
+
+    # Like timeit, leave out collections triggered by the models kept alive.
+    gc.disable()
+    try:
+        start = default_timer()
+        value = function()
+        return value, default_timer() - start
+    finally:
+        gc.enable()
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    formats = [PICKLE] + ([MSGPACK] if _msgpack() is not None else [])
+
+    results = {}
+    for (name, (model, row)) in sorted(ROWS.items()):
+        text = json.dumps(row)
+        models = [model(json.loads(text)) for _ in range(args.rows)]
+        expected = [instance.asDict() for instance in models]
+        result = results[name] = {'rows': args.rows}
+
+        cases = [
+            ('json', lambda: encodeJson(models), lambda data: decodeJson(model, data)),
+            ('pickledDicts', lambda: encodeDicts(models), decodeDicts)
+        ] + [
+            (format, lambda format=format: packModels(models, format), unpackModels)
+            for format in formats
+        ]
+
+        for (case, encode, decode) in cases:
+            data, encodeSeconds = timed(encode)
+            decoded, decodeSeconds = timed(lambda: decode(data))
+            assert [instance.asDict() for instance in decoded] == expected
+            result[case] = {
+                'bytesPerModel': round(float(len(data)) / args.rows, 1),
+                'encodeSeconds': round(encodeSeconds, 3),
+                'decodeSeconds': round(decodeSeconds, 3)
+            }
+
+    report('packing', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+'''
+Compare sequential and pipelined bulk requests in encrypted mode.
+
+A local HTTP stand-in answers every POST after a fixed latency with a
+pre-encrypted body. The same batch is sent one request after the other with
+ApiClient.doPost() and through ApiClient.doPipeline(), and both are compared
+with the CPU time of the encryption alone, the time of sending pre-encrypted
+bodies alone and the ideal max(CPU time, network time). The stand-in runs in a child process so that,
+like the real API, it does not compete with the client for the GIL.
+Usage::
+
+    $ python -m benchmarks.pipeline --requests 200 --latency 0.005
+'''
+
+import argparse
+import json
+import multiprocessing
+import threading
+from timeit import default_timer
+
+from six.moves import BaseHTTPServer, socketserver
+
+from hyperwallet.utils import ApiClient
+from hyperwallet.utils.encryption import Encryption
+from benchmarks.common import report, resource
+
+
+class StandInHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    # Set by serve() before the server starts.
+    latency = 0
+    content = b''
+
+    def do_POST(self):
+
+        self.rfile.read(int(self.headers['Content-Length']))
+        threading.Event().wait(self.latency)
+        self.send_response(201)
+        self.send_header('Content-Type', 'application/jose+json')
+        self.send_header('Content-Length', str(len(self.content)))
+        self.end_headers()
+        self.wfile.write(self.content)
+
+    def log_message(self, format, *args):
+
+        pass
+
+
+class TCPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+
+
+def serve(latency, content, addressQueue):
+
+    StandInHandler.latency = latency
+    StandInHandler.content = content
+    server = TCPServer(('127.0.0.1', 0), StandInHandler)
+    addressQueue.put(server.server_address)
+    server.serve_forever()
+
+
+def timed(function):
+
+    start = default_timer()
+    function()
+    return default_timer() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--concurrency', type=int, default=1)
+    args = parser.parse_args()
+
+    encryptionData = {
+        'clientPrivateKeySetLocation': resource('private-jwkset1'),
+        'hyperwalletKeySetLocation': resource('public-jwkset1')
+    }
+    payment = {'amount': '10.00', 'currency': 'USD', 'destinationToken': 'usr-12345'}
+    encryption = Encryption(**encryptionData)
+
+    content = encryption.encrypt(json.dumps(dict(payment, token='pmt-12345'))).encode('utf-8')
+    addressQueue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(args.latency, content, addressQueue))
+    server.daemon = True
+    server.start()
+
+    client = ApiClient(
+        'test-user',
+        'test-pass',
+        'http://{}:{}'.format(*addressQueue.get()),
+        encryptionData
+    )
+    requests = [
+        {'method': 'POST', 'url': 'payments', 'data': payment}
+        for _ in range(args.requests)
+    ]
+
+    try:
+        client.doPost('payments', payment)
+
+        def cpuOnly():
+            for _ in range(args.requests):
+                encryption.decrypt(encryption.encrypt(json.dumps(payment)))
+
+        def networkOnly():
+            body = encryption.encrypt(json.dumps(payment))
+            for _ in range(args.requests):
+                client._sendRequest('POST', 'payments', body, None, None)
+
+        def sequential():
+            for _ in range(args.requests):
+                client.doPost('payments', payment)
+
+        cpuSeconds = timed(cpuOnly)
+        networkSeconds = timed(networkOnly) / args.concurrency
+        sequentialSeconds = timed(sequential)
+        pipelinedSeconds = timed(lambda: client.doPipeline(requests, args.concurrency))
+    finally:
+        client.session.close()
+        server.terminate()
+
+    def throughput(seconds):
+        return {
+            'seconds': round(seconds, 3),
+            'requestsPerSecond': round(args.requests / seconds, 1)
+        }
+
+    report('pipeline', {
+        'requests': args.requests,
+        'latencySeconds': args.latency,
+        'concurrency': args.concurrency,
+        'cpuOnly': throughput(cpuSeconds),
+        'networkOnly': throughput(networkSeconds),
+        'ideal': throughput(max(cpuSeconds, networkSeconds)),
+        'sequential': throughput(sequentialSeconds),
+        'pipelined': throughput(pipelinedSeconds)
+    })
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+'''
+Scan all users page by page through Api.listUsers() and keep the models,
+with and without a projection on a few attributes, measuring the memory held
+per user and the time of the scan. Pages are answered in process by a
+stand-in for the API client, parsed from JSON like real responses.
+
+Usage::
+
+    $ python -m benchmarks.projection --rows 200000 --fields token,status,email
+'''
+
+import argparse
+import gc
+import json
+import tracemalloc
+from timeit import default_timer
+
+import hyperwallet
+from benchmarks.common import report
+from benchmarks.models import ROWS
+
+PAGE = 1000
+
+
+class StandIn(object):
+
+    def __init__(self, rows):
+
+        row = dict(ROWS['User'][1])
+        self.pages = []
+        for start in range(0, rows, PAGE):
+            data = []
+            for i in range(start, min(rows, start + PAGE)):
+                row['token'] = 'usr-%08d' % i
+                row['email'] = 'user%d@company.com' % i
+                data.append(dict(row))
+            self.pages.append(json.dumps({'data': data}))
+
+    def doGet(self, path, params=None):
+
+        return json.loads(self.pages[params['offset'] // PAGE])
+
+
+def scan(api, pages, fields):
+
+    users = []
+    for page in range(pages):
+        users.extend(api.listUsers({'offset': page * PAGE, 'limit': PAGE}, fields=fields))
+    return users
+
+
+def run(api, pages, fields):
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    users = scan(api, pages, fields)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del users
+
+    gc.collect()
+    began = default_timer()
+    users = scan(api, pages, fields)
+    seconds = default_timer() - began
+    return users, retained, seconds
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--fields', default='token,status,email')
+    args = parser.parse_args()
+
+    api = hyperwallet.Api('username', 'password', 'prg-12345')
+    api.apiClient = StandIn(args.rows)
+    pages = len(api.apiClient.pages)
+
+    results = {'rows': args.rows}
+    for (name, fields) in (('full', None), ('projected', args.fields.split(','))):
+        users, retained, seconds = run(api, pages, fields)
+        results[name] = {
+            'fields': len(hyperwallet.User._fields if fields is None else fields),
+            'bytesPerUser': round(float(retained) / args.rows, 1),
+            'scanSeconds': round(seconds, 3)
+        }
+        del users
+
+    report('projection', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+'''
+Measure serializing a large list of User models: asDict(), the indented JSON
+string used by str(), also when memoized for models built with
+keepRawJson=False, and the compact string.
+The previous asDict() and asJsonString(), which looked every key up three
+times and always indented, are timed for comparison.
+
+Usage::
+
+    $ python -m benchmarks.serialization --rows 100000
+'''
+
+import argparse
+import json
+from timeit import default_timer
+
+from hyperwallet import User
+from benchmarks.common import report
+from benchmarks.models import ROWS
+
+
+def previousAsDict(model):
+
+    source = model._raw_json
+    data = {}
+    for (key, value) in source.items():
+        if isinstance(source.get(key, None), (list, tuple, set)):
+            data[key] = list()
+            for subobj in source.get(key, None):
+                data[key].append(subobj)
+        elif source.get(key, None):
+            data[key] = source.get(key, None)
+    return data
+
+
+def previousAsJsonString(model):
+
+    return json.dumps(previousAsDict(model), sort_keys=True, separators=(',', ':'), indent=4)
+
+
+def timed(function):
+
+    start = default_timer()
+    value = function()
+    return value, default_timer() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    text = json.dumps(ROWS['User'][1])
+    users = [User(json.loads(text)) for _ in range(args.rows)]
+    results = {'rows': args.rows}
+
+    expected, seconds = timed(lambda: [previousAsDict(user) for user in users])
+    results['previousAsDictSeconds'] = round(seconds, 3)
+    dicts, seconds = timed(lambda: [user.asDict() for user in users])
+    results['asDictSeconds'] = round(seconds, 3)
+    assert dicts == expected
+
+    expected, seconds = timed(lambda: [previousAsJsonString(user) for user in users])
+    results['previousStrSeconds'] = round(seconds, 3)
+    strings, seconds = timed(lambda: [str(user) for user in users])
+    results['strSeconds'] = round(seconds, 3)
+    assert strings == expected
+
+    copies = [User(json.loads(text), keepRawJson=False) for _ in range(args.rows)]
+    strings, seconds = timed(lambda: [str(user) for user in copies])
+    results['copiedStrSeconds'] = round(seconds, 3)
+    strings, seconds = timed(lambda: [str(user) for user in copies])
+    results['memoizedStrSeconds'] = round(seconds, 3)
+
+    strings, seconds = timed(lambda: [user.asJsonString(compact=True) for user in users])
+    results['compactSeconds'] = round(seconds, 3)
+
+    report('serialization', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+'''
+Compare ways of turning the createdOn timestamps of a large receipts listing
+into datetimes: strptime per row, the fixed-position parser of
+hyperwallet.timestamps without its memo, and Receipt.asDatetime() with the
+memo. The receipts are listed in creation order and spread over a few hours,
+so timestamps repeat to the second like in a busy program.
+
+Usage::
+
+    $ python -m benchmarks.timestamps --rows 1000000
+'''
+
+import argparse
+from datetime import datetime, timedelta
+from timeit import default_timer
+
+from hyperwallet import Receipt, timestamps
+from benchmarks.common import report
+
+
+def makeReceipts(rows, seconds):
+
+    start = datetime(2017, 11, 1, 17, 0, 0)
+    return [
+        Receipt({
+            'journalId': str(51660665 + i),
+            'createdOn': (start + timedelta(seconds=i * seconds // rows)).strftime('%Y-%m-%dT%H:%M:%S'),
+            'amount': '20.00',
+            'currency': 'USD'
+        })
+        for i in range(rows)
+    ]
+
+
+def timed(function):
+
+    start = default_timer()
+    value = function()
+    return value, default_timer() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--seconds', type=int, default=4 * 3600)
+    args = parser.parse_args()
+
+    receipts = makeReceipts(args.rows, args.seconds)
+    results = {'rows': args.rows, 'distinctTimestamps': min(args.rows, args.seconds)}
+
+    expected, seconds = timed(lambda: [
+        datetime.strptime(receipt.createdOn, '%Y-%m-%dT%H:%M:%S') for receipt in receipts
+    ])
+    results['strptime'] = {'seconds': round(seconds, 3)}
+
+    parsed, seconds = timed(lambda: [timestamps._parse(receipt.createdOn) for receipt in receipts])
+    results['parser'] = {'seconds': round(seconds, 3), 'equal': parsed == expected}
+
+    timestamps._cache.clear()
+    parsed, seconds = timed(lambda: [timestamps.parseTimestamp(receipt.createdOn) for receipt in receipts])
+    results['memoized'] = {'seconds': round(seconds, 3), 'equal': parsed == expected}
+
+    timestamps._cache.clear()
+    parsed, seconds = timed(lambda: [receipt.asDatetime() for receipt in receipts])
+    results['asDatetime'] = {'seconds': round(seconds, 3), 'equal': parsed == expected}
+
+    report('timestamps', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+'''
+Compare ApiClient round trips over TCP loopback and over a Unix domain socket.
+
+Both transports talk to the same local HTTP stand-in, so the difference is the
+cost of the transport itself. Usage::
+
+    $ python -m benchmarks.transport --requests 2000
+'''
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from six.moves import BaseHTTPServer, socketserver
+
+from hyperwallet.utils import ApiClient
+from benchmarks.common import measure, report
+
+
+class StandInHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    content = json.dumps({'token': 'usr-12345', 'status': 'ACTIVATED'}).encode('utf-8')
+
+    def do_GET(self):
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.content)))
+        self.end_headers()
+        self.wfile.write(self.content)
+
+    def address_string(self):
+
+        return 'stand-in'
+
+    def log_message(self, format, *args):
+
+        pass
+
+
+class TCPStandInHandler(StandInHandler):
+
+    disable_nagle_algorithm = True
+
+
+class TCPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+
+def serve(server):
+
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    socketPath = os.path.join(directory, 'proxy.sock')
+
+    tcpServer = serve(TCPServer(('127.0.0.1', 0), TCPStandInHandler))
+    unixServer = serve(UnixServer(socketPath, StandInHandler))
+
+    clients = {
+        'tcp-loopback': ApiClient(
+            'test-user',
+            'test-pass',
+            'http://127.0.0.1:{}'.format(tcpServer.server_address[1])
+        ),
+        'unix-socket': ApiClient(
+            'test-user',
+            'test-pass',
+            'https://api.sandbox.hyperwallet.com',
+            unixSocketPath=socketPath
+        )
+    }
+
+    results = {}
+    try:
+        for (name, client) in sorted(clients.items()):
+            client.doGet('users/usr-12345')
+            seconds = measure(lambda: client.doGet('users/usr-12345'), args.requests)
+            results[name] = {
+                'requests': args.requests,
+                'meanMicroseconds': round(seconds * 1e6, 2),
+                'requestsPerSecond': round(1 / seconds, 1)
+            }
+            client.session.close()
+    finally:
+        tcpServer.shutdown()
+        unixServer.shutdown()
+        unixServer.server_close()
+        shutil.rmtree(directory)
+
+    report('transport', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+'''
+Measure ingesting webhook notifications of all types: building Webhook models
+and reading their type and token, with and without reading the object. The
+previous Webhook, which built its object in the constructor from a mapping
+of four types, is timed for comparison, together with how many objects each
+turned into the model of their type.
+
+Usage::
+
+    $ python -m benchmarks.webhooks --rows 200000
+'''
+
+import argparse
+import gc
+from timeit import default_timer
+
+from hyperwallet import BankAccount, Payment, PrepaidCard, User, Webhook
+from hyperwallet.models import ModelField, webhookObjectModel
+from benchmarks.common import report
+
+TYPES = (
+    'USERS.CREATED',
+    'USERS.BANK_ACCOUNTS.CREATED',
+    'USERS.BANK_CARDS.UPDATED.STATUS.DE_ACTIVATED',
+    'USERS.PAPER_CHECKS.CREATED',
+    'USERS.PAYPAL_ACCOUNTS.CREATED',
+    'USERS.PREPAID_CARDS.CREATED',
+    'PAYMENTS.UPDATED.STATUS.COMPLETED',
+    'TRANSFERS.CREATED'
+)
+
+
+class PreviousWebhook(Webhook):
+
+    object = ModelField('object')
+
+    def __init__(self, data, keepRawJson=None):
+
+        super(PreviousWebhook, self).__init__(data, keepRawJson)
+
+        if self.type is None:
+            return
+
+        obj = self._raw_json.get('object')
+        if type(obj) is not dict:
+            return
+
+        types = {
+            'PAYMENTS': Payment,
+            'BANK_ACCOUNTS': BankAccount,
+            'PREPAID_CARDS': PrepaidCard,
+            'USERS': User
+        }
+
+        base, sub = self.type.split('.')[:2]
+
+        if sub in types:
+            self.object = types[sub](obj, keepRawJson)
+        elif base in types:
+            self.object = types[base](obj, keepRawJson)
+
+
+def makeNotifications(rows):
+
+    return [
+        {
+            'token': 'wbh-%08d' % i,
+            'type': TYPES[i % len(TYPES)],
+            'createdOn': '2019-01-01T10:00:00',
+            'object': {
+                'token': 'tkn-%08d' % i,
+                'status': 'ACTIVATED',
+                'createdOn': '2019-01-01T10:00:00'
+            }
+        }
+        for i in range(rows)
+    ]
+
+
+def timed(function):
+
+    gc.disable()
+    try:
+        start = default_timer()
+        value = function()
+        return value, default_timer() - start
+    finally:
+        gc.enable()
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    notifications = makeNotifications(args.rows)
+    results = {'rows': args.rows}
+
+    for (name, model) in (('previous', PreviousWebhook), ('lazy', Webhook)):
+        _, seconds = timed(lambda: [(x.type, x.token) for x in map(model, notifications)])
+        webhooks, objectSeconds = timed(lambda: [(x, x.object) for x in map(model, notifications)])
+        results[name] = {
+            'ingestSeconds': round(seconds, 3),
+            'ingestReadingObjectSeconds': round(objectSeconds, 3),
+            'objectsOfTheirModel': sum(1 for (x, obj) in webhooks if type(obj) is webhookObjectModel(x.type))
+        }
+        del webhooks
+
+    report('webhooks', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -33,4 +33,7 @@ from .models import (
     Webhook                                                              # noqa
 )
 
+from .columnar import ColumnarResult, ModelList                          # noqa
+from .packing import packModels, unpackModels                            # noqa
+from .identity import IdentityMap                                        # noqa
 from .api import Api                                                     # noqa
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+from decimal import Context, Decimal, Inexact, InvalidOperation, localcontext
+
+import six
+
+from hyperwallet.exceptions import HyperwalletException
+
+# The number of decimals of the minor unit of each currency (ISO 4217) which
+# doesn't have the usual two.
+CURRENCY_DECIMALS = dict.fromkeys((
+    'BIF', 'CLP', 'DJF', 'GNF', 'ISK', 'JPY', 'KMF', 'KRW', 'PYG',
+    'RWF', 'UGX', 'UYI', 'VND', 'VUV', 'XAF', 'XOF', 'XPF'
+), 0)
+CURRENCY_DECIMALS.update(dict.fromkeys(('BHD', 'IQD', 'JOD', 'KWD', 'LYD', 'OMR', 'TND'), 3))
+CURRENCY_DECIMALS.update(dict.fromkeys(('CLF', 'UYW'), 4))
+
+# The number of decimals of all other currencies.
+DEFAULT_DECIMALS = 2
+
+# The context amounts are added in: any rounding raises instead.
+_EXACT = Context(prec=100, traps=[Inexact, InvalidOperation])
+
+# The exponent of the minor unit of each known currency, built once.
+_QUANTUMS = dict(
+    (decimals, Decimal(1).scaleb(-decimals))
+    for decimals in set(CURRENCY_DECIMALS.values()) | set([DEFAULT_DECIMALS])
+)
+
+
+def currencyDecimals(currency):
+    '''
+    Return the number of decimals of the minor unit of a currency.
+
+    :param currency:
+        An ISO 4217 currency code. **REQUIRED**
+    '''
+
+    return CURRENCY_DECIMALS.get(currency, DEFAULT_DECIMALS)
+
+
+def toDecimal(amount):
+    '''
+    Parse an amount into a Decimal without rounding.
+
+    :param amount:
+        The amount as returned by the API. **REQUIRED**
+    :returns:
+        The Decimal amount, or None if the amount is None.
+    '''
+
+    if amount is None:
+        return None
+
+    try:
+        return Decimal(amount if isinstance(amount, six.string_types) else str(amount))
+    except InvalidOperation:
+        raise HyperwalletException('Invalid amount {}'.format(amount))
+
+
+def toMinorUnits(amount, currency):
+    '''
+    Parse an amount into an integer number of minor units of its currency,
+    e.g. 1050 for "10.50" USD and 1050 for "1050" JPY.
+
+    :param amount:
+        The amount as returned by the API. **REQUIRED**
+    :param currency:
+        The ISO 4217 currency code of the amount. **REQUIRED**
+    :returns:
+        The number of minor units, or None if the amount is None.
+    '''
+
+    if amount is None:
+        return None
+
+    return _toMinorUnits(amount, currencyDecimals(currency))
+
+
+def fromMinorUnits(units, currency):
+    '''
+    Return the Decimal amount of a number of minor units of a currency.
+
+    :param units:
+        The number of minor units. **REQUIRED**
+    :param currency:
+        The ISO 4217 currency code of the amount. **REQUIRED**
+    '''
+
+    decimals = currencyDecimals(currency)
+    return Decimal(units).scaleb(-decimals).quantize(_QUANTUMS[decimals])
+
+
+def parseMinorUnits(amounts, currencies):
+    '''
+    Parse many amounts into minor units, e.g. the amounts of a list result.
+
+    :param amounts:
+        The amounts as returned by the API. **REQUIRED**
+    :param currencies:
+        The currency of each amount. **REQUIRED**
+    :returns:
+        A list with the number of minor units of each amount (None for
+        missing amounts).
+    '''
+
+    decimalsOf = {}
+
+    units = []
+    for (amount, currency) in zip(amounts, currencies):
+        if amount is None:
+            units.append(None)
+            continue
+
+        decimals = decimalsOf.get(currency)
+        if decimals is None:
+            decimals = decimalsOf[currency] = currencyDecimals(currency)
+
+        units.append(_toMinorUnits(amount, decimals))
+
+    return units
+
+
+def sumMinorUnits(amounts, currencies):
+    '''
+    Sum many amounts exactly, per currency, skipping missing amounts. The
+    amounts are grouped by currency and added as Decimals, which is faster
+    than converting each one to minor units.
+
+    :param amounts:
+        The amounts as returned by the API. **REQUIRED**
+    :param currencies:
+        The currency of each amount. **REQUIRED**
+    :returns:
+        A dictionary with the sum in minor units of each currency.
+    '''
+
+    groups = {}
+    for (amount, currency) in zip(amounts, currencies):
+        if amount is not None:
+            groups.setdefault(currency, []).append(
+                amount if isinstance(amount, six.string_types) else str(amount)
+            )
+
+    totals = {}
+    for (currency, group) in groups.items():
+        decimals = currencyDecimals(currency)
+        try:
+            with localcontext(_EXACT):
+                units = sum(map(Decimal, group)).scaleb(decimals)
+        except (Inexact, InvalidOperation):
+            units = None
+
+        # A sum has the smallest exponent of its terms, so an amount with more
+        # decimals than the currency shows in the exponent of the total.
+        if units is None or units.as_tuple().exponent < 0:
+            totals[currency] = sum(_toMinorUnits(amount, decimals) for amount in group)
+        else:
+            totals[currency] = int(units)
+
+    return totals
+
+
+def _toMinorUnits(amount, decimals):
+    '''
+    Parse an amount into minor units given the decimals of its currency.
+    Plain decimal strings are split instead of going through Decimal.
+    '''
+
+    if isinstance(amount, six.string_types):
+        (whole, _, fraction) = amount.partition('.')
+        if len(fraction) <= decimals:
+            try:
+                return int(whole + fraction + '0' * (decimals - len(fraction)))
+            except ValueError:
+                pass
+
+    units = toDecimal(amount).scaleb(decimals)
+    if units != units.to_integral_value():
+        raise HyperwalletException('Amount {} has more decimals than its currency'.format(amount))
+
+    return int(units)
@@ -1,10 +1,15 @@
 #!/usr/bin/env python
 
+import contextlib
 import os
+import threading
 
 from .config import SERVER
 from .exceptions import HyperwalletException
 from .utils import ApiClient
+from .columnar import ColumnarResult, ModelList
+from .identity import IdentityMap
+from .interning import INTERNED_FIELDS, internRows
 
 from hyperwallet import (
     User,
@@ -41,6 +46,14 @@ class Api(object):
         Your UAT or Production API URL if applicable.
     :param encryptionData:
         Dictionary with params for encrypted requests (keys: clientPrivateKeySetLocation, hyperwalletKeySetLocation, etc).
+    :param unixSocketPath:
+        Path to the Unix domain socket of a local proxy which terminates TLS.
+    :param admissionData:
+        Dictionary with params for the admission queue (keys: maxConcurrency, maxDepth, maxQueueTime).
+    :param fieldsParam:
+        Name of the query parameter in which the server accepts the attributes
+        to return. When set, the **fields** of list and get methods are sent
+        comma-separated in it. The models keep only those attributes either way.
 
     .. note::
         **server** defaults to the Hyperwallet Sandbox URL if not provided.
@@ -52,7 +65,10 @@ class Api(object):
                  password=None,
                  programToken=None,
                  server=SERVER,
-                 encryptionData=None):
+                 encryptionData=None,
+                 unixSocketPath=None,
+                 admissionData=None,
+                 fieldsParam=None):
         '''
         Create an instance of the API interface.
         This is the main interface the user will call to interact with the API.
@@ -71,8 +87,161 @@ class Api(object):
         self.password = password
         self.programToken = programToken
         self.server = server
+        self.fieldsParam = fieldsParam
 
-        self.apiClient = ApiClient(self.username, self.password, self.server, encryptionData)
+        self.apiClient = ApiClient(
+            self.username,
+            self.password,
+            self.server,
+            encryptionData,
+            unixSocketPath,
+            admissionData
+        )
+
+        # The identity map of the scope open in each thread.
+        self.__scopes = threading.local()
+
+    @contextlib.contextmanager
+    def identityMap(self, weak=False):
+        '''
+        Open a scope in which the same model instance is returned for the
+        same model and token. Get methods return a model of the scope without
+        fetching it again, and later responses for its token, e.g. of list or
+        update calls, update it in place. Evict a model from the scope to
+        fetch it again. The scope applies to the calls made through this Api
+        by the thread which opened it, until it is closed::
+
+            with api.identityMap() as scope:
+                for payment in api.listPayments():
+                    user = api.getUser(payment.destinationToken)
+
+        :param weak:
+            Keep the models only while they are referenced elsewhere.
+        :returns:
+            The IdentityMap of the scope.
+        '''
+
+        previous = getattr(self.__scopes, 'identityMap', None)
+        identityMap = self.__scopes.identityMap = IdentityMap(weak)
+        try:
+            yield identityMap
+        finally:
+            self.__scopes.identityMap = previous
+
+    def close(self):
+        '''
+        Stop the encryption worker processes started for **processes**, if
+        any, and close the pooled connections. The Api can also be used as a
+        context manager closing it on exit::
+
+            with hyperwallet.Api(username, password, programToken, encryptionData=data) as api:
+                api.listUsers()
+        '''
+
+        self.apiClient.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __projectParams(self, params, fields):
+        '''
+        Add the attributes to return to the query parameters, if the server
+        accepts them (see **fieldsParam**).
+
+        :param params:
+            A dictionary containing query parameters.
+        :param fields:
+            The names of the attributes to return.
+        '''
+
+        if fields is None or self.fieldsParam is None:
+            return params
+
+        params = dict(params or {})
+        params[self.fieldsParam] = ','.join(fields)
+        return params
+
+    def __build(self, model, data, fields=None):
+        '''
+        Build the model of a response, through the identity map if a scope
+        is open. Projected models are not mapped, so the models of a scope
+        always have all their attributes.
+
+        :param model:
+            The model class. **REQUIRED**
+        :param data:
+            The response. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep.
+        '''
+
+        if fields is not None:
+            return model(data, fields=fields)
+
+        identityMap = getattr(self.__scopes, 'identityMap', None)
+        if identityMap is None:
+            return model(data)
+
+        return identityMap.add(model, data)
+
+    def __getModel(self, model, token, path, fields=None):
+        '''
+        Retrieve a model, unless the identity map of the open scope holds it.
+
+        :param model:
+            The model class. **REQUIRED**
+        :param token:
+            The token of the model. **REQUIRED**
+        :param path:
+            The path of the model. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep.
+        '''
+
+        identityMap = getattr(self.__scopes, 'identityMap', None)
+        if identityMap is not None:
+            instance = identityMap.get(model, token)
+            if instance is not None:
+                return instance
+
+        response = self.apiClient.doGet(path, self.__projectParams(None, fields))
+
+        return self.__build(model, response, fields)
+
+    def __buildList(self, model, rows, columnar=False, fields=None):
+        '''
+        Build the result of a list endpoint.
+
+        :param model:
+            The model class of the rows. **REQUIRED**
+        :param rows:
+            The rows of the response. **REQUIRED**
+        :param columnar:
+            Return a ColumnarResult instead of a ModelList. The values of
+            enum-like attributes of a ModelList are shared between models.
+        :param fields:
+            The names of the attributes to keep.
+        '''
+
+        if columnar:
+            return ColumnarResult(model, rows, fields)
+
+        rows = internRows(rows, [
+            field for field in INTERNED_FIELDS
+            if hasattr(model, field) and (fields is None or field in fields)
+        ])
+
+        if fields is not None:
+            return ModelList(model, [model(x, fields=fields) for x in rows], fields)
+
+        identityMap = getattr(self.__scopes, 'identityMap', None)
+        if identityMap is None:
+            return ModelList(model, [model(x) for x in rows])
+
+        return ModelList(model, [identityMap.add(model, x) for x in rows])
 
     '''
 
@@ -97,15 +266,18 @@ class Api(object):
 
         response = self.apiClient.doPost('users', data)
 
-        return User(response)
+        return self.__build(User, response)
 
     def getUser(self,
-                userToken=None):
+                userToken=None,
+                fields=None):
         '''
         Retrieve a User.
 
         :param userToken:
             A token identifying the User. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A User.
         '''
@@ -113,12 +285,13 @@ class Api(object):
         if not userToken:
             raise HyperwalletException('userToken is required')
 
-        response = self.apiClient.doGet(
-            os.path.join('users', userToken)
+        return self.__getModel(
+            User,
+            userToken,
+            os.path.join('users', userToken),
+            fields
         )
 
-        return User(response)
-
     def updateUser(self,
                    userToken=None,
                    data=None):
@@ -144,26 +317,33 @@ class Api(object):
             data
         )
 
-        return User(response)
+        return self.__build(User, response)
 
     def listUsers(self,
-                  params=None):
+                  params=None,
+                  columnar=False,
+                  fields=None):
         '''
         List Users.
 
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Users.
         '''
 
-        response = self.apiClient.doGet('users', params)
+        response = self.apiClient.doGet('users', self.__projectParams(params, fields))
 
-        return [User(x) for x in response.get('data', [])]
+        return self.__buildList(User, response.get('data', []), columnar, fields)
 
     def getUserStatusTransition(self,
                                 userToken=None,
-                                statusTransitionToken=None):
+                                statusTransitionToken=None,
+                                fields=None):
         '''
         Retrieve a User Status Transition.
 
@@ -171,6 +351,8 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param statusTransitionToken:
             A token identifying the User Status Transition. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A User Status Transition.
         '''
@@ -181,20 +363,23 @@ class Api(object):
         if not statusTransitionToken:
             raise HyperwalletException('statusTransitionToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            StatusTransition,
+            statusTransitionToken,
             os.path.join(
                 'users',
                 userToken,
                 'status-transitions',
                 statusTransitionToken
-            )
+            ),
+            fields
         )
 
-        return StatusTransition(response)
-
     def listUserStatusTransitions(self,
                                   userToken=None,
-                                  params=None):
+                                  params=None,
+                                  columnar=False,
+                                  fields=None):
         '''
         List User Status Transitions.
 
@@ -202,6 +387,10 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of User Status Transitions.
         '''
@@ -215,10 +404,10 @@ class Api(object):
                 userToken,
                 'status-transitions'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [StatusTransition(x) for x in response.get('data', [])]
+        return self.__buildList(StatusTransition, response.get('data', []), columnar, fields)
 
     '''
 
@@ -252,11 +441,12 @@ class Api(object):
             data
         )
 
-        return BankAccount(response)
+        return self.__build(BankAccount, response)
 
     def getBankAccount(self,
                        userToken=None,
-                       bankAccountToken=None):
+                       bankAccountToken=None,
+                       fields=None):
         '''
         Retrieve a Bank Account.
 
@@ -264,6 +454,8 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param bankAccountToken:
             A token identifying the Bank Account. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Bank Account.
         '''
@@ -274,17 +466,18 @@ class Api(object):
         if not bankAccountToken:
             raise HyperwalletException('bankAccountToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            BankAccount,
+            bankAccountToken,
             os.path.join(
                 'users',
                 userToken,
                 'bank-accounts',
                 bankAccountToken
-            )
+            ),
+            fields
         )
 
-        return BankAccount(response)
-
     def updateBankAccount(self,
                           userToken=None,
                           bankAccountToken=None,
@@ -321,11 +514,13 @@ class Api(object):
             data
         )
 
-        return BankAccount(response)
+        return self.__build(BankAccount, response)
 
     def listBankAccounts(self,
                          userToken=None,
-                         params=None):
+                         params=None,
+                         columnar=False,
+                         fields=None):
         '''
         List Bank Accounts.
 
@@ -333,6 +528,10 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Bank Accounts.
         '''
@@ -342,10 +541,10 @@ class Api(object):
 
         response = self.apiClient.doGet(
             os.path.join('users', userToken, 'bank-accounts'),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [BankAccount(x) for x in response.get('data', [])]
+        return self.__buildList(BankAccount, response.get('data', []), columnar, fields)
 
     def createBankAccountStatusTransition(self,
                                           userToken=None,
@@ -384,12 +583,13 @@ class Api(object):
             data
         )
 
-        return StatusTransition(response)
+        return self.__build(StatusTransition, response)
 
     def getBankAccountStatusTransition(self,
                                        userToken=None,
                                        bankAccountToken=None,
-                                       statusTransitionToken=None):
+                                       statusTransitionToken=None,
+                                       fields=None):
         '''
         Retrieve a Bank Account Status Transition.
 
@@ -399,6 +599,8 @@ class Api(object):
             A token identifying the Bank Account. **REQUIRED**
         :param statusTransitionToken:
             A token identifying the Bank Account Status Transition. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Bank Account Status Transition.
         '''
@@ -412,7 +614,9 @@ class Api(object):
         if not statusTransitionToken:
             raise HyperwalletException('statusTransitionToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            StatusTransition,
+            statusTransitionToken,
             os.path.join(
                 'users',
                 userToken,
@@ -420,15 +624,16 @@ class Api(object):
                 bankAccountToken,
                 'status-transitions',
                 statusTransitionToken
-            )
+            ),
+            fields
         )
 
-        return StatusTransition(response)
-
     def listBankAccountStatusTransitions(self,
                                          userToken=None,
                                          bankAccountToken=None,
-                                         params=None):
+                                         params=None,
+                                         columnar=False,
+                                         fields=None):
         '''
         List Bank Account Status Transitions.
 
@@ -438,6 +643,10 @@ class Api(object):
             A token identifying the Bank Account. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Bank Account Status Transitions.
         '''
@@ -456,10 +665,10 @@ class Api(object):
                 bankAccountToken,
                 'status-transitions'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [StatusTransition(x) for x in response.get('data', [])]
+        return self.__buildList(StatusTransition, response.get('data', []), columnar, fields)
 
     def deactivateBankAccount(self,
                               userToken=None,
@@ -523,11 +732,12 @@ class Api(object):
             data
         )
 
-        return BankCard(response)
+        return self.__build(BankCard, response)
 
     def getBankCard(self,
                     userToken=None,
-                    bankCardToken=None):
+                    bankCardToken=None,
+                    fields=None):
         '''
         Retrieve a Bank Card.
 
@@ -535,6 +745,8 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param bankCardToken:
             A token identifying the Bank Card. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Bank Card.
         '''
@@ -545,17 +757,18 @@ class Api(object):
         if not bankCardToken:
             raise HyperwalletException('bankCardToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            BankCard,
+            bankCardToken,
             os.path.join(
                 'users',
                 userToken,
                 'bank-cards',
                 bankCardToken
-            )
+            ),
+            fields
         )
 
-        return BankCard(response)
-
     def updateBankCard(self,
                        userToken=None,
                        bankCardToken=None,
@@ -592,11 +805,13 @@ class Api(object):
             data
         )
 
-        return BankCard(response)
+        return self.__build(BankCard, response)
 
     def listBankCards(self,
                       userToken=None,
-                      params=None):
+                      params=None,
+                      columnar=False,
+                      fields=None):
         '''
         List Bank Cards.
 
@@ -604,6 +819,10 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Bank Cards.
         '''
@@ -613,10 +832,10 @@ class Api(object):
 
         response = self.apiClient.doGet(
             os.path.join('users', userToken, 'bank-cards'),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [BankCard(x) for x in response.get('data', [])]
+        return self.__buildList(BankCard, response.get('data', []), columnar, fields)
 
     def createBankCardStatusTransition(self,
                                        userToken=None,
@@ -655,12 +874,13 @@ class Api(object):
             data
         )
 
-        return StatusTransition(response)
+        return self.__build(StatusTransition, response)
 
     def getBankCardStatusTransition(self,
                                     userToken=None,
                                     bankCardToken=None,
-                                    statusTransitionToken=None):
+                                    statusTransitionToken=None,
+                                    fields=None):
         '''
         Retrieve a Bank Card Status Transition.
 
@@ -670,6 +890,8 @@ class Api(object):
             A token identifying the Bank Card. **REQUIRED**
         :param statusTransitionToken:
             A token identifying the Bank Card Status Transition. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Bank Card Status Transition.
         '''
@@ -683,7 +905,9 @@ class Api(object):
         if not statusTransitionToken:
             raise HyperwalletException('statusTransitionToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            StatusTransition,
+            statusTransitionToken,
             os.path.join(
                 'users',
                 userToken,
@@ -691,15 +915,16 @@ class Api(object):
                 bankCardToken,
                 'status-transitions',
                 statusTransitionToken
-            )
+            ),
+            fields
         )
 
-        return StatusTransition(response)
-
     def listBankCardStatusTransitions(self,
                                       userToken=None,
                                       bankCardToken=None,
-                                      params=None):
+                                      params=None,
+                                      columnar=False,
+                                      fields=None):
         '''
         List Bank Card Status Transitions.
 
@@ -709,6 +934,10 @@ class Api(object):
             A token identifying the Bank Card. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Bank Card Status Transitions.
         '''
@@ -727,10 +956,10 @@ class Api(object):
                 bankCardToken,
                 'status-transitions'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [StatusTransition(x) for x in response.get('data', [])]
+        return self.__buildList(StatusTransition, response.get('data', []), columnar, fields)
 
     def deactivateBankCard(self,
                            userToken=None,
@@ -794,7 +1023,7 @@ class Api(object):
             data
         )
 
-        return PrepaidCard(response)
+        return self.__build(PrepaidCard, response)
 
     def updatePrepaidCard(self,
                           userToken=None,
@@ -832,11 +1061,12 @@ class Api(object):
             data
         )
 
-        return PrepaidCard(response)
+        return self.__build(PrepaidCard, response)
 
     def getPrepaidCard(self,
                        userToken=None,
-                       prepaidCardToken=None):
+                       prepaidCardToken=None,
+                       fields=None):
         '''
         Retrieve a Prepaid Card.
 
@@ -844,6 +1074,8 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param prepaidCardToken:
             A token identifying the Prepaid Card. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Prepaid Card.
         '''
@@ -854,20 +1086,23 @@ class Api(object):
         if not prepaidCardToken:
             raise HyperwalletException('prepaidCardToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            PrepaidCard,
+            prepaidCardToken,
             os.path.join(
                 'users',
                 userToken,
                 'prepaid-cards',
                 prepaidCardToken
-            )
+            ),
+            fields
         )
 
-        return PrepaidCard(response)
-
     def listPrepaidCards(self,
                          userToken=None,
-                         params=None):
+                         params=None,
+                         columnar=False,
+                         fields=None):
         '''
         List Prepaid Cards.
 
@@ -875,6 +1110,10 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Prepaid Cards.
         '''
@@ -884,10 +1123,10 @@ class Api(object):
 
         response = self.apiClient.doGet(
             os.path.join('users', userToken, 'prepaid-cards'),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [PrepaidCard(x) for x in response.get('data', [])]
+        return self.__buildList(PrepaidCard, response.get('data', []), columnar, fields)
 
     def createPrepaidCardStatusTransition(self,
                                           userToken=None,
@@ -926,12 +1165,13 @@ class Api(object):
             data
         )
 
-        return StatusTransition(response)
+        return self.__build(StatusTransition, response)
 
     def getPrepaidCardStatusTransition(self,
                                        userToken=None,
                                        prepaidCardToken=None,
-                                       statusTransitionToken=None):
+                                       statusTransitionToken=None,
+                                       fields=None):
         '''
         Retrieve a Prepaid Card Status Transition.
 
@@ -941,6 +1181,8 @@ class Api(object):
             A token identifying the Prepaid Card. **REQUIRED**
         :param statusTransitionToken:
             A token identifying the Prepaid Card Status Transition. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Prepaid Card Status Transition.
         '''
@@ -954,7 +1196,9 @@ class Api(object):
         if not statusTransitionToken:
             raise HyperwalletException('statusTransitionToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            StatusTransition,
+            statusTransitionToken,
             os.path.join(
                 'users',
                 userToken,
@@ -962,15 +1206,16 @@ class Api(object):
                 prepaidCardToken,
                 'status-transitions',
                 statusTransitionToken
-            )
+            ),
+            fields
         )
 
-        return StatusTransition(response)
-
     def listPrepaidCardStatusTransitions(self,
                                          userToken=None,
                                          prepaidCardToken=None,
-                                         params=None):
+                                         params=None,
+                                         columnar=False,
+                                         fields=None):
         '''
         List Prepaid Card Status Transitions.
 
@@ -980,6 +1225,10 @@ class Api(object):
             A token identifying the Prepaid Card. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Prepaid Card Status Transitions.
         '''
@@ -998,10 +1247,10 @@ class Api(object):
                 prepaidCardToken,
                 'status-transitions'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [StatusTransition(x) for x in response.get('data', [])]
+        return self.__buildList(StatusTransition, response.get('data', []), columnar, fields)
 
     def deactivatePrepaidCard(self,
                               userToken=None,
@@ -1215,11 +1464,12 @@ class Api(object):
             data
         )
 
-        return PaperCheck(response)
+        return self.__build(PaperCheck, response)
 
     def getPaperCheck(self,
                       userToken=None,
-                      paperCheckToken=None):
+                      paperCheckToken=None,
+                      fields=None):
         '''
         Retrieve a Paper Check.
 
@@ -1227,6 +1477,8 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param paperCheckToken:
             A token identifying the Paper Check. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Paper Check.
         '''
@@ -1237,17 +1489,18 @@ class Api(object):
         if not paperCheckToken:
             raise HyperwalletException('paperCheckToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            PaperCheck,
+            paperCheckToken,
             os.path.join(
                 'users',
                 userToken,
                 'paper-checks',
                 paperCheckToken
-            )
+            ),
+            fields
         )
 
-        return PaperCheck(response)
-
     def updatePaperCheck(self,
                          userToken=None,
                          paperCheckToken=None,
@@ -1284,11 +1537,13 @@ class Api(object):
             data
         )
 
-        return PaperCheck(response)
+        return self.__build(PaperCheck, response)
 
     def listPaperChecks(self,
                         userToken=None,
-                        params=None):
+                        params=None,
+                        columnar=False,
+                        fields=None):
         '''
         List Paper Checks.
 
@@ -1296,6 +1551,10 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Paper Checks.
         '''
@@ -1305,10 +1564,10 @@ class Api(object):
 
         response = self.apiClient.doGet(
             os.path.join('users', userToken, 'paper-checks'),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [PaperCheck(x) for x in response.get('data', [])]
+        return self.__buildList(PaperCheck, response.get('data', []), columnar, fields)
 
     def createPaperCheckStatusTransition(self,
                                          userToken=None,
@@ -1347,12 +1606,13 @@ class Api(object):
             data
         )
 
-        return StatusTransition(response)
+        return self.__build(StatusTransition, response)
 
     def getPaperCheckStatusTransition(self,
                                       userToken=None,
                                       paperCheckToken=None,
-                                      statusTransitionToken=None):
+                                      statusTransitionToken=None,
+                                      fields=None):
         '''
         Retrieve a Paper Check Status Transition.
 
@@ -1362,6 +1622,8 @@ class Api(object):
             A token identifying the Paper Check. **REQUIRED**
         :param statusTransitionToken:
             A token identifying the Paper Check Status Transition. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Paper Check Status Transition.
         '''
@@ -1375,7 +1637,9 @@ class Api(object):
         if not statusTransitionToken:
             raise HyperwalletException('statusTransitionToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            StatusTransition,
+            statusTransitionToken,
             os.path.join(
                 'users',
                 userToken,
@@ -1383,15 +1647,16 @@ class Api(object):
                 paperCheckToken,
                 'status-transitions',
                 statusTransitionToken
-            )
+            ),
+            fields
         )
 
-        return StatusTransition(response)
-
     def listPaperCheckStatusTransitions(self,
                                         userToken=None,
                                         paperCheckToken=None,
-                                        params=None):
+                                        params=None,
+                                        columnar=False,
+                                        fields=None):
         '''
         List Paper Check Status Transitions.
 
@@ -1401,6 +1666,10 @@ class Api(object):
             A token identifying the Paper Check. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Paper Check Status Transitions.
         '''
@@ -1419,10 +1688,10 @@ class Api(object):
                 paperCheckToken,
                 'status-transitions'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [StatusTransition(x) for x in response.get('data', [])]
+        return self.__buildList(StatusTransition, response.get('data', []), columnar, fields)
 
     def deactivatePaperCheck(self,
                              userToken=None,
@@ -1488,14 +1757,17 @@ class Api(object):
             data
         )
 
-        return Transfer(response)
+        return self.__build(Transfer, response)
 
     def getTransfer(self,
-                    transferToken=None):
+                    transferToken=None,
+                    fields=None):
         '''
         Retrieve a Transfer.
         :param transferToken:
             A token identifying the Transfer. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Transfer.
         '''
@@ -1503,31 +1775,38 @@ class Api(object):
         if not transferToken:
             raise HyperwalletException('transferToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            Transfer,
+            transferToken,
             os.path.join(
                 'transfers',
                 transferToken
-            )
+            ),
+            fields
         )
 
-        return Transfer(response)
-
     def listTransfers(self,
-                      params=None):
+                      params=None,
+                      columnar=False,
+                      fields=None):
         '''
         List Transfers.
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Transfers.
         '''
 
         response = self.apiClient.doGet(
             os.path.join('transfers'),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [Transfer(x) for x in response.get('data', [])]
+        return self.__buildList(Transfer, response.get('data', []), columnar, fields)
 
     def createTransferStatusTransition(self,
                                        transferToken=None,
@@ -1557,7 +1836,7 @@ class Api(object):
             data
         )
 
-        return StatusTransition(response)
+        return self.__build(StatusTransition, response)
 
     '''
 
@@ -1598,17 +1877,20 @@ class Api(object):
             data
         )
 
-        return PayPalAccount(response)
+        return self.__build(PayPalAccount, response)
 
     def getPayPalAccount(self,
                          userToken=None,
-                         payPalAccountToken=None):
+                         payPalAccountToken=None,
+                         fields=None):
         '''
         Retrieve a PayPal Account.
         :param userToken:
             A token identifying the User. **REQUIRED**
         :param payPalAccountToken:
             A token identifying the PayPal Account. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A PayPal Account.
         '''
@@ -1619,26 +1901,33 @@ class Api(object):
         if not payPalAccountToken:
             raise HyperwalletException('payPalAccountToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            PayPalAccount,
+            payPalAccountToken,
             os.path.join(
                 'users',
                 userToken,
                 'paypal-accounts',
                 payPalAccountToken
-            )
+            ),
+            fields
         )
 
-        return PayPalAccount(response)
-
     def listPayPalAccounts(self,
                            userToken=None,
-                           params=None):
+                           params=None,
+                           columnar=False,
+                           fields=None):
         '''
         List PayPal Accounts.
         :param userToken:
             A token identifying the User. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of PayPal Accounts.
         '''
@@ -1648,10 +1937,10 @@ class Api(object):
 
         response = self.apiClient.doGet(
             os.path.join('users', userToken, 'paypal-accounts'),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [PayPalAccount(x) for x in response.get('data', [])]
+        return self.__buildList(PayPalAccount, response.get('data', []), columnar, fields)
 
     '''
 
@@ -1677,7 +1966,7 @@ class Api(object):
             None
         )
 
-        return AuthenticationToken(response)
+        return self.__build(AuthenticationToken, response)
 
     '''
 
@@ -1702,15 +1991,46 @@ class Api(object):
 
         response = self.apiClient.doPost('payments', data)
 
-        return Payment(response)
+        return self.__build(Payment, response)
+
+    def createPayments(self,
+                       dataList=None,
+                       concurrency=1):
+        '''
+        Create many Payments in a pipeline, see ApiClient.doPipeline().
+
+        :param dataList:
+            A list of dictionaries containing Payment information. **REQUIRED**
+        :param concurrency:
+            The number of requests in flight at once.
+        :returns:
+            A list in input order holding for each Payment either the created
+            Payment or the exception its creation failed with.
+        '''
+
+        if not dataList:
+            raise HyperwalletException('dataList is required')
+
+        responses = self.apiClient.doPipeline(
+            [{'method': 'POST', 'url': 'payments', 'data': data} for data in dataList],
+            concurrency
+        )
+
+        return [
+            response if isinstance(response, Exception) else self.__build(Payment, response)
+            for response in responses
+        ]
 
     def getPayment(self,
-                   paymentToken=None):
+                   paymentToken=None,
+                   fields=None):
         '''
         Retrieve a Payment.
 
         :param paymentToken:
             A token identifying the Payment. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Payment.
         '''
@@ -1718,30 +2038,38 @@ class Api(object):
         if not paymentToken:
             raise HyperwalletException('paymentToken is required')
 
-        response = self.apiClient.doGet(
-            os.path.join('payments', paymentToken)
+        return self.__getModel(
+            Payment,
+            paymentToken,
+            os.path.join('payments', paymentToken),
+            fields
         )
 
-        return Payment(response)
-
     def listPayments(self,
-                     params=None):
+                     params=None,
+                     columnar=False,
+                     fields=None):
         '''
         List Payments.
 
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Payments.
         '''
 
-        response = self.apiClient.doGet('payments', params)
+        response = self.apiClient.doGet('payments', self.__projectParams(params, fields))
 
-        return [Payment(x) for x in response.get('data', [])]
+        return self.__buildList(Payment, response.get('data', []), columnar, fields)
 
     def getPaymentStatusTransition(self,
                                    paymentToken=None,
-                                   statusTransitionToken=None):
+                                   statusTransitionToken=None,
+                                   fields=None):
         '''
         Retrieve a Payment Status Transition.
 
@@ -1749,6 +2077,8 @@ class Api(object):
             A token identifying the Payment. **REQUIRED**
         :param statusTransitionToken:
             A token identifying the Payment Status Transition. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Payment Status Transition.
         '''
@@ -1759,20 +2089,23 @@ class Api(object):
         if not statusTransitionToken:
             raise HyperwalletException('statusTransitionToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            StatusTransition,
+            statusTransitionToken,
             os.path.join(
                 'payments',
                 paymentToken,
                 'status-transitions',
                 statusTransitionToken
-            )
+            ),
+            fields
         )
 
-        return StatusTransition(response)
-
     def listPaymentStatusTransitions(self,
                                      paymentToken=None,
-                                     params=None):
+                                     params=None,
+                                     columnar=False,
+                                     fields=None):
         '''
         List Payment Status Transitions.
 
@@ -1780,6 +2113,10 @@ class Api(object):
             A token identifying the Payment. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Payment Status Transitions.
         '''
@@ -1793,10 +2130,10 @@ class Api(object):
                 paymentToken,
                 'status-transitions'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [StatusTransition(x) for x in response.get('data', [])]
+        return self.__buildList(StatusTransition, response.get('data', []), columnar, fields)
 
     def createPaymentStatusTransition(self,
                                       paymentToken=None,
@@ -1827,7 +2164,7 @@ class Api(object):
             data
         )
 
-        return StatusTransition(response)
+        return self.__build(StatusTransition, response)
 
     '''
 
@@ -1838,7 +2175,9 @@ class Api(object):
 
     def listBalancesForUser(self,
                             userToken=None,
-                            params=None):
+                            params=None,
+                            columnar=False,
+                            fields=None):
         '''
         List User Balances.
 
@@ -1846,6 +2185,10 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Balances.
         '''
@@ -1855,15 +2198,17 @@ class Api(object):
 
         response = self.apiClient.doGet(
             os.path.join('users', userToken, 'balances'),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [Balance(x) for x in response.get('data', [])]
+        return self.__buildList(Balance, response.get('data', []), columnar, fields)
 
     def listBalancesForPrepaidCard(self,
                                    userToken=None,
                                    prepaidCardToken=None,
-                                   params=None):
+                                   params=None,
+                                   columnar=False,
+                                   fields=None):
         '''
         List Prepaid Card Balances.
 
@@ -1873,6 +2218,10 @@ class Api(object):
             A token identifying the Prepaid Card. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Balances.
         '''
@@ -1891,15 +2240,17 @@ class Api(object):
                 prepaidCardToken,
                 'balances'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [Balance(x) for x in response.get('data', [])]
+        return self.__buildList(Balance, response.get('data', []), columnar, fields)
 
     def listBalancesForAccount(self,
                                programToken=None,
                                accountToken=None,
-                               params=None):
+                               params=None,
+                               columnar=False,
+                               fields=None):
         '''
         List Account Balances.
 
@@ -1909,6 +2260,10 @@ class Api(object):
             A token identifying the Account. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Balances.
         '''
@@ -1927,10 +2282,10 @@ class Api(object):
                 accountToken,
                 'balances'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [Balance(x) for x in response.get('data', [])]
+        return self.__buildList(Balance, response.get('data', []), columnar, fields)
 
     '''
 
@@ -1941,7 +2296,9 @@ class Api(object):
 
     def listReceiptsForUser(self,
                             userToken=None,
-                            params=None):
+                            params=None,
+                            columnar=False,
+                            fields=None):
         '''
         List User Receipts.
 
@@ -1949,6 +2306,10 @@ class Api(object):
             A token identifying the User. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Receipts.
         '''
@@ -1958,15 +2319,17 @@ class Api(object):
 
         response = self.apiClient.doGet(
             os.path.join('users', userToken, 'receipts'),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [Receipt(x) for x in response.get('data', [])]
+        return self.__buildList(Receipt, response.get('data', []), columnar, fields)
 
     def listReceiptsForPrepaidCard(self,
                                    userToken=None,
                                    prepaidCardToken=None,
-                                   params=None):
+                                   params=None,
+                                   columnar=False,
+                                   fields=None):
         '''
         List Prepaid Card Receipts.
 
@@ -1976,6 +2339,10 @@ class Api(object):
             A token identifying the Prepaid Card. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Receipts.
         '''
@@ -1994,15 +2361,17 @@ class Api(object):
                 prepaidCardToken,
                 'receipts'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [Receipt(x) for x in response.get('data', [])]
+        return self.__buildList(Receipt, response.get('data', []), columnar, fields)
 
     def listReceiptsForAccount(self,
                                programToken=None,
                                accountToken=None,
-                               params=None):
+                               params=None,
+                               columnar=False,
+                               fields=None):
         '''
         List Account Receipts.
 
@@ -2012,6 +2381,10 @@ class Api(object):
             A token identifying the Account. **REQUIRED**
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Receipts.
         '''
@@ -2030,10 +2403,10 @@ class Api(object):
                 accountToken,
                 'receipts'
             ),
-            params
+            self.__projectParams(params, fields)
         )
 
-        return [Receipt(x) for x in response.get('data', [])]
+        return self.__buildList(Receipt, response.get('data', []), columnar, fields)
 
     '''
 
@@ -2043,12 +2416,15 @@ class Api(object):
     '''
 
     def getProgram(self,
-                   programToken=None):
+                   programToken=None,
+                   fields=None):
         '''
         Retrieve a Program.
 
         :param programToken:
             A token identifying the Program. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Program.
         '''
@@ -2056,12 +2432,13 @@ class Api(object):
         if not programToken:
             raise HyperwalletException('programToken is required')
 
-        response = self.apiClient.doGet(
-            os.path.join('programs', programToken)
+        return self.__getModel(
+            Program,
+            programToken,
+            os.path.join('programs', programToken),
+            fields
         )
 
-        return Program(response)
-
     '''
 
     Accounts
@@ -2071,7 +2448,8 @@ class Api(object):
 
     def getAccount(self,
                    programToken=None,
-                   accountToken=None):
+                   accountToken=None,
+                   fields=None):
         '''
         Retrieve an Account.
 
@@ -2079,6 +2457,8 @@ class Api(object):
             A token identifying the Program. **REQUIRED**
         :param accountToken:
             A token identifying the Account. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An Account.
         '''
@@ -2089,17 +2469,18 @@ class Api(object):
         if not accountToken:
             raise HyperwalletException('accountToken is required')
 
-        response = self.apiClient.doGet(
+        return self.__getModel(
+            Account,
+            accountToken,
             os.path.join(
                 'programs',
                 programToken,
                 'accounts',
                 accountToken
-            )
+            ),
+            fields
         )
 
-        return Account(response)
-
     '''
 
     Transfer Methods
@@ -2152,9 +2533,9 @@ class Api(object):
         transfer_method_type = response.get('type')
 
         if transfer_method_type in transfer_method_types:
-            return transfer_method_types[transfer_method_type](response)
+            return self.__build(transfer_method_types[transfer_method_type], response)
 
-        return TransferMethod(response)
+        return self.__build(TransferMethod, response)
 
     def getTransferMethodConfiguration(self,
                                        userToken=None,
@@ -2205,7 +2586,7 @@ class Api(object):
             }
         )
 
-        return TransferMethodConfiguration(response)
+        return self.__build(TransferMethodConfiguration, response)
 
     def listTransferMethodConfigurations(self,
                                          userToken=None,
@@ -2260,12 +2641,15 @@ class Api(object):
     '''
 
     def getWebhookNotification(self,
-                               webhookToken=None):
+                               webhookToken=None,
+                               fields=None):
         '''
         Retrieve a Webhook Notification.
 
         :param webhookToken:
             A token identifying the Webhook. **REQUIRED**
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             A Webhook.
         '''
@@ -2273,23 +2657,30 @@ class Api(object):
         if not webhookToken:
             raise HyperwalletException('webhookToken is required')
 
-        response = self.apiClient.doGet(
-            os.path.join('webhook-notifications', webhookToken)
+        return self.__getModel(
+            Webhook,
+            webhookToken,
+            os.path.join('webhook-notifications', webhookToken),
+            fields
         )
 
-        return Webhook(response)
-
     def listWebhookNotifications(self,
-                                 params=None):
+                                 params=None,
+                                 columnar=False,
+                                 fields=None):
         '''
         List Webhook Notifications.
 
         :param params:
             A dictionary containing query parameters.
+        :param columnar:
+            Return the result as a ColumnarResult instead of a list.
+        :param fields:
+            The names of the attributes to keep, see **fieldsParam**.
         :returns:
             An array of Webhooks.
         '''
 
-        response = self.apiClient.doGet('webhook-notifications', params)
+        response = self.apiClient.doGet('webhook-notifications', self.__projectParams(params, fields))
 
-        return [Webhook(x) for x in response.get('data', [])]
+        return self.__buildList(Webhook, response.get('data', []), columnar, fields)
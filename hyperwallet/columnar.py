@@ -0,0 +1,535 @@
+#!/usr/bin/env python
+
+import array
+
+from hyperwallet import amounts
+from hyperwallet.exceptions import HyperwalletException
+
+# Fields with few distinct values, kept as codes into a list of categories,
+# besides the currencies of the amounts of a model.
+CATEGORICAL_FIELDS = ('currency', 'entry', 'status', 'type')
+
+# The largest number of minor units whose float, scaled and rounded, is
+# always the exact integer.
+FLOAT_UNITS = 2 ** 50
+
+# The characters of amounts written the way AmountColumn rebuilds them.
+_PLAIN = '0123456789.-'
+
+
+def categoricalFields(model):
+    '''
+    Return the names of the attributes of a model with few distinct values:
+    CATEGORICAL_FIELDS and the currencies of its amounts.
+
+    :param model:
+        The model class. **REQUIRED**
+    '''
+
+    return frozenset(CATEGORICAL_FIELDS).union(model.amountCurrencies.values())
+
+
+def _currencyField(model, field):
+    '''
+    Return the name of the currency attribute of an amount attribute.
+    '''
+
+    currencyField = model.amountCurrencies.get(field)
+    if currencyField is None:
+        raise HyperwalletException('{} is not an amount of {}'.format(field, model.__name__))
+
+    return currencyField
+
+
+def _scalesExactly(column, indices, decimals):
+    '''
+    Check that the amounts at the given rows of an AmountColumn turn into
+    exact integers when their floats are scaled by their decimals: none of
+    them is kept as a string and none is beyond FLOAT_UNITS minor units.
+    '''
+
+    if column.exact and any(i in column.exact for i in indices):
+        return False
+
+    values = [column.values[i] for i in indices]
+    return max(max(values), -min(values)) * 10.0 ** decimals < FLOAT_UNITS
+
+
+class AmountColumn(object):
+    '''
+    A column of amounts parsed into floats. The number of decimals of each
+    amount is kept as well, so the original string can be rebuilt. Amounts
+    which a float can't hold exactly, e.g. with more than 15 significant
+    digits, are also kept as strings.
+
+    :param values:
+        The amounts as returned by the API (strings, numbers or None). Empty
+        strings are missing amounts.
+    :param field:
+        The name of the amount attribute, for error messages.
+    '''
+
+    # Decimals of a missing amount and of an amount which was a number.
+    MISSING = -1
+    NUMBER = -2
+
+    __slots__ = ('values', 'decimals', 'exact')
+
+    def __init__(self, values=(), field='amount'):
+        '''
+        Parse the amounts of a column.
+        '''
+
+        self.values = array.array('d')
+        self.decimals = array.array('b')
+        self.exact = {}
+
+        for value in values:
+            self.append(value, field)
+
+    def append(self, value, field='amount'):
+        '''
+        Parse and append one amount.
+        '''
+
+        if value is None or value == '':
+            self.values.append(float('nan'))
+            self.decimals.append(self.MISSING)
+        elif isinstance(value, (int, float)):
+            self.values.append(float(value))
+            self.decimals.append(self.NUMBER)
+        else:
+            try:
+                number = float(value)
+            except ValueError:
+                raise HyperwalletException('Invalid {} {}'.format(field, value))
+            decimals = len(value) - value.index('.') - 1 if '.' in value else 0
+            # Only long or unusually written amounts may not be rebuilt from
+            # their float, so only those are checked.
+            unusual = len(value) > 15 or value.strip(_PLAIN) or value[0] in '.0-' or value[-1] == '.'
+            if unusual and '%.*f' % (decimals, number) != value:
+                self.exact[len(self.values)] = value
+            self.values.append(number)
+            self.decimals.append(decimals)
+
+    def take(self, indices):
+        '''
+        Return a new column holding the rows at the given indices.
+        '''
+
+        column = AmountColumn()
+        column.values = array.array('d', [self.values[i] for i in indices])
+        column.decimals = array.array('b', [self.decimals[i] for i in indices])
+        if self.exact:
+            column.exact = dict(
+                (index, self.exact[i])
+                for (index, i) in enumerate(indices)
+                if i in self.exact
+            )
+        return column
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        '''
+        Return the amount at the given row as returned by the API.
+        '''
+
+        decimals = self.decimals[index]
+        if decimals == self.MISSING:
+            return None
+        if decimals == self.NUMBER:
+            return self.values[index]
+        if self.exact:
+            value = self.exact.get(index % len(self.values))
+            if value is not None:
+                return value
+        return '%.*f' % (decimals, self.values[index])
+
+
+class CategoricalColumn(object):
+    '''
+    A column of values with few distinct values, stored as integer codes
+    into a list of categories. Every distinct value is stored once.
+
+    :param values:
+        The values of the column.
+    '''
+
+    __slots__ = ('categories', 'codes', '_lookup')
+
+    def __init__(self, values=()):
+        '''
+        Encode the values of a column.
+        '''
+
+        self.categories = []
+        self.codes = array.array('i')
+        self._lookup = {}
+
+        for value in values:
+            self.append(value)
+
+    def append(self, value):
+        '''
+        Encode and append one value.
+        '''
+
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def code(self, value):
+        '''
+        Return the code of a value, or -1 if it doesn't occur in the column.
+        '''
+
+        return self._lookup.get(value, -1)
+
+    def take(self, indices):
+        '''
+        Return a new column holding the rows at the given indices. The new
+        column shares the categories of this one.
+        '''
+
+        column = CategoricalColumn()
+        column.categories = self.categories
+        column._lookup = self._lookup
+        column.codes = array.array('i', [self.codes[i] for i in indices])
+        return column
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        return self.categories[self.codes[index]]
+
+
+class ColumnarResult(object):
+    '''
+    A list result stored as one column per model attribute instead of one
+    model per row. Amounts (the ``amountCurrencies`` of the model) are parsed
+    into arrays of floats and their currencies, entry, status and type are
+    stored as categorical columns, so summing and filtering large results
+    doesn't touch Python objects per row. Rows are turned into models only
+    when they are accessed.
+
+    Attributes which the model doesn't declare are not kept.
+
+    :param model:
+        The model class of the rows. **REQUIRED**
+    :param rows:
+        The rows of the result as returned by the API. **REQUIRED**
+    :param fields:
+        The names of the attributes to keep.
+    '''
+
+    def __init__(self, model, rows, fields=None):
+        '''
+        Build the columns of a list result.
+        '''
+
+        self.model = model
+        self.fields = [
+            param for (param, default) in model._fields
+            if fields is None or param in fields
+        ]
+        self.columns = {}
+
+        categorical = categoricalFields(model)
+
+        rows = list(rows)
+        for field in self.fields:
+            values = [row.get(field) for row in rows]
+            if field in model.amountCurrencies:
+                self.columns[field] = AmountColumn(values, field)
+            elif field in categorical:
+                self.columns[field] = CategoricalColumn(values)
+            else:
+                self.columns[field] = values
+
+        self.__length = len(rows)
+
+    def column(self, field):
+        '''
+        Return the values of a column: an array of floats for amounts, the
+        CategoricalColumn for categorical fields and a list otherwise.
+
+        :param field:
+            The name of the model attribute. **REQUIRED**
+        '''
+
+        column = self.columns[field]
+        return column.values if isinstance(column, AmountColumn) else column
+
+    def row(self, index):
+        '''
+        Return the attributes of a row as a dictionary, leaving out missing
+        values.
+
+        :param index:
+            The index of the row. **REQUIRED**
+        '''
+
+        data = {}
+        for (field, column) in self.columns.items():
+            value = column[index]
+            if value is not None:
+                data[field] = value
+
+        return data
+
+    def sum(self, field, by=None):
+        '''
+        Sum an amount column, skipping missing amounts.
+
+        :param field:
+            The name of the amount attribute, e.g. ``amount``. **REQUIRED**
+        :param by:
+            The name of a categorical attribute to group the sums by, e.g.
+            ``currency``.
+        :returns:
+            The sum, or a dictionary with the sum of each category if **by**
+            is given.
+        '''
+
+        column = self.columns[field]
+        if not isinstance(column, AmountColumn):
+            raise ValueError('{} is not an amount column'.format(field))
+        values = column.values
+
+        if by is None:
+            return sum(value for value in values if value == value)
+
+        column = self.columns[by]
+        if not isinstance(column, CategoricalColumn):
+            raise ValueError('{} is not a categorical column'.format(by))
+        totals = [0.0] * len(column.categories)
+        for (code, value) in zip(column.codes, values):
+            if value == value:
+                totals[code] += value
+
+        return dict(
+            (column.categories[code], totals[code])
+            for code in set(column.codes)
+        )
+
+    def sumMinorUnits(self, field='amount'):
+        '''
+        Sum an amount attribute exactly, per currency, skipping missing
+        amounts. The parsed amounts are turned into integer minor units using
+        the decimals they were returned with. Groups of amounts too large
+        for their floats to be exact are summed from their strings.
+
+        :param field:
+            The name of the amount attribute.
+        :returns:
+            A dictionary with the sum in minor units of each currency.
+        '''
+
+        currencies = self.columns[_currencyField(self.model, field)]
+        column = self.columns[field]
+        if not isinstance(column, AmountColumn):
+            return amounts.sumMinorUnits(column, currencies)
+
+        if isinstance(currencies, CategoricalColumn):
+            (keys, categories) = (currencies.codes, currencies.categories)
+        else:
+            (keys, categories) = (currencies, None)
+
+        # Group the amounts by currency and by the decimals they had, so each
+        # group is scaled to integers in one pass.
+        groups = {}
+        for (index, group) in enumerate(zip(keys, column.decimals)):
+            groups.setdefault(group, []).append(index)
+
+        totals = {}
+        for ((key, decimals), indices) in groups.items():
+            if decimals == AmountColumn.MISSING:
+                continue
+
+            currency = key if categories is None else categories[key]
+            currencyDecimals = amounts.currencyDecimals(currency)
+
+            if 0 <= decimals <= currencyDecimals and _scalesExactly(column, indices, decimals):
+                scale = 10.0 ** decimals
+                values = column.values
+                units = sum(int(round(values[i] * scale)) for i in indices) * 10 ** (currencyDecimals - decimals)
+            else:
+                units = sum(amounts.toMinorUnits(column[i], currency) for i in indices)
+
+            totals[currency] = totals.get(currency, 0) + units
+
+        return totals
+
+    def filter(self, **conditions):
+        '''
+        Return the rows whose attributes equal the given values, e.g.
+        ``filter(currency='USD', entry='CREDIT')``. Categorical attributes
+        are compared by their codes.
+
+        :returns:
+            A ColumnarResult with the matching rows.
+        '''
+
+        indices = None
+        for (field, value) in conditions.items():
+            column = self.columns[field]
+            if isinstance(column, CategoricalColumn):
+                (column, value) = (column.codes, column.code(value))
+
+            if indices is None:
+                indices = [i for (i, item) in enumerate(column) if item == value]
+            else:
+                indices = [i for i in indices if column[i] == value]
+
+        return self.take(range(self.__length) if indices is None else indices)
+
+    def take(self, indices):
+        '''
+        Return a ColumnarResult with the rows at the given indices.
+        '''
+
+        indices = list(indices)
+
+        result = ColumnarResult(self.model, [], self.fields)
+        result.columns = dict(
+            (field, [column[i] for i in indices] if isinstance(column, list) else column.take(indices))
+            for (field, column) in self.columns.items()
+        )
+        result.__length = len(indices)
+        return result
+
+    def toNumpy(self):
+        '''
+        Return a dictionary with a NumPy array per attribute, see
+        hyperwallet.export.toNumpy(). Requires numpy.
+        '''
+
+        from hyperwallet.export import toNumpy
+
+        return toNumpy(self.model, self.fields, self.columns)
+
+    def toDataFrame(self):
+        '''
+        Return a pandas DataFrame with a column per attribute, see
+        hyperwallet.export.toDataFrame(). Requires pandas.
+        '''
+
+        from hyperwallet.export import toDataFrame
+
+        return toDataFrame(self.model, self.fields, self.columns)
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, index):
+        '''
+        Return the model of a row, or a ColumnarResult with the rows of a
+        slice.
+        '''
+
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(self.__length)))
+
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError('ColumnarResult index out of range')
+
+        return self.model(self.row(index))
+
+    def __iter__(self):
+        for index in range(self.__length):
+            yield self.model(self.row(index))
+
+    def __repr__(self):
+        return "ColumnarResult({model}, {length})".format(
+            model=self.model.__name__,
+            length=self.__length
+        )
+
+
+class ModelList(list):
+    '''
+    The list of models returned by the list endpoints, which can be exported
+    to NumPy arrays or a pandas DataFrame.
+
+    :param model:
+        The model class of the rows. **REQUIRED**
+    :param models:
+        The models of the list.
+    :param fields:
+        The names of the attributes the models were projected on.
+    '''
+
+    def __init__(self, model, models=(), fields=None):
+        '''
+        Create a list of models.
+        '''
+
+        super(ModelList, self).__init__(models)
+        self.model = model
+        self.projection = fields
+
+    @property
+    def fields(self):
+        '''
+        The names of the attributes of the models.
+        '''
+
+        return [
+            param for (param, default) in self.model._fields
+            if self.projection is None or param in self.projection
+        ]
+
+    def columns(self):
+        '''
+        Return a dictionary with the values of each attribute as a list.
+        '''
+
+        return dict(
+            (field, [getattr(model, field) for model in self])
+            for field in self.fields
+        )
+
+    def sumMinorUnits(self, field='amount'):
+        '''
+        Sum an amount attribute exactly, per currency, skipping missing
+        amounts, see hyperwallet.amounts.sumMinorUnits().
+
+        :param field:
+            The name of the amount attribute.
+        :returns:
+            A dictionary with the sum in minor units of each currency.
+        '''
+
+        currencyField = _currencyField(self.model, field)
+
+        return amounts.sumMinorUnits(
+            [getattr(model, field) for model in self],
+            [getattr(model, currencyField) for model in self]
+        )
+
+    def toNumpy(self):
+        '''
+        Return a dictionary with a NumPy array per attribute, see
+        hyperwallet.export.toNumpy(). Requires numpy.
+        '''
+
+        from hyperwallet.export import toNumpy
+
+        return toNumpy(self.model, self.fields, self.columns())
+
+    def toDataFrame(self):
+        '''
+        Return a pandas DataFrame with a column per attribute, see
+        hyperwallet.export.toDataFrame(). Requires pandas.
+        '''
+
+        from hyperwallet.export import toDataFrame
+
+        return toDataFrame(self.model, self.fields, self.columns())
@@ -19,3 +19,10 @@ class HyperwalletAPIException(Exception):
     @property
     def message(self):
         return self.__dict__.get('message', None) or getattr(self, 'args')[0]
+
+
+class HyperwalletOverloadException(HyperwalletAPIException):
+    '''
+    An Exception raised when a request is rejected by the admission queue
+    before it is sent to the API.
+    '''
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+import importlib
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.columnar import AmountColumn, CategoricalColumn, categoricalFields
+from hyperwallet.timestamps import TIMESTAMP_FIELDS
+
+
+def _require(module):
+    '''
+    Import an optional dependency of the exports.
+
+    :param module:
+        The name of the module. **REQUIRED**
+    '''
+
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise HyperwalletException(
+            '{module} is required for this export, install it with: pip install {module}'.format(module=module)
+        )
+
+
+def _objectArray(np, values):
+    '''
+    Build a one-dimensional object array, also for values which are lists.
+    '''
+
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _parseColumn(np, values, missing, dtype):
+    '''
+    Parse a column of strings into the given dtype in one pass over the
+    array, replacing missing and empty values first.
+    '''
+
+    strings = _objectArray(np, values)
+    strings[np.equal(strings, None) | np.equal(strings, '')] = missing
+    return strings.astype(dtype)
+
+
+def toNumpy(model, fields, columns):
+    '''
+    Convert the columns of a list result into NumPy arrays. Amounts (the
+    ``amountCurrencies`` of the model) become float64 with NaN for missing
+    amounts, timestamps become datetime64[s] with NaT for missing timestamps
+    and other fields become object arrays.
+
+    :param model:
+        The model class of the rows. **REQUIRED**
+    :param fields:
+        The names of the fields in order. **REQUIRED**
+    :param columns:
+        The values of each field, as lists or columns of a ColumnarResult. **REQUIRED**
+    :returns:
+        A dictionary with the array of each field.
+    '''
+
+    np = _require('numpy')
+
+    arrays = {}
+    for field in fields:
+        column = columns[field]
+        if isinstance(column, AmountColumn):
+            arrays[field] = np.array(column.values, dtype=np.float64)
+        elif isinstance(column, CategoricalColumn):
+            arrays[field] = _objectArray(np, column.categories)[np.array(column.codes, dtype=np.intp)]
+        elif field in model.amountCurrencies:
+            arrays[field] = _parseColumn(np, column, 'nan', np.float64)
+        elif field in TIMESTAMP_FIELDS:
+            arrays[field] = _parseColumn(np, column, 'NaT', 'datetime64[s]')
+        else:
+            arrays[field] = _objectArray(np, column)
+
+    return arrays
+
+
+def toDataFrame(model, fields, columns):
+    '''
+    Convert the columns of a list result into a pandas DataFrame with one
+    column per field. Amounts are float64, timestamps datetime64 and
+    currencies, entry, status and type are categorical.
+
+    :param model:
+        The model class of the rows. **REQUIRED**
+    :param fields:
+        The names of the fields in order. **REQUIRED**
+    :param columns:
+        The values of each field, as lists or columns of a ColumnarResult. **REQUIRED**
+    :returns:
+        A DataFrame.
+    '''
+
+    pd = _require('pandas')
+    np = _require('numpy')
+
+    categorical = categoricalFields(model)
+    arrays = toNumpy(
+        model,
+        [field for field in fields if field not in categorical],
+        columns
+    )
+
+    for field in fields:
+        column = columns[field]
+        if isinstance(column, CategoricalColumn):
+            # Missing values have no category in pandas.
+            categories = [category for category in column.categories if category is not None]
+            codes = np.array([categories.index(c) if c is not None else -1 for c in column.categories], dtype=np.intp)
+            arrays[field] = pd.Categorical.from_codes(codes[np.array(column.codes, dtype=np.intp)], categories)
+        elif field in categorical:
+            arrays[field] = pd.Categorical(column)
+
+    return pd.DataFrame(arrays, columns=fields)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+import weakref
+
+
+class IdentityMap(object):
+    '''
+    The models returned by an Api within a scope, by model class and token,
+    see Api.identityMap(). A response for a token which is already mapped
+    updates the mapped model in place instead of building another one.
+
+    :param weak:
+        Keep the models only while they are referenced elsewhere, instead of
+        until the end of the scope.
+    '''
+
+    def __init__(self, weak=False):
+        '''
+        Create an empty identity map.
+        '''
+
+        self.models = weakref.WeakValueDictionary() if weak else {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model, token):
+        '''
+        Return the mapped model of a token, or None if it is not mapped.
+
+        :param model:
+            The model class. **REQUIRED**
+        :param token:
+            The token of the model. **REQUIRED**
+        '''
+
+        instance = self.models.get((model, token))
+        if instance is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return instance
+
+    def add(self, model, data):
+        '''
+        Return the model of a response: the mapped model of its token,
+        refreshed with the response, or a new model which is mapped. Responses
+        without a token are not mapped.
+
+        :param model:
+            The model class. **REQUIRED**
+        :param data:
+            The response. **REQUIRED**
+        '''
+
+        token = data.get('token') if isinstance(data, dict) else None
+        if token is None:
+            return model(data)
+
+        key = (model, token)
+        instance = self.models.get(key)
+        if instance is None:
+            instance = self.models[key] = model(data)
+        else:
+            instance.__init__(data, instance._raw_json is not None)
+
+        return instance
+
+    def evict(self, instance):
+        '''
+        Remove a model from the map, so it is fetched again by the next get.
+
+        :param instance:
+            The model. **REQUIRED**
+        '''
+
+        self.models.pop((type(instance), instance.token), None)
+
+    def clear(self):
+        '''
+        Remove all models from the map.
+        '''
+
+        self.models.clear()
+
+    def __len__(self):
+        return len(self.models)
+
+    def __contains__(self, instance):
+        return self.models.get((type(instance), getattr(instance, 'token', None))) is instance
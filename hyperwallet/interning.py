@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+import six
+
+# Model attributes with few distinct values, e.g. codes and statuses. Their
+# values are shared between the models of list results.
+INTERNED_FIELDS = (
+    'businessType', 'cardType', 'country', 'currency', 'destinationCurrency',
+    'entry', 'fromStatus', 'gender', 'governmentIdType', 'language',
+    'profileType', 'purpose', 'sourceCurrency', 'status', 'toStatus',
+    'transferMethodCountry', 'transferMethodCurrency', 'type',
+    'verificationStatus'
+)
+
+# The most distinct values kept. Values seen after the table is full are
+# left as they are.
+CACHE_SIZE = 4096
+
+_values = {}
+
+
+def internValue(value):
+    '''
+    Return the shared copy of a string, adding it to the table if there is
+    room. Other values are returned as they are.
+
+    :param value:
+        The value. **REQUIRED**
+    '''
+
+    shared = _values.get(value) if isinstance(value, six.string_types) else None
+    if shared is None:
+        if isinstance(value, six.string_types) and len(_values) < CACHE_SIZE:
+            _values[value] = value
+        return value
+
+    return shared
+
+
+def internRows(rows, fields=INTERNED_FIELDS):
+    '''
+    Replace the values of the enum-like attributes of the rows of a list
+    result with shared copies, so each distinct value is stored once however
+    many rows hold it. The rows are changed in place.
+
+    :param rows:
+        The rows of the response. **REQUIRED**
+    :param fields:
+        The names of the attributes to intern.
+    :returns:
+        The rows.
+    '''
+
+    values = _values
+    for row in rows:
+        for field in fields:
+            value = row.get(field)
+            if value is None:
+                continue
+
+            try:
+                shared = values.get(value)
+            except TypeError:
+                continue
+
+            row[field] = internValue(value) if shared is None else shared
+
+    return rows
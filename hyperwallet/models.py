@@ -1,26 +1,247 @@
 #!/usr/bin/env python
 
 import json
+import zlib
+from operator import itemgetter
 
+import six
 
+from hyperwallet import amounts, timestamps
+from hyperwallet.exceptions import HyperwalletException
+
+
+class ModelField(object):
+    '''
+    A model attribute which reads its value from the source dictionary of
+    the model on access. Assigned values are kept apart, so the source
+    dictionary is never modified.
+
+    :param name:
+        The name of the attribute and of its key in the source dictionary.
+    :param default:
+        The value of the attribute if the key is missing.
+    '''
+
+    __slots__ = ('name', 'default')
+
+    def __init__(self, name, default=None):
+        '''
+        Create a field descriptor.
+        '''
+
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        values = instance._values
+        if values is not None and self.name in values:
+            return values[self.name]
+
+        raw = instance._raw_json
+        return self.default if raw is None else raw.get(self.name, self.default)
+
+    def __set__(self, instance, value):
+        if instance._values is None:
+            instance._values = {}
+        instance._values[self.name] = value
+        instance._serialized = None
+
+
+class HyperwalletModelMeta(type):
+    '''
+    The metaclass of all models. It builds the class-level field table of a
+    model from the defaults of the model and of its base classes, and
+    installs a ModelField for each of its attributes which the model doesn't
+    define itself.
+    '''
+
+    def __new__(mcs, name, bases, namespace):
+        '''
+        Create a model class with its field table and field descriptors.
+        '''
+
+        inherited = {}
+        for base in reversed(bases):
+            inherited.update(getattr(base, '_fields', ()))
+
+        defaults = namespace.get('defaults', {})
+
+        for (param, default) in defaults.items():
+            if not isinstance(namespace.get(param), ModelField):
+                namespace[param] = ModelField(param, default)
+
+        namespace.setdefault('__slots__', ())
+        namespace['_fields'] = tuple(sorted(dict(inherited, **defaults).items()))
+        namespace['_fieldNames'] = tuple(param for (param, default) in namespace['_fields'])
+        namespace['_fieldSet'] = frozenset(namespace['_fieldNames'])
+        namespace['_schema'] = zlib.crc32(','.join(namespace['_fieldNames']).encode('ascii')) & 0xffffffff
+        namespace['_packShapes'] = {}
+        namespace['_loadShapes'] = {}
+
+        return super(HyperwalletModelMeta, mcs).__new__(mcs, name, bases, namespace)
+
+
+@six.add_metaclass(HyperwalletModelMeta)
 class HyperwalletModel(object):
     '''
     The base Hyperwallet Model from which all other models will inherit.
 
+    Models declare their attributes and default values in a class-level
+    ``defaults`` table. A model is a view over its source dictionary: the
+    attributes are looked up in the dictionary when they are read, so
+    building a model costs the same whatever the number of attributes.
+
     :param data:
         A dictionary containing the attributes for the Model.
+    :param keepRawJson:
+        Keep the source dictionary as ``_raw_json``. Defaults to the class
+        attribute ``keepRawJson``. Without it only the declared attributes
+        are copied and asDict() is built from them.
+    :param fields:
+        The names of the attributes to keep. The other attributes of the
+        source dictionary are dropped and read as their default.
+
+    The JSON string of a model built with ``keepRawJson=False`` whose
+    attributes are all strings, numbers or None is memoized until an
+    attribute is assigned. Models viewing their source dictionary or holding
+    lists, dictionaries or nested models are serialized on every call, so
+    changes to them are always reflected. Set the class attribute ``compactJson`` to
+    serialize without indentation by default.
     '''
 
-    def __init__(self, data):
+    __slots__ = ('_raw_json', '_values', '_serialized', '__weakref__')
+
+    defaults = {}
+
+    # The amount attributes of the model and the attribute of their currency.
+    amountCurrencies = {}
+
+    keepRawJson = True
+
+    compactJson = False
+
+    def __init__(self, data, keepRawJson=None, fields=None):
         '''
         Create an instance of the base HyperwalletModel.
         '''
 
-        self.defaults = {
-            '_raw_json': None
-        }
+        self._serialized = None
+
+        if keepRawJson is None:
+            keepRawJson = self.keepRawJson
+
+        if keepRawJson:
+            self._raw_json = data if fields is None else dict(
+                (param, data[param])
+                for param in fields
+                if param in data
+            )
+            self._values = None
+        else:
+            self._raw_json = None
+            self._values = dict(
+                (param, data[param])
+                for (param, default) in self._fields
+                if param in data and (fields is None or param in fields)
+            )
+
+    def asDecimal(self, field='amount'):
+        '''
+        Return an amount attribute as a Decimal, without rounding.
+
+        :param field:
+            The name of the amount attribute.
+        :returns:
+            The Decimal amount, or None if the amount is missing.
+        '''
+
+        return amounts.toDecimal(getattr(self, self.__amountField(field)))
+
+    def asMinorUnits(self, field='amount'):
+        '''
+        Return an amount attribute as an integer number of minor units of its
+        currency, e.g. 1050 for 10.50 USD.
+
+        :param field:
+            The name of the amount attribute.
+        :returns:
+            The number of minor units, or None if the amount is missing.
+        '''
+
+        currency = getattr(self, self.amountCurrencies[self.__amountField(field)])
+        return amounts.toMinorUnits(getattr(self, field), currency)
 
-        setattr(self, '_raw_json', data)
+    def asDatetime(self, field='createdOn'):
+        '''
+        Return a timestamp attribute as a datetime, see
+        hyperwallet.timestamps.parseTimestamp().
+
+        :param field:
+            The name of the timestamp attribute.
+        :returns:
+            The datetime, or None if the timestamp is missing.
+        '''
+
+        try:
+            if field in timestamps.TIMESTAMP_FIELDS:
+                return timestamps.parseTimestamp(getattr(self, field))
+        except AttributeError:
+            pass
+
+        raise HyperwalletException('{} is not a timestamp of {}'.format(field, type(self).__name__))
+
+    def __amountField(self, field):
+        '''
+        Check that an attribute is an amount of this model.
+        '''
+
+        if field not in self.amountCurrencies:
+            raise HyperwalletException('{} is not an amount of {}'.format(field, type(self).__name__))
+
+        return field
+
+    def packState(self):
+        '''
+        Return the state of the model as plain values: the fingerprint of
+        the field table, whether the source dictionary is kept, a bit mask
+        of the attributes present in the field table, their values in field
+        table order, the other keys of the source dictionary and the
+        assigned attributes. See loadModel().
+        '''
+
+        keepRawJson = self._raw_json is not None
+        source = self._raw_json if keepRawJson else self._values
+
+        (mask, getValues, extraKeys, getExtras) = _packShape(type(self), tuple(source))
+
+        return (
+            self._schema,
+            keepRawJson,
+            mask,
+            getValues(source),
+            dict(zip(extraKeys, getExtras(source))) if extraKeys else None,
+            (self._values or None) if keepRawJson else None
+        )
+
+    def __getstate__(self):
+        '''
+        Pickle the source dictionary and the assigned attributes by name,
+        without the memoized JSON string.
+        '''
+
+        return {'_raw_json': self._raw_json, '_values': self._values}
+
+    def __setstate__(self, state):
+        '''
+        Restore a pickled model.
+        '''
+
+        self._raw_json = state['_raw_json']
+        self._values = state['_values']
+        self._serialized = None
 
     def __str__(self):
         '''
@@ -30,38 +251,156 @@ class HyperwalletModel(object):
 
         return self.asJsonString()
 
-    def asJsonString(self):
+    def asJsonString(self, compact=None):
         '''
         Return a JSON string of the HyperwalletModel based on key/value pairs
-        returned from the asDict() function.
+        returned from the asDict() function. The string is memoized if the
+        model only holds copied scalar values, see HyperwalletModel.
+
+        :param compact:
+            Leave out the indentation. Defaults to the class attribute
+            ``compactJson``.
         '''
 
-        return json.dumps(
+        if compact is None:
+            compact = self.compactJson
+
+        serialized = self._serialized
+        if serialized is not None and serialized[0] == compact:
+            return serialized[1]
+
+        text = json.dumps(
             self.asDict(),
             sort_keys=True,
             separators=(',', ':'),
-            indent=4
+            indent=None if compact else 4
         )
 
+        # The source dictionary, nested models and containers can change
+        # without the model knowing, so only copied scalars are memoized.
+        if self._raw_json is None and all(
+            isinstance(value, _SCALARS) for value in self._values.values()
+        ):
+            self._serialized = (compact, text)
+
+        return text
+
     def asDict(self):
         '''
-        Return a dictionary representation of the Model.
+        Return a dictionary representation of the Model. Attributes with
+        false values are left out, except empty lists.
         '''
 
-        data = {}
+        source = self._raw_json
+        if source is None:
+            source = {}
+            for (param, default) in self._fields:
+                value = getattr(self, param)
+                source[param] = value.asDict() if isinstance(value, HyperwalletModel) else value
 
-        for (key, value) in self._raw_json.items():
-            if isinstance(self._raw_json.get(key, None), (list, tuple, set)):
-                data[key] = list()
-                for subobj in self._raw_json.get(key, None):
-                    data[key].append(subobj)
+        data = {}
 
-            elif self._raw_json.get(key, None):
-                data[key] = self._raw_json.get(key, None)
+        for (key, value) in source.items():
+            if isinstance(value, (list, tuple, set)):
+                data[key] = list(value)
+            elif value:
+                data[key] = value
 
         return data
 
 
+# The attribute values which can't change in place.
+_SCALARS = six.string_types + six.integer_types + (float, type(None))
+
+# The most distinct sets of keys remembered per model by packState() and
+# loadModel().
+PACK_SHAPES = 256
+
+
+def _getter(keys):
+    '''
+    Return a function returning the values of the given keys of a
+    dictionary as a tuple.
+    '''
+
+    if not keys:
+        return lambda source: ()
+    if len(keys) == 1:
+        return lambda source: (source[keys[0]],)
+    return itemgetter(*keys)
+
+
+def _packShape(model, keys):
+    '''
+    Return the bit mask of the attributes of a model present in the given
+    keys of a source dictionary, a getter of their values, the other keys
+    and a getter of their values. Rows of a list usually have the same keys,
+    so the shapes are remembered.
+    '''
+
+    shapes = model._packShapes
+    shape = shapes.get(keys)
+    if shape is None:
+        present = frozenset(keys)
+        params = [param for param in model._fieldNames if param in present]
+        extraKeys = tuple(key for key in keys if key not in model._fieldSet)
+        mask = sum(1 << index for (index, param) in enumerate(model._fieldNames) if param in present)
+
+        shape = (mask, _getter(params), extraKeys, _getter(extraKeys))
+        if len(shapes) < PACK_SHAPES:
+            shapes[keys] = shape
+
+    return shape
+
+
+def loadModel(model, schema, keepRawJson, mask, values, extras=None, assigned=None):
+    '''
+    Rebuild a model from the state returned by its packState() method,
+    without running its constructor. The state is positional, so it is
+    rejected if the field table of the model changed since it was packed.
+
+    :param model:
+        The model class. **REQUIRED**
+    :param schema:
+        The fingerprint of the field table the state was packed with. **REQUIRED**
+    :param keepRawJson:
+        Whether the model kept its source dictionary. **REQUIRED**
+    :param mask:
+        The bit mask of the attributes present in the field table. **REQUIRED**
+    :param values:
+        The values of the attributes present, in field table order. **REQUIRED**
+    :param extras:
+        The other keys of the source dictionary.
+    :param assigned:
+        The assigned attributes.
+    '''
+
+    if schema != model._schema:
+        raise HyperwalletException('{} was packed with a different field table'.format(model.__name__))
+
+    shapes = model._loadShapes
+    params = shapes.get(mask)
+    if params is None:
+        params = tuple(param for (index, param) in enumerate(model._fieldNames) if mask >> index & 1)
+        if len(shapes) < PACK_SHAPES:
+            shapes[mask] = params
+
+    data = dict(zip(params, values))
+    if extras:
+        data.update(extras)
+
+    instance = model.__new__(model)
+    instance._serialized = None
+    if keepRawJson:
+        instance._raw_json = data
+        instance._values = assigned
+    else:
+        instance._raw_json = None
+        instance._values = data
+
+    return instance
+
+
 class User(HyperwalletModel):
     '''
     The User Model.
@@ -70,53 +409,43 @@ class User(HyperwalletModel):
         A dictionary containing the attributes for the User.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new User with the provided attributes.
-        '''
-
-        super(User, self).__init__(data)
-
-        self.defaults = {
-            'addressLine1': None,
-            'addressLine2': None,
-            'businessContactRole': None,
-            'businessName': None,
-            'businessRegistrationCountry': None,
-            'businessRegistrationId': None,
-            'businessRegistrationStateProvince': None,
-            'businessType': None,
-            'city': None,
-            'clientUserId': None,
-            'country': None,
-            'countryOfBirth': None,
-            'countryOfNationality': None,
-            'createdOn': None,
-            'dateOfBirth': None,
-            'driversLicenseId': None,
-            'email': None,
-            'employerId': None,
-            'firstName': None,
-            'gender': None,
-            'governmentId': None,
-            'governmentIdType': None,
-            'language': None,
-            'lastName': None,
-            'middleName': None,
-            'mobileNumber': None,
-            'passportId': None,
-            'phoneNumber': None,
-            'postalCode': None,
-            'profileType': None,
-            'programToken': None,
-            'stateProvince': None,
-            'status': None,
-            'token': None,
-            'verificationStatus': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'addressLine1': None,
+        'addressLine2': None,
+        'businessContactRole': None,
+        'businessName': None,
+        'businessRegistrationCountry': None,
+        'businessRegistrationId': None,
+        'businessRegistrationStateProvince': None,
+        'businessType': None,
+        'city': None,
+        'clientUserId': None,
+        'country': None,
+        'countryOfBirth': None,
+        'countryOfNationality': None,
+        'createdOn': None,
+        'dateOfBirth': None,
+        'driversLicenseId': None,
+        'email': None,
+        'employerId': None,
+        'firstName': None,
+        'gender': None,
+        'governmentId': None,
+        'governmentIdType': None,
+        'language': None,
+        'lastName': None,
+        'middleName': None,
+        'mobileNumber': None,
+        'passportId': None,
+        'phoneNumber': None,
+        'postalCode': None,
+        'profileType': None,
+        'programToken': None,
+        'stateProvince': None,
+        'status': None,
+        'token': None,
+        'verificationStatus': None
+    }
 
     def __repr__(self):
         return "User({date}, {token})".format(
@@ -133,19 +462,9 @@ class AuthenticationToken(HyperwalletModel):
         A dictionary containing the attributes for the Authentication Token.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Authentication Token with the provided attributes.
-        '''
-
-        super(AuthenticationToken, self).__init__(data)
-
-        self.defaults = {
-            'value': None,
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'value': None
+    }
 
     def __repr__(self):
         return "AuthenticationToken({value})".format(
@@ -161,25 +480,15 @@ class TransferMethod(HyperwalletModel):
         A dictionary containing the attributes for the Transfer Method.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Transfer Method with the provided attributes.
-        '''
-
-        super(TransferMethod, self).__init__(data)
-
-        self.defaults = {
-            'createdOn': None,
-            'isDefaultTransferMethod': None,
-            'status': None,
-            'token': None,
-            'transferMethodCountry': None,
-            'transferMethodCurrency': None,
-            'type': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'createdOn': None,
+        'isDefaultTransferMethod': None,
+        'status': None,
+        'token': None,
+        'transferMethodCountry': None,
+        'transferMethodCurrency': None,
+        'type': None
+    }
 
     def __repr__(self):
         return "TransferMethod({date}, {token})".format(
@@ -196,71 +505,61 @@ class BankAccount(TransferMethod):
         A dictionary containing the attributes for the Bank Account.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Bank Account with the provided attributes.
-        '''
-
-        super(BankAccount, self).__init__(data)
-
-        self.defaults = {
-            'addressLine1': None,
-            'addressLine2': None,
-            'bankAccountId': None,
-            'bankAccountPurpose': None,
-            'bankAccountRelationship': None,
-            'bankId': None,
-            'bankName': None,
-            'branchAddressLine1': None,
-            'branchAddressLine2': None,
-            'branchCity': None,
-            'branchCountry': None,
-            'branchId': None,
-            'branchName': None,
-            'branchPostalCode': None,
-            'branchStateProvince': None,
-            'buildingSocietyAccount': None,
-            'businessContactRole': None,
-            'businessName': None,
-            'businessRegistrationCountry': None,
-            'businessRegistrationId': None,
-            'businessRegistrationStateProvince': None,
-            'businessType': None,
-            'city': None,
-            'country': None,
-            'countryOfBirth': None,
-            'countryOfNationality': None,
-            'dateOfBirth': None,
-            'driversLicenseId': None,
-            'employerId': None,
-            'firstName': None,
-            'gender': None,
-            'governmentId': None,
-            'governmentIdType': None,
-            'intermediaryBankAccountId': None,
-            'intermediaryBankAddressLine1': None,
-            'intermediaryBankAddressLine2': None,
-            'intermediaryBankCity': None,
-            'intermediaryBankCountry': None,
-            'intermediaryBankId': None,
-            'intermediaryBankName': None,
-            'intermediaryBankPostalCode': None,
-            'intermediaryBankStateProvince': None,
-            'kpp': None,
-            'lastName': None,
-            'middleName': None,
-            'mobileNumber': None,
-            'passportId': None,
-            'phoneNumber': None,
-            'postalCode': None,
-            'profileType': None,
-            'stateProvince': None,
-            'taxId': None,
-            'wireInstructions': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'addressLine1': None,
+        'addressLine2': None,
+        'bankAccountId': None,
+        'bankAccountPurpose': None,
+        'bankAccountRelationship': None,
+        'bankId': None,
+        'bankName': None,
+        'branchAddressLine1': None,
+        'branchAddressLine2': None,
+        'branchCity': None,
+        'branchCountry': None,
+        'branchId': None,
+        'branchName': None,
+        'branchPostalCode': None,
+        'branchStateProvince': None,
+        'buildingSocietyAccount': None,
+        'businessContactRole': None,
+        'businessName': None,
+        'businessRegistrationCountry': None,
+        'businessRegistrationId': None,
+        'businessRegistrationStateProvince': None,
+        'businessType': None,
+        'city': None,
+        'country': None,
+        'countryOfBirth': None,
+        'countryOfNationality': None,
+        'dateOfBirth': None,
+        'driversLicenseId': None,
+        'employerId': None,
+        'firstName': None,
+        'gender': None,
+        'governmentId': None,
+        'governmentIdType': None,
+        'intermediaryBankAccountId': None,
+        'intermediaryBankAddressLine1': None,
+        'intermediaryBankAddressLine2': None,
+        'intermediaryBankCity': None,
+        'intermediaryBankCountry': None,
+        'intermediaryBankId': None,
+        'intermediaryBankName': None,
+        'intermediaryBankPostalCode': None,
+        'intermediaryBankStateProvince': None,
+        'kpp': None,
+        'lastName': None,
+        'middleName': None,
+        'mobileNumber': None,
+        'passportId': None,
+        'phoneNumber': None,
+        'postalCode': None,
+        'profileType': None,
+        'stateProvince': None,
+        'taxId': None,
+        'wireInstructions': None
+    }
 
     def __repr__(self):
         return "BankAccount({date}, {token})".format(
@@ -277,22 +576,12 @@ class BankCard(TransferMethod):
         A dictionary containing the attributes for the Bank Card.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Bank Card with the provided attributes.
-        '''
-
-        super(BankCard, self).__init__(data)
-
-        self.defaults = {
-            'cardBrand': None,
-            'cardNumber': None,
-            'cardType': None,
-            'dateOfExpiry': None,
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'cardBrand': None,
+        'cardNumber': None,
+        'cardType': None,
+        'dateOfExpiry': None
+    }
 
     def __repr__(self):
         return "BankCard({date}, {token})".format(
@@ -309,23 +598,13 @@ class PrepaidCard(TransferMethod):
         A dictionary containing the attributes for the Prepaid Card.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Prepaid Card with the provided attributes.
-        '''
-
-        super(PrepaidCard, self).__init__(data)
-
-        self.defaults = {
-            'cardBrand': None,
-            'cardNumber': None,
-            'cardPackage': None,
-            'cardType': None,
-            'dateOfExpiry': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'cardBrand': None,
+        'cardNumber': None,
+        'cardPackage': None,
+        'cardType': None,
+        'dateOfExpiry': None
+    }
 
     def __repr__(self):
         return "PrepaidCard({date}, {token})".format(
@@ -342,47 +621,37 @@ class PaperCheck(TransferMethod):
         A dictionary containing the attributes for the Paper Check.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Paper Check with the provided attributes.
-        '''
-
-        super(PaperCheck, self).__init__(data)
-
-        self.defaults = {
-            'addressLine1': None,
-            'addressLine2': None,
-            'bankAccountRelationship': None,
-            'businessContactRole': None,
-            'businessName': None,
-            'businessRegistrationCountry': None,
-            'businessRegistrationId': None,
-            'businessRegistrationStateProvince': None,
-            'businessType': None,
-            'city': None,
-            'country': None,
-            'countryOfBirth': None,
-            'countryOfNationality': None,
-            'dateOfBirth': None,
-            'driversLicenseId': None,
-            'employerId': None,
-            'firstName': None,
-            'gender': None,
-            'governmentId': None,
-            'governmentIdType': None,
-            'lastName': None,
-            'middleName': None,
-            'mobileNumber': None,
-            'passportId': None,
-            'phoneNumber': None,
-            'postalCode': None,
-            'profileType': None,
-            'shippingMethod': None,
-            'stateProvince': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'addressLine1': None,
+        'addressLine2': None,
+        'bankAccountRelationship': None,
+        'businessContactRole': None,
+        'businessName': None,
+        'businessRegistrationCountry': None,
+        'businessRegistrationId': None,
+        'businessRegistrationStateProvince': None,
+        'businessType': None,
+        'city': None,
+        'country': None,
+        'countryOfBirth': None,
+        'countryOfNationality': None,
+        'dateOfBirth': None,
+        'driversLicenseId': None,
+        'employerId': None,
+        'firstName': None,
+        'gender': None,
+        'governmentId': None,
+        'governmentIdType': None,
+        'lastName': None,
+        'middleName': None,
+        'mobileNumber': None,
+        'passportId': None,
+        'phoneNumber': None,
+        'postalCode': None,
+        'profileType': None,
+        'shippingMethod': None,
+        'stateProvince': None
+    }
 
     def __repr__(self):
         return "PaperCheck({date}, {token})".format(
@@ -399,34 +668,31 @@ class Transfer(HyperwalletModel):
         A dictionary containing the attributes for the Transfer.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Transfer with the provided attributes.
-        '''
-
-        super(Transfer, self).__init__(data)
-
-        self.defaults = {
-            'token': None,
-            'status': None,
-            'createdOn': None,
-            'clientTransferId': None,
-            'sourceToken': None,
-            'sourceAmount': None,
-            'sourceFeeAmount': None,
-            'sourceCurrency': None,
-            'destinationToken': None,
-            'destinationAmount': None,
-            'destinationFeeAmount': None,
-            'destinationCurrency': None,
-            'foreignExchanges': None,
-            'notes': None,
-            'memo': None,
-            'expiresOn': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'token': None,
+        'status': None,
+        'createdOn': None,
+        'clientTransferId': None,
+        'sourceToken': None,
+        'sourceAmount': None,
+        'sourceFeeAmount': None,
+        'sourceCurrency': None,
+        'destinationToken': None,
+        'destinationAmount': None,
+        'destinationFeeAmount': None,
+        'destinationCurrency': None,
+        'foreignExchanges': None,
+        'notes': None,
+        'memo': None,
+        'expiresOn': None
+    }
+
+    amountCurrencies = {
+        'destinationAmount': 'destinationCurrency',
+        'destinationFeeAmount': 'destinationCurrency',
+        'sourceAmount': 'sourceCurrency',
+        'sourceFeeAmount': 'sourceCurrency'
+    }
 
     def __repr__(self):
         return "Transfer({date}, {token})".format(
@@ -443,19 +709,9 @@ class PayPalAccount(TransferMethod):
         A dictionary containing the attributes for the PayPal Account.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new PayPal Account with the provided attributes.
-        '''
-
-        super(PayPalAccount, self).__init__(data)
-
-        self.defaults = {
-            'email': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'email': None
+    }
 
     def __repr__(self):
         return "PayPalAccount({date}, {token})".format(
@@ -472,31 +728,25 @@ class Payment(HyperwalletModel):
         A dictionary containing the attributes for the Payment.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Payment with the provided attributes.
-        '''
-
-        super(Payment, self).__init__(data)
-
-        self.defaults = {
-            'amount': None,
-            'clientPaymentId': None,
-            'createdOn': None,
-            'currency': None,
-            'destinationToken': None,
-            'expiresOn': None,
-            'memo': None,
-            'notes': None,
-            'programToken': None,
-            'purpose': None,
-            'releaseOn': None,
-            'status': None,
-            'token': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'amount': None,
+        'clientPaymentId': None,
+        'createdOn': None,
+        'currency': None,
+        'destinationToken': None,
+        'expiresOn': None,
+        'memo': None,
+        'notes': None,
+        'programToken': None,
+        'purpose': None,
+        'releaseOn': None,
+        'status': None,
+        'token': None
+    }
+
+    amountCurrencies = {
+        'amount': 'currency'
+    }
 
     def __repr__(self):
         return "Payment({date}, {token})".format(
@@ -513,20 +763,14 @@ class Balance(HyperwalletModel):
         A dictionary containing the attributes for the Balance.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Balance with the provided attributes.
-        '''
+    defaults = {
+        'amount': None,
+        'currency': None
+    }
 
-        super(Balance, self).__init__(data)
-
-        self.defaults = {
-            'amount': None,
-            'currency': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    amountCurrencies = {
+        'amount': 'currency'
+    }
 
     def __repr__(self):
         return "Balance({currency}, {amount})".format(
@@ -543,30 +787,25 @@ class Receipt(HyperwalletModel):
         A dictionary containing the attributes for the Receipt.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Receipt with the provided attributes.
-        '''
-
-        super(Receipt, self).__init__(data)
-
-        self.defaults = {
-            'amount': None,
-            'createdOn': None,
-            'currency': None,
-            'destinationToken': None,
-            'details': None,
-            'entry': None,
-            'fee': None,
-            'foreignExchangeCurrency': None,
-            'foreignExchangeRate': None,
-            'journalId': None,
-            'sourceToken': None,
-            'type': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'amount': None,
+        'createdOn': None,
+        'currency': None,
+        'destinationToken': None,
+        'details': None,
+        'entry': None,
+        'fee': None,
+        'foreignExchangeCurrency': None,
+        'foreignExchangeRate': None,
+        'journalId': None,
+        'sourceToken': None,
+        'type': None
+    }
+
+    amountCurrencies = {
+        'amount': 'currency',
+        'fee': 'currency'
+    }
 
     def __repr__(self):
         return "Receipt({entry}, {amount})".format(
@@ -583,22 +822,12 @@ class Program(HyperwalletModel):
         A dictionary containing the attributes for the Program.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Program with the provided attributes.
-        '''
-
-        super(Program, self).__init__(data)
-
-        self.defaults = {
-            'createdOn': None,
-            'name': None,
-            'parentToken': None,
-            'token': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'createdOn': None,
+        'name': None,
+        'parentToken': None,
+        'token': None
+    }
 
     def __repr__(self):
         return "Program({date}, {token})".format(
@@ -615,22 +844,12 @@ class Account(HyperwalletModel):
         A dictionary containing the attributes for the Account.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Account with the provided attributes.
-        '''
-
-        super(Account, self).__init__(data)
-
-        self.defaults = {
-            'createdOn': None,
-            'email': None,
-            'token': None,
-            'type': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'createdOn': None,
+        'email': None,
+        'token': None,
+        'type': None
+    }
 
     def __repr__(self):
         return "Account({date}, {token})".format(
@@ -647,25 +866,15 @@ class StatusTransition(HyperwalletModel):
         A dictionary containing the attributes for the Status Transition.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Status Transition with the provided attributes.
-        '''
-
-        super(StatusTransition, self).__init__(data)
-
-        self.defaults = {
-            'createdOn': None,
-            'fromStatus': None,
-            'notes': None,
-            'statusCode': None,
-            'token': None,
-            'toStatus': None,
-            'transition': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+    defaults = {
+        'createdOn': None,
+        'fromStatus': None,
+        'notes': None,
+        'statusCode': None,
+        'token': None,
+        'toStatus': None,
+        'transition': None
+    }
 
     def __repr__(self):
         return "StatusTransition({date}, {token})".format(
@@ -682,31 +891,30 @@ class TransferMethodConfiguration(HyperwalletModel):
         A dictionary containing the attributes for the Transfer Method Configuration.
     '''
 
-    def __init__(self, data):
+    defaults = {
+        'country': None,
+        'currency': None,
+        'fields': None,
+        'profileType': None,
+        'type': None
+    }
+
+    def __init__(self, data, keepRawJson=None, fields=None):
         '''
         Create a new Transfer Method Configuration with the provided attributes.
         '''
 
-        super(TransferMethodConfiguration, self).__init__(data)
-
-        self.defaults = {
-            'country': None,
-            'currency': None,
-            'fields': None,
-            'profileType': None,
-            'type': None
-        }
-
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+        super(TransferMethodConfiguration, self).__init__(data, keepRawJson, fields)
 
         # Rename the countries array to a single country
-        countries = data.get('countries', ['NONE'])
-        setattr(self, 'country', countries[0])
+        if fields is None or 'country' in fields:
+            countries = data.get('countries', ['NONE'])
+            setattr(self, 'country', countries[0])
 
         # Rename the currencies array to a single currency
-        currencies = data.get('currencies', ['NONE'])
-        setattr(self, 'currency', currencies[0])
+        if fields is None or 'currency' in fields:
+            currencies = data.get('currencies', ['NONE'])
+            setattr(self, 'currency', currencies[0])
 
     def __repr__(self):
         return "TransferMethodConfiguration({country}, {type})".format(
@@ -715,53 +923,89 @@ class TransferMethodConfiguration(HyperwalletModel):
         )
 
 
-class Webhook(HyperwalletModel):
+class WebhookObjectField(ModelField):
     '''
-    The Webhook Model.
-
-    :param data:
-        A dictionary containing the attributes for the Webhook.
+    The object of a Webhook. It is built into the model of the notification
+    type on first access, see webhookObjectModel(), so webhooks whose object
+    is never read don't build it.
     '''
 
-    def __init__(self, data):
-        '''
-        Create a new Webhook with the provided attributes.
-        '''
+    __slots__ = ()
 
-        super(Webhook, self).__init__(data)
+    def __get__(self, instance, owner):
+        value = super(WebhookObjectField, self).__get__(instance, owner)
+        if instance is None or type(value) is not dict:
+            return value
 
-        self.defaults = {
-            'createdOn': None,
-            'object': None,
-            'token': None,
-            'type': None
-        }
+        model = webhookObjectModel(instance.type)
+        if model is None:
+            return value
 
-        for (param, default) in self.defaults.items():
-            setattr(self, param, data.get(param, default))
+        value = model(value, None if instance._raw_json is not None else False)
 
-        if self.type is None:
-            return
+        if instance._values is None:
+            instance._values = {}
+        instance._values[self.name] = value
 
-        if type(self.object) is not dict:
-            return
+        return value
 
-        types = {
-            'PAYMENTS': Payment,
-            'BANK_ACCOUNTS': BankAccount,
-            'PREPAID_CARDS': PrepaidCard,
-            'USERS': User
-        }
 
-        base, sub = self.type.split('.')[:2]
+class Webhook(HyperwalletModel):
+    '''
+    The Webhook Model.
+
+    :param data:
+        A dictionary containing the attributes for the Webhook.
+    '''
+
+    defaults = {
+        'createdOn': None,
+        'object': None,
+        'token': None,
+        'type': None
+    }
 
-        if sub in types:
-            self.object = types[sub](self.object)
-        elif base in types:
-            self.object = types[base](self.object)
+    object = WebhookObjectField('object')
 
     def __repr__(self):
         return "Webhook({date}, {token})".format(
             date=self.createdOn,
             token=self.token
         )
+
+
+# The model of the object of each webhook notification type, keyed by the
+# segments of the type, e.g. USERS.BANK_ACCOUNTS.CREATED is a BankAccount.
+WEBHOOK_OBJECTS = {
+    'BANK_ACCOUNTS': BankAccount,
+    'BANK_CARDS': BankCard,
+    'PAPER_CHECKS': PaperCheck,
+    'PAYMENTS': Payment,
+    'PAYPAL_ACCOUNTS': PayPalAccount,
+    'PREPAID_CARDS': PrepaidCard,
+    'TRANSFER_METHODS': TransferMethod,
+    'TRANSFERS': Transfer,
+    'USERS': User
+}
+
+
+def webhookObjectModel(notificationType):
+    '''
+    Return the model of the object of a webhook notification type, looking
+    up the second segment of the type and then the first one in
+    WEBHOOK_OBJECTS.
+
+    :param notificationType:
+        The type of the notification, e.g. ``USERS.BANK_ACCOUNTS.CREATED``.
+    :returns:
+        The model class, or None if the type has no model.
+    '''
+
+    if not isinstance(notificationType, six.string_types):
+        return None
+
+    segments = notificationType.split('.', 2)
+    if len(segments) > 1 and segments[1] in WEBHOOK_OBJECTS:
+        return WEBHOOK_OBJECTS[segments[1]]
+
+    return WEBHOOK_OBJECTS.get(segments[0])
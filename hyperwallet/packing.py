@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+import importlib
+import pickle
+
+from hyperwallet import models
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.models import HyperwalletModel, loadModel
+
+# The formats of packed models, marked by their first byte.
+MSGPACK = 'msgpack'
+PICKLE = 'pickle'
+
+_MARKERS = {MSGPACK: b'M', PICKLE: b'P'}
+
+# The msgpack extension type of a nested model.
+_MODEL_EXT = 1
+
+
+def _msgpack():
+    '''
+    Return the msgpack module, or None if it is not installed.
+    '''
+
+    try:
+        return importlib.import_module('msgpack')
+    except ImportError:
+        return None
+
+
+def _modelClass(name):
+    '''
+    Return the model class of the given name.
+    '''
+
+    model = getattr(models, name, None)
+    if not (isinstance(model, type) and issubclass(model, HyperwalletModel)):
+        raise HyperwalletException('Unknown model {}'.format(name))
+
+    return model
+
+
+def _packMsgpack(msgpack, model):
+    '''
+    Pack a nested model, e.g. the object of a Webhook, as a msgpack
+    extension.
+    '''
+
+    if not isinstance(model, HyperwalletModel):
+        raise TypeError('Cannot pack {}'.format(type(model).__name__))
+
+    return msgpack.ExtType(_MODEL_EXT, msgpack.packb(
+        (type(model).__name__,) + model.packState(),
+        default=lambda value: _packMsgpack(msgpack, value),
+        use_bin_type=True
+    ))
+
+
+def _unpackMsgpack(msgpack, code, data):
+    '''
+    Unpack the msgpack extension of a nested model.
+    '''
+
+    if code != _MODEL_EXT:
+        return msgpack.ExtType(code, data)
+
+    state = msgpack.unpackb(data, ext_hook=lambda c, d: _unpackMsgpack(msgpack, c, d), raw=False)
+    return loadModel(_modelClass(state[0]), *state[1:])
+
+
+def packModels(instances, format=None):
+    '''
+    Pack models into bytes for caches or other processes. Attribute values
+    are stored in the order of the field table of each model instead of by
+    name, and memoized JSON strings are left out. Each model carries a
+    fingerprint of its field table, so models packed by a version of the SDK
+    with other attributes fail to unpack instead of being misread. Use
+    asDict() for data which outlives the SDK version.
+
+    :param instances:
+        The models to pack. **REQUIRED**
+    :param format:
+        ``msgpack`` or ``pickle``. Defaults to ``msgpack`` if it is
+        installed.
+    :returns:
+        The packed models.
+    '''
+
+    msgpack = _msgpack()
+
+    if format is None:
+        format = PICKLE if msgpack is None else MSGPACK
+
+    if format == PICKLE:
+        return _MARKERS[PICKLE] + pickle.dumps(
+            [(type(instance),) + instance.packState() for instance in instances],
+            pickle.HIGHEST_PROTOCOL
+        )
+
+    if format != MSGPACK:
+        raise HyperwalletException('Unknown format {}'.format(format))
+
+    if msgpack is None:
+        raise HyperwalletException('msgpack is required for this format, install it with: pip install msgpack')
+
+    return _MARKERS[MSGPACK] + msgpack.packb(
+        [(type(instance).__name__,) + instance.packState() for instance in instances],
+        default=lambda value: _packMsgpack(msgpack, value),
+        use_bin_type=True
+    )
+
+
+def unpackModels(data):
+    '''
+    Unpack models packed by packModels().
+
+    :param data:
+        The packed models. **REQUIRED**
+    :returns:
+        A list of models.
+    '''
+
+    (marker, payload) = (data[:1], data[1:])
+
+    if marker == _MARKERS[PICKLE]:
+        return [loadModel(*state) for state in pickle.loads(payload)]
+
+    if marker == _MARKERS[MSGPACK]:
+        msgpack = _msgpack()
+        if msgpack is None:
+            raise HyperwalletException('msgpack is required for this format, install it with: pip install msgpack')
+
+        states = msgpack.unpackb(payload, ext_hook=lambda c, d: _unpackMsgpack(msgpack, c, d), raw=False)
+        return [loadModel(_modelClass(state[0]), *state[1:]) for state in states]
+
+    raise HyperwalletException('Unknown packed models')
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+import json
+import mock
+import threading
+import unittest
+
+from hyperwallet.utils import ApiClient
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletAPIException, HyperwalletOverloadException
+from hyperwallet.utils.admission import AdmissionQueue
+
+
+class AdmissionQueueTest(unittest.TestCase):
+
+    def test_admits_up_to_max_concurrency(self):
+
+        queue = AdmissionQueue(maxConcurrency=2, maxDepth=0)
+
+        queue.acquire()
+        queue.acquire()
+
+        self.assertEqual(queue.inFlight, 2)
+
+        with self.assertRaises(HyperwalletOverloadException) as exc:
+            queue.acquire()
+
+        self.assertEqual(
+            exc.exception.message.get('errors')[0].get('code'),
+            'QUEUE_FULL'
+        )
+
+        queue.release()
+        queue.acquire()
+
+        self.assertEqual(queue.inFlight, 2)
+
+    def test_sheds_load_after_max_queue_time(self):
+
+        queue = AdmissionQueue(maxConcurrency=1, maxDepth=1, maxQueueTime=0.01)
+        queue.acquire()
+
+        with self.assertRaises(HyperwalletOverloadException) as exc:
+            queue.acquire()
+
+        self.assertEqual(
+            exc.exception.message.get('errors')[0].get('code'),
+            'QUEUE_TIMEOUT'
+        )
+        self.assertEqual(queue.depth, 0)
+
+    def test_waiting_request_is_admitted_on_release(self):
+
+        queue = AdmissionQueue(maxConcurrency=1, maxDepth=1, maxQueueTime=5)
+        queue.acquire()
+
+        admitted = threading.Event()
+
+        def wait():
+            with queue:
+                admitted.set()
+
+        thread = threading.Thread(target=wait)
+        thread.start()
+
+        self.assertFalse(admitted.wait(0.05))
+
+        queue.release()
+        thread.join(5)
+
+        self.assertTrue(admitted.is_set())
+        self.assertEqual(queue.inFlight, 0)
+
+    def test_invalid_configuration(self):
+
+        with self.assertRaises(ValueError):
+            AdmissionQueue(maxConcurrency=0)
+
+        with self.assertRaises(ValueError):
+            AdmissionQueue(maxDepth=-1)
+
+
+class ApiClientAdmissionTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.client = ApiClient(
+            'test-user',
+            'test-pass',
+            SERVER,
+            admissionData={'maxConcurrency': 1, 'maxDepth': 0}
+        )
+
+    @mock.patch('requests.Session.request')
+    def test_request_is_admitted(self, session_mock):
+
+        session_mock.return_value = mock.MagicMock(
+            status_code=200,
+            content=json.dumps({'key': 'value'}),
+            headers={
+                "Content-Type": "application/json"
+            }
+        )
+
+        self.assertEqual(self.client.doGet('users'), {'key': 'value'})
+        self.assertEqual(self.client.admission.inFlight, 0)
+
+    @mock.patch('requests.Session.request')
+    def test_request_is_shed_when_queue_is_full(self, session_mock):
+
+        self.client.admission.acquire()
+
+        with self.assertRaises(HyperwalletAPIException) as exc:
+            self.client.doGet('users')
+
+        self.assertIsInstance(exc.exception, HyperwalletOverloadException)
+        self.assertFalse(session_mock.called)
+
+    def test_slot_is_released_when_request_fails(self):
+
+        with self.assertRaises(HyperwalletAPIException):
+            self.client._makeRequest()
+
+        self.assertEqual(self.client.admission.inFlight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
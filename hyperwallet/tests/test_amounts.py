@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+import unittest
+from decimal import Decimal
+
+from hyperwallet import amounts
+from hyperwallet.exceptions import HyperwalletException
+
+
+class AmountsTest(unittest.TestCase):
+
+    def test_currency_decimals(self):
+
+        self.assertEqual(amounts.currencyDecimals('USD'), 2)
+        self.assertEqual(amounts.currencyDecimals('JPY'), 0)
+        self.assertEqual(amounts.currencyDecimals('KWD'), 3)
+        self.assertEqual(amounts.currencyDecimals('XYZ'), amounts.DEFAULT_DECIMALS)
+
+    def test_to_decimal(self):
+
+        self.assertEqual(amounts.toDecimal('0.10'), Decimal('0.10'))
+        self.assertEqual(amounts.toDecimal(12), Decimal(12))
+        self.assertIsNone(amounts.toDecimal(None))
+
+    def test_to_decimal_invalid(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            amounts.toDecimal('ten')
+
+        self.assertEqual(exc.exception.message, 'Invalid amount ten')
+
+    def test_to_minor_units(self):
+
+        self.assertEqual(amounts.toMinorUnits('10.5', 'USD'), 1050)
+        self.assertEqual(amounts.toMinorUnits('10.50', 'USD'), 1050)
+        self.assertEqual(amounts.toMinorUnits('1050', 'JPY'), 1050)
+        self.assertEqual(amounts.toMinorUnits('1.234', 'BHD'), 1234)
+        self.assertEqual(amounts.toMinorUnits('-0.01', 'USD'), -1)
+        self.assertEqual(amounts.toMinorUnits('1.500', 'USD'), 150)
+        self.assertEqual(amounts.toMinorUnits(2, 'USD'), 200)
+        self.assertIsNone(amounts.toMinorUnits(None, 'USD'))
+
+    def test_to_minor_units_more_decimals_than_currency(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            amounts.toMinorUnits('10.5', 'JPY')
+
+        self.assertEqual(exc.exception.message, 'Amount 10.5 has more decimals than its currency')
+
+    def test_from_minor_units(self):
+
+        self.assertEqual(str(amounts.fromMinorUnits(1050, 'USD')), '10.50')
+        self.assertEqual(str(amounts.fromMinorUnits(1050, 'JPY')), '1050')
+        self.assertEqual(str(amounts.fromMinorUnits(1234, 'BHD')), '1.234')
+
+    def test_parse_and_sum_minor_units(self):
+
+        values = ['0.10', '0.20', None, '1000', '0.005']
+        currencies = ['USD', 'USD', 'USD', 'JPY', 'KWD']
+
+        self.assertEqual(amounts.parseMinorUnits(values, currencies), [10, 20, None, 1000, 5])
+        self.assertEqual(amounts.sumMinorUnits(values, iter(currencies)), {'USD': 30, 'JPY': 1000, 'KWD': 5})
+
+
+if __name__ == '__main__':
+    unittest.main()
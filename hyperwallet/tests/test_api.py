@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import mock
+import threading
 import unittest
 import hyperwallet
 
@@ -35,6 +36,15 @@ class ApiInitializationTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'programToken is required')
 
+    @mock.patch('hyperwallet.utils.ApiClient.close')
+    def test_context_manager_closes_the_client(self, mock_close):
+
+        with hyperwallet.Api('username', 'password', 'programToken') as api:
+            self.assertIsInstance(api, hyperwallet.Api)
+            self.assertFalse(mock_close.called)
+
+        mock_close.assert_called_once_with()
+
 
 class ApiTest(unittest.TestCase):
 
@@ -130,6 +140,129 @@ class ApiTest(unittest.TestCase):
         response = self.api.listUsers()
 
         self.assertEqual(response[0].token, self.data.get('token'))
+        self.assertIsInstance(response, hyperwallet.ModelList)
+        self.assertIs(response.model, hyperwallet.User)
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_list_users_share_enum_values(self, mock_get):
+
+        mock_get.return_value = {'data': [
+            {'token': 'usr-1', 'status': ''.join(['ACTI', 'VATED'])},
+            {'token': 'usr-2', 'status': ''.join(['ACTIV', 'ATED'])}
+        ]}
+        response = self.api.listUsers()
+
+        self.assertIs(response[0].status, response[1].status)
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_get_user_in_identity_map_scope(self, mock_get):
+
+        mock_get.return_value = self.data
+        token = self.data.get('token')
+
+        with self.api.identityMap() as scope:
+            first = self.api.getUser(token)
+            second = self.api.getUser(token)
+
+            self.assertIs(first, second)
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertEqual((scope.hits, scope.misses), (1, 1))
+
+            scope.evict(first)
+            self.assertIsNot(self.api.getUser(token), first)
+
+        self.assertIsNot(self.api.getUser(token), first)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_created_transfer_methods_are_in_identity_map_scope(self, mock_request):
+
+        with self.api.identityMap() as scope:
+            for (methodType, model, get) in (
+                ('BANK_ACCOUNT', hyperwallet.BankAccount, self.api.getBankAccount),
+                ('BANK_CARD', hyperwallet.BankCard, self.api.getBankCard),
+                ('PAPER_CHECK', hyperwallet.PaperCheck, self.api.getPaperCheck)
+            ):
+                mock_request.return_value = {'token': 'trm-' + methodType, 'type': methodType}
+                created = self.api.createTransferMethod('usr-1', 'cache-1')
+
+                self.assertIsInstance(created, model)
+                self.assertIs(get('usr-1', created.token), created)
+
+            self.assertEqual(len(scope), 3)
+
+        self.assertEqual(mock_request.call_count, 3)
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_list_users_refresh_identity_map_models_in_place(self, mock_get):
+
+        mock_get.return_value = {'token': 'usr-1', 'status': 'PRE_ACTIVATED'}
+
+        with self.api.identityMap():
+            user = self.api.getUser('usr-1')
+
+            mock_get.return_value = {'data': [{'token': 'usr-1', 'status': 'ACTIVATED'}, {'token': 'usr-2'}]}
+            response = self.api.listUsers()
+
+        self.assertIs(response[0], user)
+        self.assertEqual(user.status, 'ACTIVATED')
+        self.assertEqual(response[1].token, 'usr-2')
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_identity_map_scope_is_per_thread(self, mock_get):
+
+        mock_get.side_effect = lambda *args, **kwargs: dict(self.data)
+        token = self.data.get('token')
+        opened = threading.Event()
+        closed = threading.Event()
+        seen = {}
+
+        def other():
+            with self.api.identityMap() as scope:
+                opened.set()
+                closed.wait(5)
+                seen['other'] = self.api.getUser(token)
+                seen['scope'] = scope
+            seen['after'] = self.api.getUser(token)
+
+        thread = threading.Thread(target=other)
+        with self.api.identityMap() as scope:
+            thread.start()
+            opened.wait(5)
+            user = self.api.getUser(token)
+        closed.set()
+        thread.join(5)
+
+        self.assertEqual(len(scope), 1)
+        self.assertEqual(len(seen['scope']), 1)
+        self.assertIsNot(seen['other'], user)
+        self.assertIsNot(seen['after'], seen['other'])
+        self.assertIsNot(self.api.getUser(token), user)
+        self.assertEqual(mock_get.call_count, 4)
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_list_users_projection(self, mock_get):
+
+        mock_get.return_value = {'data': [{'token': 'usr-1', 'status': 'ACTIVATED', 'email': 'a@example.com'}]}
+        response = self.api.listUsers({'limit': 10}, fields=['token', 'status'])
+
+        self.assertEqual(response[0]._raw_json, {'token': 'usr-1', 'status': 'ACTIVATED'})
+        self.assertEqual(response.fields, ['status', 'token'])
+        self.assertEqual(mock_get.call_args[1]['params'], {'limit': 10})
+
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_get_user_projection_is_forwarded_with_fields_param(self, mock_get):
+
+        mock_get.return_value = {'token': 'usr-1', 'email': 'a@example.com'}
+        self.api.fieldsParam = 'fields'
+
+        with self.api.identityMap() as scope:
+            response = self.api.getUser('usr-1', fields=['token'])
+
+            self.assertEqual(len(scope), 0)
+
+        self.assertEqual(response._raw_json, {'token': 'usr-1'})
+        self.assertEqual(mock_get.call_args[1]['params'], {'fields': 'token'})
 
     def test_get_user_status_transition_fail_need_user_token(self):
 
@@ -1409,6 +1542,24 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response.token, self.data.get('token'))
 
+    def test_create_payments_fail_need_data_list(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.api.createPayments()
+
+        self.assertEqual(exc.exception.message, 'dataList is required')
+
+    @mock.patch('hyperwallet.utils.ApiClient.doPipeline')
+    def test_create_payments_success(self, mock_pipeline):
+
+        error = HyperwalletException('failed')
+        mock_pipeline.return_value = [self.data, error]
+        response = self.api.createPayments([self.data, self.data])
+
+        self.assertEqual(response[0].token, self.data.get('token'))
+        self.assertIs(response[1], error)
+        self.assertEqual(mock_pipeline.call_args[0][0][0], {'method': 'POST', 'url': 'payments', 'data': self.data})
+
     def test_get_payment_fail_need_payment_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
@@ -1577,6 +1728,16 @@ class ApiTest(unittest.TestCase):
 
         self.assertTrue(response[0].currency, self.balance.get('currency'))
 
+    @mock.patch('hyperwallet.utils.ApiClient._makeRequest')
+    def test_list_user_receipts_columnar_success(self, mock_get):
+
+        mock_get.return_value = {'data': [{'currency': 'USD', 'amount': '10.00'}]}
+        response = self.api.listReceiptsForUser('token', columnar=True)
+
+        self.assertIsInstance(response, hyperwallet.ColumnarResult)
+        self.assertEqual(response.sum('amount', by='currency'), {'USD': 10.0})
+        self.assertEqual(response[0].amount, '10.00')
+
     def test_list_prepaid_card_receipts_fail_need_user_token(self):
 
         with self.assertRaises(HyperwalletException) as exc:
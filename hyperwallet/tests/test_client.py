@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 
+import sys
 import mock
 import json
 import unittest
 import os.path
+import subprocess
 
 from hyperwallet.utils import ApiClient
 from hyperwallet.config import SERVER
@@ -32,6 +34,17 @@ class ApiClientTest(unittest.TestCase):
             {'clientPrivateKeySetLocation': clientPath, 'hyperwalletKeySetLocation': hyperwalletPath}
         )
 
+    def test_close_closes_the_encryption_and_the_session(self):
+
+        self.clientWithEncryption.encryption = mock.Mock()
+        self.clientWithEncryption.session = mock.Mock()
+
+        with self.clientWithEncryption as client:
+            self.assertIs(client, self.clientWithEncryption)
+
+        client.encryption.close.assert_called_once_with()
+        client.session.close.assert_called_once_with()
+
     def test_failed_connection(self):
 
         with self.assertRaises(HyperwalletAPIException) as exc:
@@ -324,5 +337,46 @@ class ApiClientTest(unittest.TestCase):
         )
 
 
+class ApiClientImportTest(unittest.TestCase):
+
+    def loadedModules(self, code):
+
+        script = (
+            'import sys\n' + code + '\n'
+            'print(",".join(sorted(set(m.split(".")[0] for m in sys.modules))))'
+        )
+        packageRoot = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=packageRoot)
+
+        return output.decode('utf-8').strip().split(',')
+
+    def test_import_does_not_load_jose_libraries(self):
+
+        modules = self.loadedModules(
+            'import hyperwallet\n'
+            'hyperwallet.Api("test-user", "test-pass", "prg-12345")'
+        )
+
+        self.assertIn('hyperwallet', modules)
+        self.assertNotIn('jwcrypto', modules)
+        self.assertNotIn('jose', modules)
+
+    def test_encryption_loads_jose_libraries(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        modules = self.loadedModules(
+            'import hyperwallet\n'
+            'hyperwallet.Api("test-user", "test-pass", "prg-12345", encryptionData={{\n'
+            '    "clientPrivateKeySetLocation": {!r},\n'
+            '    "hyperwalletKeySetLocation": {!r}\n'
+            '}})'.format(
+                os.path.join(localDir, 'resources', 'private-jwkset1'),
+                os.path.join(localDir, 'resources', 'public-jwkset1')
+            )
+        )
+
+        self.assertIn('jwcrypto', modules)
+
+
 if __name__ == '__main__':
     unittest.main()
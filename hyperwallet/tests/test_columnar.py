@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+import math
+import unittest
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet import ColumnarResult, ModelList, Receipt, Transfer
+
+
+class ColumnarResultTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.rows = [
+            {'journalId': '1', 'entry': 'CREDIT', 'amount': '20.00', 'fee': '0.50', 'currency': 'USD', 'type': 'PAYMENT'},
+            {'journalId': '2', 'entry': 'DEBIT', 'amount': '5.25', 'currency': 'USD', 'type': 'TRANSFER_TO_BANK_ACCOUNT'},
+            {'journalId': '3', 'entry': 'CREDIT', 'amount': '1000', 'currency': 'JPY', 'type': 'PAYMENT'},
+            {'journalId': '4', 'entry': 'CREDIT', 'amount': '7.5', 'currency': 'CAD', 'type': 'PAYMENT', 'links': []}
+        ]
+        self.result = ColumnarResult(Receipt, self.rows)
+
+    def test_columns(self):
+
+        self.assertEqual(len(self.result), 4)
+        self.assertEqual(list(self.result.column('amount')), [20.0, 5.25, 1000.0, 7.5])
+        self.assertEqual(self.result.column('journalId'), ['1', '2', '3', '4'])
+
+        fee = self.result.column('fee')
+        self.assertEqual(fee[0], 0.5)
+        self.assertTrue(math.isnan(fee[1]))
+
+    def test_categorical_columns_store_every_value_once(self):
+
+        currency = self.result.column('currency')
+
+        self.assertEqual(currency.categories, ['USD', 'JPY', 'CAD'])
+        self.assertEqual(list(currency.codes), [0, 0, 1, 2])
+        self.assertEqual(currency[2], 'JPY')
+        self.assertEqual(currency.code('EUR'), -1)
+
+    def test_rows_are_models_built_on_demand(self):
+
+        receipt = self.result[1]
+
+        self.assertIsInstance(receipt, Receipt)
+        self.assertEqual(receipt.journalId, '2')
+        self.assertEqual(receipt.amount, '5.25')
+        self.assertIsNone(receipt.fee)
+        self.assertEqual(self.result[-2].amount, '1000')
+        self.assertEqual(self.result.row(3), dict((k, v) for (k, v) in self.rows[3].items() if k != 'links'))
+        self.assertEqual([receipt.journalId for receipt in self.result], ['1', '2', '3', '4'])
+
+        with self.assertRaises(IndexError):
+            self.result[4]
+
+    def test_amounts_beyond_float_precision_are_kept(self):
+
+        rows = [
+            {'amount': '12345678901234567.89', 'currency': 'USD'},
+            {'amount': '1e2', 'currency': 'USD'},
+            {'amount': '3.10', 'currency': 'USD'}
+        ]
+        result = ColumnarResult(Receipt, rows)
+
+        self.assertEqual([receipt.amount for receipt in result], ['12345678901234567.89', '1e2', '3.10'])
+        self.assertEqual(result.filter(currency='USD')[0].amount, '12345678901234567.89')
+        self.assertEqual(result.take([2, 0]).row(1)['amount'], '12345678901234567.89')
+
+    def test_slices(self):
+
+        result = self.result[1:3]
+
+        self.assertIsInstance(result, ColumnarResult)
+        self.assertEqual([receipt.journalId for receipt in result], ['2', '3'])
+        self.assertEqual([receipt.journalId for receipt in self.result[::-2]], ['4', '2'])
+
+    def test_transfer_amounts_are_columns(self):
+
+        result = ColumnarResult(Transfer, [
+            {'sourceAmount': '10.50', 'sourceCurrency': 'USD', 'destinationAmount': '14.00', 'destinationCurrency': 'CAD'},
+            {'sourceFeeAmount': '1.00', 'sourceCurrency': 'USD'}
+        ])
+
+        self.assertEqual(list(result.column('sourceAmount'))[:1], [10.5])
+        self.assertEqual(result[0].destinationAmount, '14.00')
+        self.assertEqual(result.sum('sourceFeeAmount', by='sourceCurrency'), {'USD': 1.0})
+        self.assertEqual(result.column('destinationCurrency').categories, ['CAD', None])
+
+    def test_empty_amounts_are_missing(self):
+
+        result = ColumnarResult(Receipt, [{'amount': '', 'currency': 'USD'}, {'amount': '2.50', 'currency': 'USD'}])
+
+        self.assertTrue(math.isnan(result.column('amount')[0]))
+        self.assertIsNone(result[0].amount)
+        self.assertEqual(result.sumMinorUnits(), {'USD': 250})
+
+    def test_invalid_amounts_name_their_field(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            ColumnarResult(Receipt, [{'fee': 'abc', 'currency': 'USD'}])
+
+        self.assertEqual(exc.exception.message, 'Invalid fee abc')
+
+    def test_sum(self):
+
+        self.assertEqual(self.result.sum('fee'), 0.5)
+        self.assertEqual(self.result.sum('amount', by='currency'), {'USD': 25.25, 'JPY': 1000.0, 'CAD': 7.5})
+
+    def test_sum_needs_amount_and_categorical_columns(self):
+
+        with self.assertRaises(ValueError) as exc:
+            self.result.sum('amount', by='journalId')
+
+        self.assertEqual(str(exc.exception), 'journalId is not a categorical column')
+
+        with self.assertRaises(ValueError) as exc:
+            self.result.sum('journalId')
+
+        self.assertEqual(str(exc.exception), 'journalId is not an amount column')
+
+    def test_sum_minor_units(self):
+
+        self.assertEqual(self.result.sumMinorUnits(), {'USD': 2525, 'JPY': 1000, 'CAD': 750})
+        self.assertEqual(self.result.sumMinorUnits('fee'), {'USD': 50})
+
+    def test_sum_minor_units_is_exact(self):
+
+        rows = [{'amount': '0.10', 'currency': 'USD'}, {'amount': '0.20', 'currency': 'USD'}] * 5
+        result = ColumnarResult(Receipt, rows)
+
+        self.assertNotEqual(result.sum('amount'), 1.5)
+        self.assertEqual(result.sumMinorUnits(), {'USD': 150})
+        self.assertEqual(ModelList(Receipt, [Receipt(row) for row in rows]).sumMinorUnits(), {'USD': 150})
+
+    def test_sum_minor_units_of_large_amounts_is_exact(self):
+
+        rows = [
+            {'amount': '12345678901234567.89', 'currency': 'USD'},
+            {'amount': '90071992547409.93', 'currency': 'USD'},
+            {'amount': '9007199254740.99', 'currency': 'USD'},
+            {'amount': '900719925474099', 'currency': 'JPY'}
+        ]
+        expected = {'USD': 1234567890123456789 + 9007199254740993 + 900719925474099, 'JPY': 900719925474099}
+
+        self.assertEqual(ColumnarResult(Receipt, rows).sumMinorUnits(), expected)
+        self.assertEqual(ModelList(Receipt, [Receipt(row) for row in rows]).sumMinorUnits(), expected)
+
+    def test_projection(self):
+
+        result = ColumnarResult(Receipt, self.rows, fields=['journalId', 'currency'])
+
+        self.assertEqual(result.fields, ['currency', 'journalId'])
+        self.assertEqual(result.row(2), {'journalId': '3', 'currency': 'JPY'})
+        self.assertEqual(result.filter(currency='USD').fields, ['currency', 'journalId'])
+
+    def test_filter(self):
+
+        credits = self.result.filter(entry='CREDIT', currency='USD')
+
+        self.assertEqual(len(credits), 1)
+        self.assertEqual(credits[0].journalId, '1')
+        self.assertEqual(credits.sum('amount', by='currency'), {'USD': 20.0})
+        self.assertEqual(len(self.result.filter(journalId='3')), 1)
+        self.assertEqual(len(self.result.filter(currency='EUR')), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+import os.path
+import time
+import unittest
+
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils import ApiClient
+from hyperwallet.utils.cryptopool import CryptoPool
+from hyperwallet.utils.encryption import Encryption
+
+
+class CryptoPoolTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        cls.encryptionData = {
+            'clientPrivateKeySetLocation': os.path.join(localDir, 'resources', 'private-jwkset1'),
+            'hyperwalletKeySetLocation': os.path.join(localDir, 'resources', 'public-jwkset1')
+        }
+        cls.pool = CryptoPool(cls.encryptionData, processes=2, chunkSize=2)
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.pool.close()
+
+    def test_encrypt_and_decrypt_in_workers(self):
+
+        testMessage = 'Message for test'
+        encryption = Encryption(**self.encryptionData)
+
+        self.assertEqual(encryption.decrypt(self.pool.encrypt(testMessage)), testMessage)
+        self.assertEqual(self.pool.decrypt(encryption.encrypt(testMessage)), testMessage)
+
+    def test_batches_keep_input_order(self):
+
+        testMessages = ['Message for test {}'.format(i) for i in range(7)]
+
+        encryptedMessages = self.pool.encryptMany(testMessages)
+        decryptedMessages = self.pool.decryptMany(encryptedMessages)
+
+        self.assertEqual(len(decryptedMessages), len(testMessages))
+        for (decryptedMessage, testMessage) in zip(decryptedMessages, testMessages):
+            self.assertEqual(decryptedMessage, testMessage)
+
+    def test_batch_failures_are_reported_per_item(self):
+
+        encryption = Encryption(**self.encryptionData)
+        encryptedMessages = [encryption.encrypt('first'), 'not.a.valid.jwe.token', encryption.encrypt('third')]
+
+        decryptedMessages = self.pool.decryptMany(encryptedMessages)
+
+        self.assertEqual(decryptedMessages[0], 'first')
+        self.assertIsInstance(decryptedMessages[1], HyperwalletException)
+        self.assertEqual(decryptedMessages[2], 'third')
+
+    def test_worker_errors_are_raised(self):
+
+        with self.assertRaises(HyperwalletException):
+            self.pool.decrypt('not.a.valid.jwe.token')
+
+    def test_encryption_with_processes(self):
+
+        testMessage = 'Message for test'
+        encryption = Encryption(processes=1, **self.encryptionData)
+        self.addCleanup(encryption.close)
+
+        self.assertEqual(encryption.decrypt(encryption.encrypt(testMessage)), testMessage)
+        self.assertIsInstance(encryption.cryptoPool, CryptoPool)
+
+    def test_invalid_key_sets_are_raised_before_starting_workers(self):
+
+        encryption = Encryption('/nonexistent', '/nonexistent2', processes=2)
+        self.addCleanup(encryption.close)
+        start = time.time()
+
+        with self.assertRaises(HyperwalletException) as exc:
+            encryption.encrypt('Message for test')
+
+        self.assertEqual(exc.exception.message, 'Wrong JWK key set location path = /nonexistent')
+        self.assertLess(time.time() - start, 5)
+
+    def test_worker_initialization_errors_are_raised_by_each_call(self):
+
+        pool = CryptoPool({
+            'clientPrivateKeySetLocation': '/nonexistent',
+            'hyperwalletKeySetLocation': '/nonexistent2'
+        }, processes=1)
+        self.addCleanup(pool.close)
+
+        for _ in range(2):
+            with self.assertRaises(HyperwalletException) as exc:
+                pool.encrypt('Message for test')
+
+            self.assertEqual(exc.exception.message, 'Wrong JWK key set location path = /nonexistent')
+
+    def test_api_client_close_stops_the_crypto_pool(self):
+
+        testMessage = 'Message for test'
+
+        with ApiClient('test-user', 'test-pass', SERVER, dict(processes=1, **self.encryptionData)) as client:
+            encryption = client.encryption
+            self.assertEqual(encryption.decrypt(encryption.encrypt(testMessage)), testMessage)
+            workers = list(encryption.cryptoPool.pool._pool)
+
+        self.assertTrue(all(not worker.is_alive() for worker in workers))
+
+
+if __name__ == '__main__':
+    unittest.main()
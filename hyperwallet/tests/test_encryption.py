@@ -5,6 +5,9 @@ import time
 import json
 import os.path
 import mock
+import shutil
+import tempfile
+import six
 
 from jwcrypto import jwk, jws as cryptoJWS
 from jwcrypto.common import json_encode
@@ -24,6 +27,18 @@ class EncryptionTest(unittest.TestCase):
         testMessage = 'Message for test'
         encryptedMessage = encryption.encrypt(testMessage)
         decryptedMessage = encryption.decrypt(encryptedMessage)
+        self.assertIsInstance(decryptedMessage, six.text_type)
+        self.assertEqual(decryptedMessage, testMessage)
+
+    def test_should_successfully_encrypt_and_decrypt_text_message_with_ec_keys(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        clientPath = os.path.join(localDir, 'resources', 'private-jwkset-ec')
+        hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset-ec')
+        encryption = Encryption(clientPath, hyperwalletPath, encryptionAlgorithm='ECDH-ES', signAlgorithm='ES256')
+        testMessage = 'Message for test'
+        encryptedMessage = encryption.encrypt(testMessage)
+        decryptedMessage = encryption.decrypt(encryptedMessage)
         self.assertEqual(decryptedMessage, testMessage)
 
     def test_should_fail_decryption_when_wrong_private_key_is_used(self):
@@ -214,6 +229,169 @@ class EncryptionTest(unittest.TestCase):
 
         self.assertEqual(exc.exception.message, 'expected string or buffer')
 
+    def test_should_load_jwk_key_sets_only_once(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        clientPath = os.path.join(directory, 'private-jwkset')
+        shutil.copy(os.path.join(localDir, 'resources', 'private-jwkset1'), clientPath)
+        hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+        encryption = Encryption(clientPath, hyperwalletPath)
+        testMessage = 'Message for test'
+        encryption.decrypt(encryption.encrypt(testMessage))
+
+        with open(clientPath, 'w') as f:
+            f.write('invalid jwkset')
+
+        with mock.patch('requests.get') as get_mock:
+            encryptedMessage = encryption.encrypt(testMessage)
+            encryption.decrypt(encryptedMessage)
+
+        self.assertFalse(get_mock.called)
+
+        with self.assertRaises(HyperwalletException) as exc:
+            encryption.reloadKeySets()
+
+        self.assertEqual(exc.exception.message, 'Wrong JWK key set invalid jwkset')
+
+    def test_should_reload_jwk_key_set_when_file_is_modified(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        clientPath = os.path.join(directory, 'private-jwkset')
+        shutil.copy(os.path.join(localDir, 'resources', 'private-jwkset1'), clientPath)
+        hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+        encryption = Encryption(clientPath, hyperwalletPath, checkKeySetModification=True)
+        encryption.encrypt('Message for test')
+
+        with open(clientPath, 'w') as f:
+            f.write('invalid jwkset')
+        modificationTime = os.path.getmtime(clientPath) + 10
+        os.utime(clientPath, (modificationTime, modificationTime))
+
+        with self.assertRaises(HyperwalletException) as exc:
+            encryption.encrypt('Message for test')
+
+        self.assertEqual(exc.exception.message, 'Wrong JWK key set invalid jwkset')
+
+    def test_should_not_prepare_keys_again_after_first_call(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        clientPath = os.path.join(localDir, 'resources', 'private-jwkset1')
+        hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+        encryption = Encryption(clientPath, hyperwalletPath)
+        testMessage = 'Message for test'
+        encryption.decrypt(encryption.encrypt(testMessage))
+
+        with mock.patch('hyperwallet.utils.keyset.jwk.JWK') as jwk_mock:
+            encryption.decrypt(encryption.encrypt(testMessage))
+
+        self.assertFalse(jwk_mock.called)
+
+    def test_should_decrypt_and_verify_with_keys_named_by_kid_during_rotation(self):
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        def generate(generation):
+            return [
+                jwk.JWK.generate(kty='RSA', size=2048, alg='RSA-OAEP-256', use='enc', kid=generation + '_enc'),
+                jwk.JWK.generate(kty='RSA', size=2048, alg='RS256', use='sig', kid=generation + '_sig')
+            ]
+
+        def write(name, keys, private):
+            path = os.path.join(directory, name)
+            with open(path, 'w') as f:
+                f.write(json.dumps({'keys': [json.loads(key.export(private_key=private)) for key in keys]}))
+            return path
+
+        oldClientKeys, newClientKeys = generate('old_client'), generate('new_client')
+        oldHyperwalletKeys, newHyperwalletKeys = generate('old_hw'), generate('new_hw')
+
+        client = Encryption(
+            write('client-private', oldClientKeys + newClientKeys, True),
+            write('hyperwallet-public', oldHyperwalletKeys + newHyperwalletKeys, False)
+        )
+        testMessage = 'Message for test'
+
+        for (clientKeys, hyperwalletKeys) in ((oldClientKeys, oldHyperwalletKeys), (newClientKeys, newHyperwalletKeys)):
+            hyperwallet = Encryption(
+                write('hyperwallet-private', hyperwalletKeys, True),
+                write('client-public', clientKeys, False)
+            )
+            self.assertEqual(client.decrypt(hyperwallet.encrypt(testMessage)), testMessage)
+
+    def test_should_select_ec_keys_without_algorithm_by_curve_and_use(self):
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        def write(name, keys, private):
+            path = os.path.join(directory, name)
+            with open(path, 'w') as f:
+                f.write(json.dumps({'keys': [json.loads(key.export(private_key=private)) for key in keys]}))
+            return path
+
+        # The RSA keys come first and must not be picked for EC algorithms.
+        clientKeys = [
+            jwk.JWK.generate(kty='RSA', size=2048, use='sig', kid='client_rsa'),
+            jwk.JWK.generate(kty='EC', crv='P-384', use='enc', kid='client_enc'),
+            jwk.JWK.generate(kty='EC', crv='P-384', use='sig', kid='client_sig')
+        ]
+        hyperwalletKeys = [
+            jwk.JWK.generate(kty='RSA', size=2048, use='enc', kid='hw_rsa'),
+            jwk.JWK.generate(kty='EC', crv='P-384', use='enc', kid='hw_enc'),
+            jwk.JWK.generate(kty='EC', crv='P-384', use='sig', kid='hw_sig')
+        ]
+        algorithms = {'encryptionAlgorithm': 'ECDH-ES+A256KW', 'signAlgorithm': 'ES384'}
+
+        client = Encryption(
+            write('client-private', clientKeys, True),
+            write('hyperwallet-public', hyperwalletKeys, False),
+            **algorithms
+        )
+        hyperwallet = Encryption(
+            write('hyperwallet-private', hyperwalletKeys, True),
+            write('client-public', clientKeys, False),
+            **algorithms
+        )
+        testMessage = 'Message for test'
+
+        encryptedMessage = client.encrypt(testMessage)
+
+        self.assertEqual(hyperwallet.decrypt(encryptedMessage), testMessage)
+        self.assertEqual(client.decrypt(hyperwallet.encrypt(testMessage)), testMessage)
+
+    def test_should_encrypt_and_decrypt_many_messages_in_input_order(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        clientPath = os.path.join(localDir, 'resources', 'private-jwkset1')
+        hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+        encryption = Encryption(clientPath, hyperwalletPath)
+        testMessages = ['Message for test {}'.format(i) for i in range(5)]
+
+        encryptedMessages = encryption.encryptMany(testMessages)
+        encryptedMessages[2] = 'not.a.valid.jwe.token'
+        decryptedMessages = encryption.decryptMany(encryptedMessages)
+
+        self.assertEqual(decryptedMessages[:2], testMessages[:2])
+        self.assertIsInstance(decryptedMessages[2], HyperwalletException)
+        self.assertEqual(decryptedMessages[3:], testMessages[3:])
+
+    def test_should_report_failure_for_every_message_when_keys_are_missing(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+        encryption = Encryption('wrong_keyset_path', hyperwalletPath)
+
+        results = encryption.encryptMany(['first', 'second'])
+
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertEqual(result.message, 'Wrong JWK key set location path = wrong_keyset_path')
+
     def __findJwkKeyByAlgorithm(self, jwkKeySet, algorithm):
         '''
         Finds JWK key by given algorithm.
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+import mock
+import unittest
+
+from hyperwallet import ColumnarResult, ModelList, Receipt, Transfer
+from hyperwallet.exceptions import HyperwalletException
+
+try:
+    import numpy
+    import pandas
+except ImportError:
+    numpy = pandas = None
+
+
+@unittest.skipIf(pandas is None, 'numpy and pandas are not installed')
+class ExportTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.rows = [
+            {'journalId': '1', 'amount': '20.00', 'currency': 'USD', 'createdOn': '2017-11-01T17:08:58', 'details': {'clientPaymentId': '1'}},
+            {'journalId': '2', 'amount': '1000', 'currency': 'JPY', 'createdOn': '2017-11-02T08:00:00', 'type': 'PAYMENT'},
+            {'journalId': '3'}
+        ]
+        self.results = (
+            ModelList(Receipt, [Receipt(row) for row in self.rows]),
+            ColumnarResult(Receipt, self.rows)
+        )
+
+    def test_to_numpy(self):
+
+        for result in self.results:
+            arrays = result.toNumpy()
+
+            self.assertEqual(arrays['amount'].dtype, numpy.float64)
+            self.assertEqual(list(arrays['amount'][:2]), [20.0, 1000.0])
+            self.assertTrue(numpy.isnan(arrays['amount'][2]))
+            self.assertEqual(arrays['createdOn'].dtype, numpy.dtype('datetime64[s]'))
+            self.assertEqual(arrays['createdOn'][1], numpy.datetime64('2017-11-02T08:00:00'))
+            self.assertTrue(numpy.isnat(arrays['createdOn'][2]))
+            self.assertEqual(list(arrays['currency']), ['USD', 'JPY', None])
+            self.assertEqual(arrays['details'][0], {'clientPaymentId': '1'})
+            self.assertEqual(arrays['details'].shape, (3,))
+
+    def test_to_data_frame(self):
+
+        for result in self.results:
+            frame = result.toDataFrame()
+
+            self.assertEqual(list(frame.columns), result.fields)
+            self.assertEqual(frame['amount'].dtype, numpy.float64)
+            self.assertTrue(str(frame['createdOn'].dtype).startswith('datetime64'))
+            self.assertEqual(frame['currency'].dtype.name, 'category')
+            self.assertEqual(list(frame['currency'].cat.categories), ['JPY', 'USD'] if isinstance(result, ModelList) else ['USD', 'JPY'])
+            self.assertTrue(pandas.isna(frame['currency'][2]))
+            self.assertEqual(frame.groupby('currency', observed=True)['amount'].sum().to_dict(), {'USD': 20.0, 'JPY': 1000.0})
+
+    def test_model_amounts_and_currencies(self):
+
+        rows = [
+            {'sourceAmount': '10.50', 'sourceFeeAmount': '1.00', 'sourceCurrency': 'USD', 'destinationFeeAmount': ''},
+            {'sourceAmount': '7.00', 'sourceCurrency': 'CAD'}
+        ]
+
+        frame = ModelList(Transfer, [Transfer(row) for row in rows]).toDataFrame()
+
+        for field in ('sourceAmount', 'sourceFeeAmount', 'destinationFeeAmount'):
+            self.assertEqual(frame[field].dtype, numpy.float64)
+        self.assertEqual(frame['sourceCurrency'].dtype.name, 'category')
+        self.assertTrue(numpy.isnan(frame['destinationFeeAmount'][0]))
+
+
+class ExportDependencyTest(unittest.TestCase):
+
+    @mock.patch('importlib.import_module', side_effect=ImportError)
+    def test_missing_dependency(self, import_mock):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            ModelList(Receipt).toDataFrame()
+
+        self.assertEqual(
+            exc.exception.message,
+            'pandas is required for this export, install it with: pip install pandas'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
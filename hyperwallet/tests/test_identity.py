@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+import gc
+import unittest
+
+from hyperwallet import BankAccount, IdentityMap, Receipt, User
+
+
+class IdentityMapTest(unittest.TestCase):
+
+    def test_add_maps_models_by_class_and_token(self):
+
+        identityMap = IdentityMap()
+        user = identityMap.add(User, {'token': 'usr-1'})
+
+        self.assertIs(identityMap.add(User, {'token': 'usr-1'}), user)
+        self.assertIsNot(identityMap.add(BankAccount, {'token': 'usr-1'}), user)
+        self.assertIs(identityMap.get(User, 'usr-1'), user)
+        self.assertIsNone(identityMap.get(User, 'usr-2'))
+        self.assertIn(user, identityMap)
+        self.assertEqual(len(identityMap), 2)
+
+    def test_add_refreshes_models_in_place(self):
+
+        identityMap = IdentityMap()
+        user = identityMap.add(User, {'token': 'usr-1', 'status': 'PRE_ACTIVATED'})
+        user.email = 'old@example.com'
+        str(user)
+
+        identityMap.add(User, {'token': 'usr-1', 'status': 'ACTIVATED', 'email': 'new@example.com'})
+
+        self.assertEqual(user.status, 'ACTIVATED')
+        self.assertEqual(user.email, 'new@example.com')
+        self.assertIn('ACTIVATED', str(user))
+
+    def test_add_keeps_models_without_raw_json(self):
+
+        identityMap = IdentityMap()
+        user = identityMap.add(User, {'token': 'usr-1'})
+        user.__init__({'token': 'usr-1'}, keepRawJson=False)
+
+        identityMap.add(User, {'token': 'usr-1', 'status': 'ACTIVATED'})
+
+        self.assertIsNone(user._raw_json)
+        self.assertEqual(user.status, 'ACTIVATED')
+
+    def test_models_without_token_are_not_mapped(self):
+
+        identityMap = IdentityMap()
+        receipt = identityMap.add(Receipt, {'journalId': '1'})
+
+        self.assertIsInstance(receipt, Receipt)
+        self.assertEqual(len(identityMap), 0)
+
+    def test_evict_and_clear(self):
+
+        identityMap = IdentityMap()
+        user = identityMap.add(User, {'token': 'usr-1'})
+        identityMap.add(User, {'token': 'usr-2'})
+
+        identityMap.evict(user)
+        self.assertNotIn(user, identityMap)
+        self.assertEqual(len(identityMap), 1)
+
+        identityMap.clear()
+        self.assertEqual(len(identityMap), 0)
+
+    def test_weak_identity_map(self):
+
+        identityMap = IdentityMap(weak=True)
+        user = identityMap.add(User, {'token': 'usr-1'})
+
+        self.assertIs(identityMap.get(User, 'usr-1'), user)
+
+        del user
+        gc.collect()
+        self.assertIsNone(identityMap.get(User, 'usr-1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import unittest
+
+from hyperwallet import interning
+
+
+class InterningTest(unittest.TestCase):
+
+    def setUp(self):
+
+        interning._values.clear()
+
+    def tearDown(self):
+
+        interning._values.clear()
+
+    def test_intern_rows_shares_values(self):
+
+        rows = [
+            {'token': 'pmt-1', 'currency': ''.join(['U', 'SD']), 'status': 'COMPLETED'},
+            {'token': 'pmt-2', 'currency': ''.join(['US', 'D'])},
+            {'token': 'pmt-3', 'currency': None}
+        ]
+
+        self.assertIs(interning.internRows(rows), rows)
+        self.assertIs(rows[0]['currency'], rows[1]['currency'])
+        self.assertIsNone(rows[2]['currency'])
+        self.assertNotIn('status', rows[1])
+
+    def test_intern_rows_only_given_fields(self):
+
+        rows = [{'token': ''.join(['a', 'b'])}, {'token': ''.join(['a', 'b'])}]
+        interning.internRows(rows)
+
+        self.assertIsNot(rows[0]['token'], rows[1]['token'])
+
+    def test_intern_rows_skips_other_values(self):
+
+        rows = [{'type': {'nested': True}}, {'type': 5}]
+        interning.internRows(rows)
+
+        self.assertEqual(rows, [{'type': {'nested': True}}, {'type': 5}])
+
+    def test_table_is_bounded(self):
+
+        for i in range(interning.CACHE_SIZE + 10):
+            interning.internValue('value-%d' % i)
+
+        self.assertEqual(len(interning._values), interning.CACHE_SIZE)
+
+        value = ''.join(['value-', 'extra'])
+        self.assertIs(interning.internValue(value), value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+
+import mock
+import os
+import time
+import threading
+import unittest
+
+from six.moves import BaseHTTPServer, socketserver
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils.encryption import Encryption
+from hyperwallet.utils.jwks import JwksFetcher
+
+RESOURCES = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'resources')
+
+
+class KeySetHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+
+        server = self.server
+        server.requests.append(dict(self.headers.items()))
+
+        if server.failing:
+            self.reply(500, b'')
+            return
+
+        path = os.path.join(RESOURCES, os.path.basename(self.path))
+        if not os.path.isfile(path):
+            self.reply(404, b'')
+            return
+
+        etag = '"{}"'.format(server.version)
+        if self.headers.get('If-None-Match') == etag:
+            self.reply(304, None, etag)
+            return
+
+        with open(path, 'rb') as f:
+            self.reply(200, f.read(), etag)
+
+    def reply(self, status, content, etag=None):
+
+        self.send_response(status)
+        self.send_header('Cache-Control', self.server.cacheControl)
+        if etag is not None:
+            self.send_header('ETag', etag)
+        if content is not None:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if content:
+            self.wfile.write(content)
+
+    def log_message(self, format, *args):
+
+        pass
+
+
+class KeySetServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+
+
+class JwksFetcherTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.server = KeySetServer(('127.0.0.1', 0), KeySetHandler)
+        self.server.requests = []
+        self.server.failing = False
+        self.server.version = 1
+        self.server.cacheControl = 'max-age=300'
+
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        self.baseUrl = 'http://127.0.0.1:{}/'.format(self.server.server_address[1])
+
+    def tearDown(self):
+
+        self.server.shutdown()
+        self.server.server_close()
+
+    def waitForRequests(self, count):
+
+        deadline = time.time() + 5
+        while len(self.server.requests) < count and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+
+    def test_key_set_is_fetched_once_while_fresh(self):
+
+        fetcher = JwksFetcher(self.baseUrl + 'public-jwkset1')
+
+        with open(os.path.join(RESOURCES, 'public-jwkset1')) as f:
+            self.assertEqual(fetcher.get(), f.read())
+
+        fetcher.get()
+        fetcher.get()
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(fetcher.version, 1)
+
+    def test_refresh_is_conditional(self):
+
+        fetcher = JwksFetcher(self.baseUrl + 'public-jwkset1', refreshAhead=300, minRefreshInterval=0)
+        fetcher.get()
+
+        text = fetcher.get()
+        self.waitForRequests(2)
+
+        self.assertEqual(self.server.requests[1].get('If-None-Match'), '"1"')
+        self.assertIs(fetcher.get(), text)
+        self.assertEqual(fetcher.version, 1)
+
+    def test_changed_key_set_is_picked_up_in_background(self):
+
+        self.server.cacheControl = 'max-age=0'
+        fetcher = JwksFetcher(self.baseUrl + 'public-jwkset1', minRefreshInterval=0)
+        fetcher.get()
+
+        self.server.version = 2
+        fetcher.get()
+        self.waitForRequests(2)
+
+        self.assertEqual(fetcher.version, 2)
+        self.assertEqual(fetcher.etag, '"2"')
+
+    def test_uncacheable_key_set_is_refreshed_at_most_every_min_refresh_interval(self):
+
+        self.server.cacheControl = 'no-cache'
+        fetcher = JwksFetcher(self.baseUrl + 'public-jwkset1')
+        fetcher.get()
+
+        for _ in range(20):
+            fetcher.get()
+        time.sleep(0.1)
+
+        self.assertEqual(len(self.server.requests), 1)
+
+        fetcher.refreshAt -= fetcher.minRefreshInterval
+        fetcher.get()
+        self.waitForRequests(2)
+
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_last_good_key_set_is_served_while_refresh_fails(self):
+
+        self.server.cacheControl = 'no-cache'
+        fetcher = JwksFetcher(self.baseUrl + 'public-jwkset1', retryInterval=300, minRefreshInterval=0)
+        text = fetcher.get()
+
+        self.server.failing = True
+
+        self.assertIs(fetcher.get(), text)
+        self.waitForRequests(2)
+        self.assertIs(fetcher.get(), text)
+        self.assertIsNotNone(fetcher.lastError)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_first_fetch_failure_is_raised(self):
+
+        fetcher = JwksFetcher(self.baseUrl + 'missing-jwkset')
+
+        with self.assertRaises(HyperwalletException) as exc:
+            fetcher.get()
+
+        self.assertEqual(
+            exc.exception.message,
+            'Failed to fetch JWK key set from ' + self.baseUrl + 'missing-jwkset'
+        )
+
+    def test_encryption_creates_one_fetcher_per_url_across_threads(self):
+
+        created = []
+
+        def slowFetcher(*args, **kwargs):
+            created.append(args)
+            time.sleep(0.05)
+            return mock.Mock()
+
+        encryption = Encryption(self.baseUrl + 'private-jwkset1', self.baseUrl + 'public-jwkset1')
+        fetchers = []
+
+        with mock.patch('hyperwallet.utils.encryption.JwksFetcher', side_effect=slowFetcher):
+            threads = [
+                threading.Thread(target=lambda: fetchers.append(
+                    encryption._Encryption__getFetcher(self.baseUrl + 'public-jwkset1')
+                ))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(fetchers), 8)
+        self.assertTrue(all(fetcher is fetchers[0] for fetcher in fetchers))
+
+    def test_encryption_with_key_sets_from_url(self):
+
+        encryption = Encryption(
+            self.baseUrl + 'private-jwkset1',
+            self.baseUrl + 'public-jwkset1'
+        )
+        testMessage = 'Message for test'
+
+        for _ in range(3):
+            decryptedMessage = encryption.decrypt(encryption.encrypt(testMessage))
+
+        self.assertEqual(decryptedMessage, testMessage)
+        self.assertEqual(len(self.server.requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+import json
+import os.path
+import unittest
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils.keyset import JwkKeySet
+
+
+class JwkKeySetTest(unittest.TestCase):
+
+    def setUp(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        with open(os.path.join(localDir, 'resources', 'private-jwkset1')) as f:
+            self.keySet = JwkKeySet(json.load(f))
+
+    def test_find_by_algorithm(self):
+
+        key = self.keySet.findByAlgorithm('RS256')
+
+        self.assertEqual(key.kid, '2018_sig_rsa_RS256_2048')
+        self.assertEqual(key.use, 'sig')
+        self.assertTrue(key.key.has_private)
+
+    def test_find_by_algorithm_fail_unknown_algorithm(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            self.keySet.findByAlgorithm('ES256')
+
+        self.assertEqual(exc.exception.message, 'JWK set doesn\'t contain key with algorithm = ES256')
+
+    def test_find_by_kid_and_use(self):
+
+        self.assertEqual(
+            self.keySet.find(kid='2018_enc_rsa_RSA-OAEP-256').alg,
+            'RSA-OAEP-256'
+        )
+        self.assertEqual(self.keySet.find(use='sig').alg, 'RS256')
+        self.assertEqual(
+            self.keySet.find('RS256', '2018_sig_rsa_RS256_2048', 'sig'),
+            self.keySet.findByAlgorithm('RS256')
+        )
+        self.assertIsNone(self.keySet.find('RS256', use='enc'))
+
+    def test_keys_are_prepared_once(self):
+
+        self.assertIs(
+            self.keySet.findByAlgorithm('RS256').key,
+            self.keySet.find(kid='2018_sig_rsa_RS256_2048').key
+        )
+
+    def test_first_matching_key_wins(self):
+
+        keySet = JwkKeySet({
+            'keys': [
+                {'kty': 'oct', 'k': 'AAAA', 'alg': 'HS256', 'kid': 'first'},
+                {'kty': 'oct', 'k': 'BBBB', 'alg': 'HS256', 'kid': 'second'}
+            ]
+        })
+
+        self.assertEqual(keySet.findByAlgorithm('HS256').kid, 'first')
+        self.assertEqual(keySet.find('HS256', 'second').kid, 'second')
+
+    def test_find_by_kid(self):
+
+        keySet = JwkKeySet({
+            'keys': [
+                {'kty': 'oct', 'k': 'AAAA', 'alg': 'HS256', 'kid': 'old'},
+                {'kty': 'oct', 'k': 'BBBB', 'alg': 'HS256', 'kid': 'new'},
+                {'kty': 'oct', 'k': 'CCCC', 'alg': 'HS512', 'kid': 'other'}
+            ]
+        })
+
+        self.assertEqual(keySet.findByKid('new', 'HS256').kid, 'new')
+        self.assertEqual(keySet.findByKid('unknown', 'HS256').kid, 'old')
+        self.assertEqual(keySet.findByKid(None, 'HS256').kid, 'old')
+        self.assertEqual(keySet.findByKid('other', 'HS256').kid, 'old')
+
+    def test_find_key_without_algorithm_by_key_type(self):
+
+        keySet = JwkKeySet({
+            'keys': [
+                {'kty': 'oct', 'k': 'AAAA', 'kid': 'secret'},
+                {'kty': 'EC', 'crv': 'P-256', 'use': 'sig', 'kid': 'ec-sig',
+                 'x': 'jK7GQ-qx5ump-WTP-CE7C2ibaWarGCXOr__zgnAqUo8', 'y': 'fEdv4KQRGT8ahvbkYOWV_avjga3Vlq418ek-Rh4B64k'},
+                {'kty': 'EC', 'crv': 'P-256', 'use': 'enc', 'kid': 'ec-enc',
+                 'x': 'jK7GQ-qx5ump-WTP-CE7C2ibaWarGCXOr__zgnAqUo8', 'y': 'fEdv4KQRGT8ahvbkYOWV_avjga3Vlq418ek-Rh4B64k'}
+            ]
+        })
+
+        self.assertEqual(keySet.findByAlgorithm('ES256').kid, 'ec-sig')
+        self.assertEqual(keySet.findByAlgorithm('ECDH-ES').kid, 'ec-enc')
+        self.assertEqual(keySet.findByKid('ec-enc', 'ECDH-ES+A256KW').kid, 'ec-enc')
+        self.assertIsNone(keySet.find('ES384'))
+        self.assertIsNone(keySet.find('RS256'))
+        self.assertEqual(keySet.find(kid='secret').algorithms, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,10 @@
 import json
 import unittest
 
+from datetime import datetime
+from decimal import Decimal
+
+from hyperwallet.exceptions import HyperwalletException
 from hyperwallet import (
     HyperwalletModel,
     User,
@@ -23,6 +27,7 @@ from hyperwallet import (
     TransferMethodConfiguration,
     Webhook
 )
+from hyperwallet.models import WEBHOOK_OBJECTS, webhookObjectModel
 
 
 class ModelTest(unittest.TestCase):
@@ -120,6 +125,152 @@ class ModelTest(unittest.TestCase):
             json.dumps(test_hyperwallet.asDict(), sort_keys=True)
         )
 
+    def test_hyperwallet_model_compact_json_string(self):
+
+        test_hyperwallet = HyperwalletModel(self.simple_data)
+
+        self.assertEqual(
+            json.dumps(self.simple_data, sort_keys=True, separators=(',', ':')),
+            test_hyperwallet.asJsonString(compact=True)
+        )
+
+        HyperwalletModel.compactJson = True
+        self.addCleanup(setattr, HyperwalletModel, 'compactJson', False)
+
+        self.assertEqual(test_hyperwallet.asJsonString(compact=True), str(test_hyperwallet))
+
+    def test_hyperwallet_model_json_string_is_memoized(self):
+
+        test_user = User(self.hyperwallet_data, keepRawJson=False)
+
+        self.assertIs(test_user.asJsonString(), str(test_user))
+        self.assertIsNot(test_user.asJsonString(compact=True), test_user.asJsonString())
+
+    def test_hyperwallet_model_json_string_follows_source_dictionary(self):
+
+        data = dict(self.hyperwallet_data)
+        test_user = User(data)
+        str(test_user)
+        data['email'] = 'changed@example.com'
+
+        self.assertEqual(test_user.email, 'changed@example.com')
+        self.assertEqual(json.loads(str(test_user))['email'], 'changed@example.com')
+        self.assertIsNone(test_user._serialized)
+
+    def test_hyperwallet_model_json_string_follows_nested_values(self):
+
+        receipt = Receipt({'token': 'r', 'details': {'a': 1}}, keepRawJson=False)
+        str(receipt)
+        receipt.details['a'] = 2
+
+        self.assertEqual(json.loads(receipt.asJsonString())['details'], {'a': 2})
+        self.assertEqual(json.loads(str(receipt))['details'], {'a': 2})
+
+    def test_hyperwallet_model_json_string_follows_nested_models(self):
+
+        webhook = Webhook({'token': 'wbh-1', 'type': 'USERS.CREATED', 'object': {'token': 'usr-1'}}, keepRawJson=False)
+        str(webhook)
+        webhook.object.email = 'changed@example.com'
+
+        self.assertEqual(json.loads(str(webhook))['object']['email'], 'changed@example.com')
+
+    def test_hyperwallet_model_assignment_resets_json_string(self):
+
+        test_user = User(self.hyperwallet_data, keepRawJson=False)
+        before = str(test_user)
+        test_user.firstName = 'Changed'
+
+        self.assertNotEqual(str(test_user), before)
+        self.assertEqual(json.loads(str(test_user))['firstName'], 'Changed')
+
+    def test_hyperwallet_model_as_dict_copies_lists(self):
+
+        data = {'token': 'usr-12345', 'links': [{'rel': 'self'}], 'empty': [], 'blank': ''}
+        result = HyperwalletModel(data).asDict()
+
+        self.assertEqual(result, {'token': 'usr-12345', 'links': [{'rel': 'self'}], 'empty': []})
+        self.assertIsNot(result['links'], data['links'])
+
+    def test_hyperwallet_model_has_slots_and_class_level_fields(self):
+
+        test_bank_account = BankAccount(self.transfer_method_data)
+
+        self.assertFalse(hasattr(test_bank_account, '__dict__'))
+        self.assertIn(('token', None), BankAccount._fields)
+        self.assertIn(('bankAccountId', None), BankAccount._fields)
+        self.assertNotIn('token', BankAccount.__slots__)
+        self.assertIsNone(test_bank_account.bankAccountId)
+
+        with self.assertRaises(AttributeError):
+            test_bank_account.unknown = 'value'
+
+    def test_hyperwallet_model_reads_attributes_from_raw_json(self):
+
+        data = dict(self.user_data)
+        test_user = User(data)
+
+        self.assertIs(test_user._raw_json, data)
+        self.assertIsNone(test_user._values)
+        self.assertIsNone(test_user.email)
+
+        data['email'] = 'user@example.com'
+        self.assertEqual(test_user.email, 'user@example.com')
+
+    def test_hyperwallet_model_assignment_does_not_change_raw_json(self):
+
+        test_user = User(self.user_data)
+        test_user.token = 'usr-67890'
+
+        self.assertEqual(test_user.token, 'usr-67890')
+        self.assertEqual(self.user_data['token'], 'usr-12345')
+        self.assertEqual(test_user.asDict()['token'], 'usr-12345')
+
+    def test_hyperwallet_model_projection(self):
+
+        test_user = User(self.hyperwallet_data, fields=['token', 'email', 'links'])
+
+        self.assertEqual(sorted(test_user._raw_json), ['links', 'token'])
+        self.assertEqual(test_user.token, self.hyperwallet_data['token'])
+        self.assertIsNone(test_user.firstName)
+
+        test_user = User(self.hyperwallet_data, keepRawJson=False, fields=['token', 'links'])
+
+        self.assertEqual(test_user._values, {'token': self.hyperwallet_data['token']})
+
+    def test_transfer_method_configuration_projection(self):
+
+        test_configuration = TransferMethodConfiguration(
+            {'countries': ['CA'], 'currencies': ['CAD'], 'type': 'BANK_ACCOUNT'},
+            fields=['type', 'country']
+        )
+
+        self.assertEqual(test_configuration.country, 'CA')
+        self.assertIsNone(test_configuration.currency)
+        self.assertEqual(test_configuration.type, 'BANK_ACCOUNT')
+
+    def test_hyperwallet_model_fields_are_class_level_descriptors(self):
+
+        self.assertEqual(User.token.name, 'token')
+        self.assertIs(BankAccount.token, TransferMethod.token)
+        self.assertIsNot(BankAccount.bankAccountId, None)
+
+    def test_hyperwallet_model_without_raw_json(self):
+
+        test_user = User(self.hyperwallet_data, keepRawJson=False)
+
+        self.assertIsNone(test_user._raw_json)
+        self.assertEqual(test_user.firstName, 'Hyperwallet')
+        self.assertEqual(test_user.asDict()['token'], self.hyperwallet_data['token'])
+        self.assertNotIn('links', test_user.asDict())
+
+    def test_hyperwallet_model_without_raw_json_by_default(self):
+
+        User.keepRawJson = False
+        self.addCleanup(delattr, User, 'keepRawJson')
+
+        self.assertIsNone(User(self.user_data)._raw_json)
+        self.assertEqual(Payment(self.user_data)._raw_json, self.user_data)
+
     '''
 
     User
@@ -304,6 +455,45 @@ class ModelTest(unittest.TestCase):
             )
         )
 
+    def test_payment_amount_as_decimal_and_minor_units(self):
+
+        test_payment = Payment({'amount': '10.05', 'currency': 'USD'})
+
+        self.assertEqual(test_payment.asDecimal(), Decimal('10.05'))
+        self.assertEqual(test_payment.asMinorUnits(), 1005)
+        self.assertIsNone(Payment({'currency': 'USD'}).asMinorUnits())
+
+    def test_transfer_amounts_use_their_own_currency(self):
+
+        test_transfer = Transfer({
+            'sourceAmount': '1000',
+            'sourceCurrency': 'JPY',
+            'destinationAmount': '9.125',
+            'destinationCurrency': 'BHD'
+        })
+
+        self.assertEqual(test_transfer.asMinorUnits('sourceAmount'), 1000)
+        self.assertEqual(test_transfer.asMinorUnits('destinationAmount'), 9125)
+
+    def test_minor_units_of_other_attributes_are_rejected(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            Payment({'amount': '10.05', 'currency': 'USD'}).asMinorUnits('currency')
+
+        self.assertEqual(exc.exception.message, 'currency is not an amount of Payment')
+
+    def test_payment_timestamps_as_datetime(self):
+
+        test_payment = Payment({'createdOn': '2017-01-01T10:30:00'})
+
+        self.assertEqual(test_payment.asDatetime(), datetime(2017, 1, 1, 10, 30))
+        self.assertIsNone(test_payment.asDatetime('expiresOn'))
+
+        with self.assertRaises(HyperwalletException) as exc:
+            test_payment.asDatetime('token')
+
+        self.assertEqual(exc.exception.message, 'token is not a timestamp of Payment')
+
     '''
 
     Balance
@@ -510,6 +700,55 @@ class ModelTest(unittest.TestCase):
 
         self.assertEqual(test_webhook.object, webhook_data.get('object'))
 
+    def test_webhook_model_without_raw_json(self):
+
+        webhook_data = {
+            'token': 'wbh-12345',
+            'type': 'USERS.CREATED',
+            'object': self.user_data
+        }
+
+        test_webhook = Webhook(webhook_data, keepRawJson=False)
+
+        self.assertIsNone(test_webhook.object._raw_json)
+        self.assertEqual(test_webhook.asDict()['object'], self.user_data)
+
+    def test_webhook_model_object_types(self):
+
+        for (notificationType, model) in (
+            ('USERS.UPDATED.STATUS.ACTIVATED', User),
+            ('USERS.BANK_CARDS.CREATED', BankCard),
+            ('USERS.PAPER_CHECKS.UPDATED.STATUS.BANKED', PaperCheck),
+            ('USERS.PAYPAL_ACCOUNTS.CREATED', PayPalAccount),
+            ('USERS.PREPAID_CARDS.CREATED', PrepaidCard),
+            ('PAYMENTS.UPDATED.STATUS.COMPLETED', Payment),
+            ('TRANSFERS.CREATED', Transfer)
+        ):
+            test_webhook = Webhook({'type': notificationType, 'object': {'token': 'tkn-12345'}})
+
+            self.assertIsInstance(test_webhook.object, model)
+            self.assertEqual(test_webhook.object.token, 'tkn-12345')
+
+    def test_webhook_model_object_is_built_on_first_access(self):
+
+        test_webhook = Webhook({'type': 'USERS.CREATED', 'object': self.user_data})
+
+        self.assertIsNone(test_webhook._values)
+        self.assertIs(test_webhook.object, test_webhook.object)
+        self.assertIs(test_webhook.object._raw_json, self.user_data)
+
+    def test_webhook_model_object_registry(self):
+
+        self.assertIs(webhookObjectModel('USERS.BANK_ACCOUNTS.CREATED'), BankAccount)
+        self.assertIs(webhookObjectModel('PAYMENTS.CREATED'), Payment)
+        self.assertIsNone(webhookObjectModel('PROGRAMS.CREATED'))
+        self.assertIsNone(webhookObjectModel(None))
+
+        WEBHOOK_OBJECTS['PROGRAMS'] = Program
+        self.addCleanup(WEBHOOK_OBJECTS.pop, 'PROGRAMS')
+
+        self.assertIsInstance(Webhook({'type': 'PROGRAMS.CREATED', 'object': {}}).object, Program)
+
 
 if __name__ == '__main__':
     unittest.main()
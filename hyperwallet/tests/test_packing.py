@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+import pickle
+import unittest
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.models import loadModel
+from hyperwallet import (
+    Payment,
+    TransferMethodConfiguration,
+    User,
+    Webhook,
+    packModels,
+    unpackModels
+)
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class PackingTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.user_data = {
+            'token': 'usr-12345',
+            'status': 'ACTIVATED',
+            'firstName': 'John',
+            'links': [{'params': {'rel': 'self'}, 'href': 'https://api.sandbox.hyperwallet.com/rest/v3/users/usr-12345'}]
+        }
+        self.models = [
+            User(self.user_data),
+            Payment({'token': 'pmt-12345', 'amount': '20.00', 'currency': 'USD'}, keepRawJson=False),
+            TransferMethodConfiguration({'countries': ['CA'], 'currencies': ['CAD'], 'type': 'BANK_ACCOUNT'}),
+            Webhook({'token': 'wbh-12345', 'type': 'USERS.CREATED', 'object': dict(self.user_data)})
+        ]
+
+    def assertSameModels(self, models):
+
+        self.assertEqual([type(model) for model in models], [type(model) for model in self.models])
+        self.assertEqual([model.asDict() for model in models], [model.asDict() for model in self.models])
+        self.assertEqual(models[2].country, 'CA')
+        self.assertIsInstance(models[3].object, User)
+        self.assertEqual(models[3].object.firstName, 'John')
+
+    def test_pickle_models(self):
+
+        self.assertSameModels(pickle.loads(pickle.dumps(self.models, pickle.HIGHEST_PROTOCOL)))
+
+    def test_pickle_is_by_name_and_leaves_out_memoized_json(self):
+
+        user = User({'token': 'usr-12345'})
+        size = len(pickle.dumps(user, pickle.HIGHEST_PROTOCOL))
+        str(user)
+
+        self.assertIn(b'token', pickle.dumps(user, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(len(pickle.dumps(user, pickle.HIGHEST_PROTOCOL)), size)
+        self.assertEqual(pickle.loads(pickle.dumps(user)).asJsonString(), user.asJsonString())
+
+    def test_pickle_keeps_assigned_attributes(self):
+
+        user = User(self.user_data)
+        user.email = 'john@company.com'
+
+        self.assertEqual(pickle.loads(pickle.dumps(user)).email, 'john@company.com')
+
+    def test_pack_models_with_pickle(self):
+
+        data = packModels(self.models, format='pickle')
+
+        self.assertSameModels(unpackModels(data))
+
+    @unittest.skipIf(msgpack is None, 'msgpack is not installed')
+    def test_pack_models_with_msgpack(self):
+
+        data = packModels(self.models)
+
+        self.assertEqual(data[:1], b'M')
+        self.assertSameModels(unpackModels(data))
+
+    def test_pack_models_leaves_out_field_names(self):
+
+        data = packModels([User({'token': 'usr-12345', 'firstName': 'John'})], format='pickle')
+
+        self.assertNotIn(b'firstName', data)
+        self.assertEqual(unpackModels(data)[0].firstName, 'John')
+
+    def test_load_model_with_other_field_table(self):
+
+        state = User(self.user_data).packState()
+
+        self.assertEqual(loadModel(User, *state).firstName, 'John')
+
+        with self.assertRaises(HyperwalletException) as exc:
+            loadModel(User, state[0] ^ 1, *state[1:])
+
+        self.assertEqual(exc.exception.message, 'User was packed with a different field table')
+
+    def test_pack_models_unknown_format(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            packModels(self.models, format='xml')
+
+        self.assertEqual(exc.exception.message, 'Unknown format xml')
+
+    def test_unpack_models_invalid_data(self):
+
+        with self.assertRaises(HyperwalletException) as exc:
+            unpackModels(b'{}')
+
+        self.assertEqual(exc.exception.message, 'Unknown packed models')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+import mock
+import json
+import unittest
+import os.path
+
+from hyperwallet.utils import ApiClient
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletAPIException
+from hyperwallet.utils.encryption import Encryption
+from hyperwallet.utils.pipeline import RequestPipeline
+
+
+class RequestPipelineTest(unittest.TestCase):
+
+    def setUp(self):
+
+        localDir = os.path.abspath(os.path.dirname(__file__))
+        clientPath = os.path.join(localDir, 'resources', 'private-jwkset1')
+        hyperwalletPath = os.path.join(localDir, 'resources', 'public-jwkset1')
+
+        self.client = ApiClient('test-user', 'test-pass', SERVER)
+        self.clientWithEncryption = ApiClient(
+            'test-user',
+            'test-pass',
+            SERVER,
+            {'clientPrivateKeySetLocation': clientPath, 'hyperwalletKeySetLocation': hyperwalletPath}
+        )
+        # Both sides use the jwkset1 key pair, so this can act as the server.
+        self.serverEncryption = Encryption(clientPath, hyperwalletPath)
+
+    def requests(self, count):
+
+        return [
+            {'method': 'POST', 'url': 'payments', 'data': {'index': i}}
+            for i in range(count)
+        ]
+
+    def echoResponse(self, encryption=None):
+
+        def request(method, url, data, headers, params):
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+            body = data if encryption is None else encryption.decrypt(data)
+            if json.loads(body)['index'] == 3:
+                body = json.dumps({'errors': [{'code': 'FAILED', 'message': 'failed'}]})
+            return mock.MagicMock(
+                status_code=201,
+                content=body if encryption is None else encryption.encrypt(body),
+                headers={'Content-Type': 'application/json' if encryption is None else 'application/jose+json'}
+            )
+
+        return request
+
+    def test_invalid_concurrency(self):
+
+        with self.assertRaises(ValueError):
+            RequestPipeline(self.client, concurrency=0)
+
+    @mock.patch('requests.Session.request')
+    def test_results_in_input_order(self, session_mock):
+
+        session_mock.side_effect = self.echoResponse()
+
+        results = self.client.doPipeline(self.requests(8), concurrency=3)
+
+        self.assertEqual(len(results), 8)
+        for (index, result) in enumerate(results):
+            if index == 3:
+                self.assertIsInstance(result, HyperwalletAPIException)
+                self.assertEqual(result.message.get('errors')[0].get('code'), 'FAILED')
+            else:
+                self.assertEqual(result, {'index': index})
+
+    @mock.patch('requests.Session.request')
+    def test_results_with_encryption(self, session_mock):
+
+        session_mock.side_effect = self.echoResponse(self.serverEncryption)
+
+        results = self.clientWithEncryption.doPipeline(self.requests(5), concurrency=2)
+
+        self.assertEqual(results[0], {'index': 0})
+        self.assertEqual(results[4], {'index': 4})
+        self.assertIsInstance(results[3], HyperwalletAPIException)
+
+    @mock.patch('requests.Session.request')
+    def test_failed_connection_is_reported_per_request(self, session_mock):
+
+        session_mock.side_effect = IOError('refused')
+
+        results = self.client.doPipeline(self.requests(2))
+
+        for result in results:
+            self.assertEqual(result.message.get('errors')[0].get('code'), 'COMMUNICATION_ERROR')
+
+    @mock.patch('requests.Session.request')
+    def test_requests_pass_admission_queue(self, session_mock):
+
+        session_mock.side_effect = self.echoResponse()
+        client = ApiClient('test-user', 'test-pass', SERVER, admissionData={'maxConcurrency': 1})
+
+        with mock.patch.object(client.admission, 'acquire', wraps=client.admission.acquire) as acquire:
+            client.doPipeline(self.requests(4), concurrency=2)
+
+        self.assertEqual(acquire.call_count, 4)
+        self.assertEqual(client.admission.inFlight, 0)
+
+    def test_empty_pipeline(self):
+
+        self.assertEqual(self.client.doPipeline([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
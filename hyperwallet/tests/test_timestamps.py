@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+import unittest
+from datetime import datetime
+
+from hyperwallet import timestamps
+from hyperwallet.exceptions import HyperwalletException
+
+
+class TimestampsTest(unittest.TestCase):
+
+    def setUp(self):
+
+        timestamps._cache.clear()
+
+    def test_parse_timestamp(self):
+
+        self.assertEqual(timestamps.parseTimestamp('2017-11-01T17:08:58'), datetime(2017, 11, 1, 17, 8, 58))
+        self.assertEqual(timestamps.parseTimestamp('2017-11-01T17:08:58.25Z'), datetime(2017, 11, 1, 17, 8, 58, 250000))
+        self.assertIsNone(timestamps.parseTimestamp(None))
+
+    def test_parse_timestamp_invalid(self):
+
+        for value in ('2017-11-01', '2017-13-01T17:08:58', '2017-11-01T17:08:58.x', 'soon'):
+            with self.assertRaises(HyperwalletException) as exc:
+                timestamps.parseTimestamp(value)
+
+            self.assertEqual(exc.exception.message, 'Invalid timestamp {}'.format(value))
+
+    def test_parsed_timestamps_are_memoized(self):
+
+        parsed = timestamps.parseTimestamps(['2017-11-01T17:08:58', None, '2017-11-01T17:08:58'])
+
+        self.assertEqual(parsed[1], None)
+        self.assertIs(parsed[0], parsed[2])
+
+    def test_memo_is_bounded(self):
+
+        for second in range(timestamps.CACHE_SIZE + 10):
+            timestamps.parseTimestamp('2017-11-01T17:%02d:%02d' % (second // 60 % 60, second % 60))
+
+        self.assertLessEqual(len(timestamps._cache), timestamps.CACHE_SIZE)
+
+
+if __name__ == '__main__':
+    unittest.main()
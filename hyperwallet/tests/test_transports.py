@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+import os
+import json
+import socket
+import shutil
+import tempfile
+import threading
+import unittest
+
+from six.moves import BaseHTTPServer, socketserver
+
+from hyperwallet.utils import ApiClient
+from hyperwallet.config import SERVER
+from hyperwallet.exceptions import HyperwalletAPIException
+
+
+class UnixSocketHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+
+class EchoHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+
+        self.respond()
+
+    def do_POST(self):
+
+        self.respond()
+
+    def respond(self):
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else None
+
+        content = json.dumps({
+            'method': self.command,
+            'path': self.path,
+            'host': self.headers.get('Host'),
+            'proto': self.headers.get('X-Forwarded-Proto'),
+            'authorization': self.headers.get('Authorization'),
+            'body': body
+        }).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def address_string(self):
+
+        return 'unix'
+
+    def log_message(self, format, *args):
+
+        pass
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix domain sockets are not supported')
+class UnixSocketAdapterTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.socketPath = os.path.join(self.directory, 'proxy.sock')
+
+        self.server = UnixSocketHTTPServer(self.socketPath, EchoHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+        self.client = ApiClient(
+            'test-user',
+            'test-pass',
+            SERVER,
+            unixSocketPath=self.socketPath
+        )
+
+    def tearDown(self):
+
+        self.client.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def test_get_is_sent_over_unix_socket(self):
+
+        response = self.client.doGet('users', {'limit': 1})
+
+        self.assertEqual(response.get('method'), 'GET')
+        self.assertEqual(response.get('path'), '/rest/v3/users?limit=1')
+        self.assertEqual(response.get('host'), 'api.sandbox.hyperwallet.com')
+        self.assertEqual(response.get('proto'), 'https')
+        self.assertTrue(response.get('authorization').startswith('Basic '))
+
+    def test_post_body_is_sent_over_unix_socket(self):
+
+        response = self.client.doPost('users', {'key': 'value'})
+
+        self.assertEqual(response.get('method'), 'POST')
+        self.assertEqual(json.loads(response.get('body')), {'key': 'value'})
+
+    def test_connections_are_reused(self):
+
+        self.client.doGet('users')
+        self.client.doGet('users')
+
+        adapter = self.client.session.get_adapter(SERVER)
+
+        self.assertEqual(len(adapter.pools), 1)
+
+    def test_failed_connection(self):
+
+        self.server.shutdown()
+        self.server.server_close()
+        os.remove(self.socketPath)
+
+        client = ApiClient(
+            'test-user',
+            'test-pass',
+            SERVER,
+            unixSocketPath=self.socketPath
+        )
+
+        with self.assertRaises(HyperwalletAPIException) as exc:
+            client.doGet('users')
+
+        self.assertEqual(
+            exc.exception.message.get('errors')[0].get('code'),
+            'COMMUNICATION_ERROR'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
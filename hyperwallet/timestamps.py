@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+from datetime import datetime
+
+import six
+
+from hyperwallet.exceptions import HyperwalletException
+
+# Model attributes holding ISO 8601 timestamps.
+TIMESTAMP_FIELDS = ('createdOn', 'expiresOn', 'releaseOn')
+
+# The most parsed timestamps kept in the memo, which is emptied when full.
+CACHE_SIZE = 8192
+
+_cache = {}
+
+# The separators of a timestamp, with a T or a space between date and time.
+_SEPARATORS = ('--T::', '-- ::')
+
+
+def parseTimestamp(value):
+    '''
+    Parse an ISO 8601 timestamp as returned by the API, e.g.
+    ``2017-11-01T17:08:58``, into a naive datetime. Parsed timestamps are
+    memoized, as the timestamps of a list often repeat to the second.
+
+    :param value:
+        The timestamp. **REQUIRED**
+    :returns:
+        The datetime, or None if the timestamp is None.
+    '''
+
+    if value is None:
+        return None
+
+    parsed = _cache.get(value)
+    if parsed is None:
+        parsed = _parse(value)
+        if len(_cache) >= CACHE_SIZE:
+            _cache.clear()
+        _cache[value] = parsed
+
+    return parsed
+
+
+def parseTimestamps(values):
+    '''
+    Parse many timestamps, e.g. the timestamps of a list result.
+
+    :param values:
+        The timestamps as returned by the API. **REQUIRED**
+    :returns:
+        A list with the datetime of each timestamp (None for missing
+        timestamps).
+    '''
+
+    return [parseTimestamp(value) for value in values]
+
+
+def _parse(value):
+    '''
+    Parse a timestamp without the memo. The fixed positions of
+    ``YYYY-MM-DDTHH:MM:SS`` are sliced instead of going through strptime,
+    optionally followed by fractional seconds and a ``Z``.
+    '''
+
+    if not isinstance(value, six.string_types):
+        raise HyperwalletException('Invalid timestamp {}'.format(value))
+
+    text = value[:-1] if value.endswith('Z') else value
+    microseconds = 0
+    if len(text) > 20 and text[19] == '.':
+        fraction = text[20:26]
+        if not fraction.isdigit():
+            raise HyperwalletException('Invalid timestamp {}'.format(value))
+        microseconds = int(fraction.ljust(6, '0'))
+        if len(text) > 26 and not text[26:].isdigit():
+            raise HyperwalletException('Invalid timestamp {}'.format(value))
+        text = text[:19]
+
+    # The separators are every third character from the fifth on.
+    if len(text) != 19 or text[4:17:3] not in _SEPARATORS:
+        raise HyperwalletException('Invalid timestamp {}'.format(value))
+
+    try:
+        return datetime(
+            int(text[0:4]), int(text[5:7]), int(text[8:10]),
+            int(text[11:13]), int(text[14:16]), int(text[17:19]),
+            microseconds
+        )
+    except ValueError:
+        raise HyperwalletException('Invalid timestamp {}'.format(value))
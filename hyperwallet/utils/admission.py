@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+import threading
+
+from hyperwallet.exceptions import HyperwalletOverloadException
+from hyperwallet.utils.clock import clock
+
+
+class AdmissionQueue(object):
+    '''
+    A bounded admission queue in front of the API client.
+
+    At most **maxConcurrency** requests are in flight at once. Further
+    requests wait in the queue, but no more than **maxDepth** of them and no
+    longer than **maxQueueTime** seconds each. Requests which cannot be
+    admitted fail immediately with a HyperwalletOverloadException instead of
+    piling up.
+
+    :param maxConcurrency:
+        The maximum number of requests in flight.
+    :param maxDepth:
+        The maximum number of requests waiting for a slot. Zero disables
+        waiting altogether.
+    :param maxQueueTime:
+        The maximum number of seconds a request may wait for a slot, or
+        None to wait as long as needed.
+    '''
+
+    def __init__(self,
+                 maxConcurrency=10,
+                 maxDepth=100,
+                 maxQueueTime=None):
+        '''
+        Create an admission queue.
+        '''
+
+        if maxConcurrency < 1:
+            raise ValueError('maxConcurrency must be at least 1')
+
+        if maxDepth < 0:
+            raise ValueError('maxDepth must not be negative')
+
+        self.maxConcurrency = maxConcurrency
+        self.maxDepth = maxDepth
+        self.maxQueueTime = maxQueueTime
+
+        self.__condition = threading.Condition()
+        self.__inFlight = 0
+        self.__waiting = 0
+
+    @property
+    def inFlight(self):
+        return self.__inFlight
+
+    @property
+    def depth(self):
+        return self.__waiting
+
+    def acquire(self):
+        '''
+        Wait for a free slot.
+
+        :raises HyperwalletOverloadException:
+            If the queue is full or no slot was freed within maxQueueTime.
+        '''
+
+        with self.__condition:
+            if self.__inFlight < self.maxConcurrency and not self.__waiting:
+                self.__inFlight += 1
+                return
+
+            if self.__waiting >= self.maxDepth:
+                raise self.__reject(
+                    'QUEUE_FULL',
+                    'Admission queue is full ({} requests waiting)'.format(self.__waiting)
+                )
+
+            deadline = None
+            if self.maxQueueTime is not None:
+                deadline = clock() + self.maxQueueTime
+
+            self.__waiting += 1
+            try:
+                while self.__inFlight >= self.maxConcurrency:
+                    if deadline is None:
+                        self.__condition.wait()
+                        continue
+
+                    remaining = deadline - clock()
+                    if remaining <= 0:
+                        raise self.__reject(
+                            'QUEUE_TIMEOUT',
+                            'Request waited more than {} seconds in the admission queue'.format(self.maxQueueTime)
+                        )
+                    self.__condition.wait(remaining)
+
+                self.__inFlight += 1
+            finally:
+                self.__waiting -= 1
+
+    def release(self):
+        '''
+        Free the slot taken by acquire().
+        '''
+
+        with self.__condition:
+            self.__inFlight -= 1
+            self.__condition.notify()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def __reject(self, code, message):
+        '''
+        Build the exception for a rejected request.
+        '''
+
+        return HyperwalletOverloadException({
+            'errors': [{
+                'code': code,
+                'message': message
+            }]
+        })
@@ -7,7 +7,9 @@ import requests
 from hyperwallet.exceptions import HyperwalletAPIException
 from requests_toolbelt.adapters.ssl import SSLAdapter
 from hyperwallet import __version__
-from hyperwallet.utils.encryption import Encryption
+from hyperwallet.utils.transports import UnixSocketAdapter
+from hyperwallet.utils.admission import AdmissionQueue
+from hyperwallet.utils.pipeline import RequestPipeline
 try:
     from urllib.parse import urljoin
 except ImportError:
@@ -26,16 +28,30 @@ class ApiClient(object):
         The base URL of the API. **REQUIRED**
     :param encryptionData:
         Array with params for encrypted requests(Fields: clientPrivateKeySetLocation, hyperwalletKeySetLocation).
+    :param unixSocketPath:
+        Path to the Unix domain socket of a local proxy. When given, requests
+        are sent as plain HTTP over this socket and the proxy is expected to
+        terminate TLS towards the API.
+    :param admissionData:
+        Dictionary with params for the admission queue in front of this client
+        (keys: maxConcurrency, maxDepth, maxQueueTime).
     '''
 
-    def __init__(self, username, password, server, encryptionData=None):
+    def __init__(self, username, password, server, encryptionData=None, unixSocketPath=None, admissionData=None):
         '''
         Create an instance of the API client.
         This client is used to make the calls to the Hyperwallet API.
         '''
 
-        # Setup encryption for request/responses.
-        self.encryption = Encryption(**encryptionData) if encryptionData is not None else None
+        # Setup encryption for request/responses. The JOSE libraries are only
+        # imported when encryption is enabled to keep the import time low.
+        self.encryption = None
+        if encryptionData is not None:
+            from hyperwallet.utils.encryption import Encryption
+            self.encryption = Encryption(**encryptionData)
+
+        # Setup the admission queue which sheds load when the API falls behind.
+        self.admission = AdmissionQueue(**admissionData) if admissionData is not None else None
 
         # Base headers and the custom User-Agent to identify this client as the
         # Hyperwallet SDK.
@@ -48,13 +64,17 @@ class ApiClient(object):
         self.username = username
         self.password = password
         self.server = server
+        self.unixSocketPath = unixSocketPath
 
         # The complete base URL of the API.
         self.baseUrl = urljoin(self.server, '/rest/v3/')
 
         # The default connection to persist authentication and SSL settings.
         defaultSession = requests.Session()
-        defaultSession.mount(self.server, SSLAdapter())
+        if self.unixSocketPath is not None:
+            defaultSession.mount(self.server, UnixSocketAdapter(self.unixSocketPath))
+        else:
+            defaultSession.mount(self.server, SSLAdapter())
         defaultSession.auth = (self.username, self.password)
         defaultSession.headers = self.baseHeaders
 
@@ -64,6 +84,24 @@ class ApiClient(object):
     def encrypted(self):
         return self.encryption is not None
 
+    def close(self):
+        '''
+        Stop the worker processes of the encryption, if any, and close the
+        pooled connections. The client can also be used as a context manager
+        closing it on exit.
+        '''
+
+        if self.encryption is not None:
+            self.encryption.close()
+
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def _makeRequest(self,
                      method=None,
                      url=None,
@@ -88,13 +126,42 @@ class ApiClient(object):
 
         .. note::
             The Hyperwallet API supports **GET**, **POST**, and **PUT**.
+
+        .. note::
+            When an admission queue is configured a HyperwalletOverloadException
+            is raised if the request cannot be admitted.
+        '''
+
+        if self.admission is None:
+            return self.__makeRequest(method, url, data, headers, params)
+
+        with self.admission:
+            return self.__makeRequest(method, url, data, headers, params)
+
+    def __makeRequest(self, method, url, data, headers, params):
+        '''
+        Send a request and process the API response.
+        See _makeRequest() for the parameters.
+        '''
+
+        response = self._sendRequest(method, url, self._getRequestData(data), headers, params)
+
+        return self._processResponse(response)
+
+    def _sendRequest(self, method, url, data, headers, params):
+        '''
+        Send a request with an already encrypted body.
+        See _makeRequest() for the parameters.
+
+        :returns:
+            The HTTP response.
         '''
 
         try:
-            response = self.session.request(
+            return self.session.request(
                 method=method,
                 url=urljoin(self.baseUrl, url),
-                data=self.__getRequestData(data),
+                data=data,
                 headers=headers,
                 params=params
             )
@@ -110,6 +177,16 @@ class ApiClient(object):
                 }]
             })
 
+    def _processResponse(self, response):
+        '''
+        Process an API response to ensure a JSON object is returned always.
+
+        :param response:
+            The HTTP response. **REQUIRED**
+        :returns:
+            A JSON object containing the response data.
+        '''
+
         if response.status_code is 204:
             return {}
 
@@ -195,6 +272,24 @@ class ApiClient(object):
             data=json.dumps(data).encode('utf-8')
         )
 
+    def doPipeline(self, requests, concurrency=1):
+        '''
+        Submit many requests to the API, overlapping the encryption of the
+        next requests and the decryption of the previous responses with the
+        requests in flight.
+
+        :param requests:
+            Dictionaries describing the requests (keys: method, url, data,
+            headers, params). **REQUIRED**
+        :param concurrency:
+            The number of requests in flight at once.
+        :returns:
+            A list in input order holding for each request either the API
+            response or the exception it failed with.
+        '''
+
+        return RequestPipeline(self, concurrency).execute(requests)
+
     def __checkResponseHeaderContentType(self, response):
         '''
         Check response header Content-Type.
@@ -207,7 +302,7 @@ class ApiClient(object):
         if (not self.encrypted and 'application/json' not in contentType) or (self.encrypted and 'application/jose+json' not in contentType):
             raise HyperwalletAPIException('Invalid Content-Type specified in Response Header')
 
-    def __getRequestData(self, data):
+    def _getRequestData(self, data):
         '''
         If encryption is enabled try to encrypt request data, otherwise no action required.
 
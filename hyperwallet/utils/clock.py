@@ -0,0 +1,6 @@
+#!/usr/bin/env python
+
+import time
+
+# Python 2 has no monotonic clock in the standard library.
+clock = getattr(time, 'monotonic', time.time)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+
+import multiprocessing
+
+from hyperwallet.exceptions import HyperwalletException
+
+# The Encryption of the current worker process and the error its creation
+# failed with, see _initializeWorker().
+_workerEncryption = None
+_workerError = None
+
+
+def _initializeWorker(encryptionData):
+    '''
+    Create the Encryption of a worker process and preload its key sets. A
+    failure is kept and raised by every call instead, as a worker whose
+    initializer fails is replaced by the pool over and over again.
+
+    :param encryptionData:
+        Dictionary with the params of the Encryption. **REQUIRED**
+    '''
+
+    from hyperwallet.utils.encryption import Encryption
+
+    global _workerEncryption, _workerError
+    try:
+        _workerEncryption = Encryption(**encryptionData)
+        _workerEncryption.reloadKeySets()
+    except Exception as e:
+        _workerEncryption = None
+        _workerError = e if isinstance(e, HyperwalletException) else HyperwalletException(str(e))
+
+
+def _worker():
+    '''
+    Return the Encryption of the current worker process.
+    '''
+
+    if _workerEncryption is None:
+        raise _workerError
+
+    return _workerEncryption
+
+
+def _encrypt(body):
+    return _worker().encrypt(body)
+
+
+def _decrypt(body):
+    return _worker().decrypt(body)
+
+
+def _encryptMany(bodies):
+    return _worker().encryptMany(bodies)
+
+
+def _decryptMany(bodies):
+    return _worker().decryptMany(bodies)
+
+
+class CryptoPool(object):
+    '''
+    A pool of worker processes which sign/encrypt and decrypt/verify message
+    bodies, so that encrypted throughput is not bound to the GIL of the
+    calling process.
+
+    Each worker creates its own Encryption with preloaded key sets once, only
+    message bodies and results travel between processes.
+
+    :param encryptionData:
+        Dictionary with the params of the Encryption (keys:
+        clientPrivateKeySetLocation, hyperwalletKeySetLocation, etc). **REQUIRED**
+    :param processes:
+        The number of worker processes. Defaults to the number of CPUs.
+    :param chunkSize:
+        The number of bodies sent to a worker at once by the batch methods.
+    '''
+
+    def __init__(self, encryptionData, processes=None, chunkSize=8):
+        '''
+        Start the worker processes.
+        '''
+
+        self.processes = processes or multiprocessing.cpu_count()
+        self.chunkSize = chunkSize
+        self.pool = multiprocessing.Pool(
+            self.processes,
+            _initializeWorker,
+            (encryptionData,)
+        )
+
+    def encrypt(self, body):
+        '''
+        :param body:
+            Body message to be 1) signed and 2) encrypted. **REQUIRED**
+        :returns:
+            String as a result of signature and encryption of input message body
+        '''
+
+        return self.pool.apply(_encrypt, (body,))
+
+    def decrypt(self, body):
+        '''
+        :param body:
+            Body message to be 1) decrypted and 2) check for correct signature. **REQUIRED**
+        :returns:
+            Decrypted body message
+        '''
+
+        return self.pool.apply(_decrypt, (body,))
+
+    def encryptMany(self, bodies):
+        '''
+        Sign and encrypt many bodies, sending them to the workers in chunks.
+
+        :param bodies:
+            Body messages to be 1) signed and 2) encrypted. **REQUIRED**
+        :returns:
+            A list in input order holding for each body either the encrypted
+            body or the HyperwalletException it failed with.
+        '''
+
+        return self.__mapChunks(_encryptMany, bodies)
+
+    def decryptMany(self, bodies):
+        '''
+        Decrypt and verify many bodies, sending them to the workers in chunks.
+
+        :param bodies:
+            Body messages to be 1) decrypted and 2) check for correct signature. **REQUIRED**
+        :returns:
+            A list in input order holding for each body either the decrypted
+            body or the HyperwalletException it failed with.
+        '''
+
+        return self.__mapChunks(_decryptMany, bodies)
+
+    def __mapChunks(self, function, bodies):
+        '''
+        Apply a batch function to chunks of bodies in the workers and join
+        the results in input order.
+        '''
+
+        bodies = list(bodies)
+        chunks = [
+            bodies[i:i + self.chunkSize]
+            for i in range(0, len(bodies), self.chunkSize)
+        ]
+
+        results = []
+        for chunkResults in self.pool.map(function, chunks):
+            results.extend(chunkResults)
+
+        return results
+
+    def close(self):
+        '''
+        Stop the worker processes once they finished their work.
+        '''
+
+        self.pool.close()
+        self.pool.join()
@@ -2,16 +2,20 @@
 
 import os
 import json
-import requests
 import time
 import sys
+import threading
+import requests
 
-from jwcrypto import jwk, jws as cryptoJWS, jwe
+from jwcrypto import jws as cryptoJWS, jwe
 from jwcrypto.common import json_encode, json_decode
 from jwcrypto.common import base64url_decode, base64url_encode
-from jose import jws
+from jwcrypto.jwa import JWA
 
 from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils.keyset import JwkKeySet
+from hyperwallet.utils.jwks import JwksFetcher
+from hyperwallet.utils.cryptopool import CryptoPool
 from six.moves.urllib.parse import urlparse
 
 
@@ -24,13 +28,37 @@ class Encryption(object):
     :param hyperwalletKeySetLocation:
         The location(url or path to file) of hyperwallet public JWK key set. **REQUIRED**
     :param encryptionAlgorithm:
-        JWE encryption algorithm.
+        JWE encryption algorithm, RSA-OAEP-256 or one of the ECDH-ES family
+        for EC key sets.
     :param signAlgorithm:
-        JWS signature algorithm.
+        JWS signature algorithm, RS256 or ES256/ES384/ES512 for EC key sets.
     :param encryptionMethod:
         JWE body encryption method.
     :param jwsExpirationMinutes:
         Time in minutes when JWS signature is valid after creation.
+    :param checkKeySetModification:
+        Reload a JWK key set file when its modification time changes.
+    :param keySetFetcherData:
+        Dictionary with params for fetching JWK key sets from URLs (keys:
+        timeout, defaultMaxAge, refreshAhead, retryInterval,
+        minRefreshInterval).
+    :param processes:
+        Number of worker processes to run signing, encryption, decryption and
+        verification in. By default all work runs in the calling thread.
+
+    .. note::
+        Responses are decrypted and verified with the keys named by the
+        ``kid`` of their protected headers, so old and new keys can be used
+        side by side during key rotation.
+
+    .. note::
+        Keys are selected by their ``alg``. Keys which don't name an
+        algorithm are selected by key type, curve and use instead.
+
+    .. note::
+        JWK key sets are loaded and parsed once per instance. Call
+        reloadKeySets() to pick up rotated keys. Key sets at a URL are
+        refreshed in the background as their HTTP caching headers allow.
     '''
 
     def __init__(self,
@@ -39,7 +67,10 @@ class Encryption(object):
                  encryptionAlgorithm='RSA-OAEP-256',
                  signAlgorithm='RS256',
                  encryptionMethod='A256CBC-HS512',
-                 jwsExpirationMinutes=5):
+                 jwsExpirationMinutes=5,
+                 checkKeySetModification=False,
+                 keySetFetcherData=None,
+                 processes=None):
         '''
         Encryption service for hyperwallet client
         '''
@@ -50,8 +81,81 @@ class Encryption(object):
         self.signAlgorithm = signAlgorithm
         self.encryptionMethod = encryptionMethod
         self.jwsExpirationMinutes = jwsExpirationMinutes
+        self.checkKeySetModification = checkKeySetModification
+        self.keySetFetcherData = keySetFetcherData or {}
+        self.processes = processes
         self.integer_types = (int, long,) if sys.version_info < (3,) else (int,)
 
+        # Params for the Encryption of each worker process of the crypto pool.
+        self.__workerEncryptionData = {
+            'clientPrivateKeySetLocation': clientPrivateKeySetLocation,
+            'hyperwalletKeySetLocation': hyperwalletKeySetLocation,
+            'encryptionAlgorithm': encryptionAlgorithm,
+            'signAlgorithm': signAlgorithm,
+            'encryptionMethod': encryptionMethod,
+            'jwsExpirationMinutes': jwsExpirationMinutes,
+            'checkKeySetModification': checkKeySetModification,
+            'keySetFetcherData': keySetFetcherData
+        }
+        self.__cryptoPool = None
+        self.__cryptoPoolLock = threading.Lock()
+
+        # Parsed JWK key sets and the version of their source, by location.
+        self.__keySets = {}
+        self.__keySetsLock = threading.Lock()
+
+        # Fetchers for key sets at URLs, sharing one pooled session.
+        self.__fetchers = {}
+        self.__fetchersLock = threading.Lock()
+        self.__jwksSession = requests.Session()
+
+        # Serialized protected headers, by key id and algorithm.
+        self.__headerTemplates = {}
+
+    def reloadKeySets(self):
+        '''
+        Drop the cached JWK key sets and load them again from their locations.
+        '''
+
+        with self.__keySetsLock:
+            self.__keySets = {}
+
+        for fetcher in list(self.__fetchers.values()):
+            if fetcher is not None:
+                fetcher.refresh()
+
+        self.__getJwkKeySet(location=self.clientPrivateKeySetLocation)
+        self.__getJwkKeySet(location=self.hyperwalletKeySetLocation)
+
+    @property
+    def cryptoPool(self):
+        '''
+        The CryptoPool doing the work if processes is set, started on first use.
+        The key sets are loaded here first, so that invalid ones raise before
+        any worker process is started.
+        '''
+
+        if self.processes is None:
+            return None
+
+        if self.__cryptoPool is None:
+            with self.__cryptoPoolLock:
+                if self.__cryptoPool is None:
+                    self.reloadKeySets()
+                    self.__cryptoPool = CryptoPool(self.__workerEncryptionData, self.processes)
+
+        return self.__cryptoPool
+
+    def close(self):
+        '''
+        Stop the worker processes of the crypto pool, if any.
+        '''
+
+        with self.__cryptoPoolLock:
+            if self.__cryptoPool is not None:
+                self.__cryptoPool.close()
+                self.__cryptoPool = None
+
     def encrypt(self, body):
         '''
         :param body:
@@ -60,56 +164,242 @@ class Encryption(object):
             String as a result of signature and encryption of input message body
         '''
 
-        jwsKeySet = self.__getJwkKeySet(location=self.clientPrivateKeySetLocation)
-        jwkSignKey = self.__findJwkKeyByAlgorithm(jwkKeySet=jwsKeySet, algorithm=self.signAlgorithm)
-        privateKeyToSign = jwk.JWK(**jwkSignKey)
-        jwsToken = cryptoJWS.JWS(body.encode('utf-8'))
-        jwsToken.add_signature(privateKeyToSign, None, json_encode({
-            "alg": self.signAlgorithm,
-            "kid": jwkSignKey['kid'],
-            "exp": self.__getJwsExpirationTime()
-        }))
-        signedBody = jwsToken.serialize(True)
+        if self.processes is not None:
+            return self.cryptoPool.encrypt(body)
 
-        jweKeySet = self.__getJwkKeySet(location=self.hyperwalletKeySetLocation)
-        jwkEncryptKey = self.__findJwkKeyByAlgorithm(jwkKeySet=jweKeySet, algorithm=self.encryptionAlgorithm)
-        publicKeyToEncrypt = jwk.JWK(**jwkEncryptKey)
-        protected_header = {
-            "alg": self.encryptionAlgorithm,
-            "enc": self.encryptionMethod,
-            "typ": "JWE",
-            "kid": jwkEncryptKey['kid'],
-        }
-        jweToken = jwe.JWE(signedBody.encode('utf-8'), recipient=publicKeyToEncrypt, protected=protected_header)
-        return jweToken.serialize(True)
+        jwkSignKey, jwkEncryptKey = self.__getEncryptionKeys()
+
+        return self.__encryptBody(
+            body,
+            jwkSignKey,
+            self.__getJwsProtectedHeader(jwkSignKey),
+            jwkEncryptKey,
+            self.__getJweProtectedHeader(jwkEncryptKey)
+        )
 
     def decrypt(self, body):
         '''
         :param body:
             Body message to be 1) decrypted and 2) check for correct signature. **REQUIRED**
         :returns:
-            Decrypted body message
+            Decrypted body message as text, not bytes
         '''
 
-        jweKeySet = self.__getJwkKeySet(location=self.clientPrivateKeySetLocation)
-        jwkDecryptKey = self.__findJwkKeyByAlgorithm(jwkKeySet=jweKeySet, algorithm=self.encryptionAlgorithm)
-        privateKeyToDecrypt = jwk.JWK(**jwkDecryptKey)
+        if self.processes is not None:
+            return self.cryptoPool.decrypt(body)
+
+        jwkDecryptKey = self.__getJwkKeySet(location=self.clientPrivateKeySetLocation).findByKid(
+            self.__getUnverifiedHeader(body).get('kid'),
+            self.encryptionAlgorithm
+        )
         jweToken = jwe.JWE()
         try:
-            jweToken.deserialize(body, key=privateKeyToDecrypt)
+            jweToken.deserialize(body, key=jwkDecryptKey.key)
         except Exception as e:
-            raise HyperwalletException(e.message)
-        payload = jweToken.payload
+            raise HyperwalletException(str(e))
+
+        return self.__verifyJws(jweToken.payload)
+
+    def encryptMany(self, bodies):
+        '''
+        Sign and encrypt many message bodies, looking up keys and building
+        protected headers only once for the whole batch. If processes is set
+        the batch is spread over the crypto pool.
+
+        :param bodies:
+            Body messages to be 1) signed and 2) encrypted. **REQUIRED**
+        :returns:
+            A list in input order holding for each body either the encrypted
+            body or the HyperwalletException it failed with.
+        '''
+
+        bodies = list(bodies)
+
+        if self.processes is not None:
+            return self.cryptoPool.encryptMany(bodies)
 
-        self.checkJwsExpiration(payload)
-        jwsKeySet = self.__getJwkKeySet(location=self.hyperwalletKeySetLocation)
-        jwkCheckSignKey = self.__findJwkKeyByAlgorithm(jwkKeySet=jwsKeySet, algorithm=self.signAlgorithm)
         try:
-            return jws.verify(payload, json.dumps(jwkCheckSignKey), algorithms=self.signAlgorithm)
+            jwkSignKey, jwkEncryptKey = self.__getEncryptionKeys()
+            jwsHeader = self.__getJwsProtectedHeader(jwkSignKey)
+            jweHeader = self.__getJweProtectedHeader(jwkEncryptKey)
         except Exception as e:
-            raise HyperwalletException(e.message)
+            return [self.__asHyperwalletException(e)] * len(bodies)
+
+        results = []
+        for body in bodies:
+            try:
+                results.append(self.__encryptBody(body, jwkSignKey, jwsHeader, jwkEncryptKey, jweHeader))
+            except Exception as e:
+                results.append(self.__asHyperwalletException(e))
+
+        return results
+
+    def decryptMany(self, bodies):
+        '''
+        Decrypt and verify many message bodies. If processes is set the batch
+        is spread over the crypto pool.
+
+        :param bodies:
+            Body messages to be 1) decrypted and 2) check for correct signature. **REQUIRED**
+        :returns:
+            A list in input order holding for each body either the decrypted
+            body or the HyperwalletException it failed with.
+        '''
+
+        bodies = list(bodies)
+
+        if self.processes is not None:
+            return self.cryptoPool.decryptMany(bodies)
+
+        results = []
+        for body in bodies:
+            try:
+                results.append(self.decrypt(body))
+            except Exception as e:
+                results.append(self.__asHyperwalletException(e))
+
+        return results
+
+    def __getEncryptionKeys(self):
+        '''
+        Looks up the keys used for signing and encrypting request bodies.
+
+        :returns:
+            The JwkKey to sign with and the JwkKey to encrypt with.
+        '''
+
+        jwkSignKey = self.__getJwkKeySet(location=self.clientPrivateKeySetLocation).findByAlgorithm(self.signAlgorithm)
+        jwkEncryptKey = self.__getJwkKeySet(location=self.hyperwalletKeySetLocation).findByAlgorithm(self.encryptionAlgorithm)
+
+        return jwkSignKey, jwkEncryptKey
+
+    def __encryptBody(self, body, jwkSignKey, jwsHeader, jwkEncryptKey, jweHeader):
+        '''
+        Signs and encrypts a message body with prepared keys and headers.
+
+        :returns:
+            String as a result of signature and encryption of input message body
+        '''
+
+        jwsToken = cryptoJWS.JWS(body if isinstance(body, bytes) else body.encode('utf-8'))
+        jwsToken.add_signature(jwkSignKey.key, None, jwsHeader)
+        signedBody = jwsToken.serialize(True)
+
+        jweToken = jwe.JWE(
+            signedBody.encode('utf-8'),
+            recipient=jwkEncryptKey.key,
+            protected=jweHeader
+        )
+        return jweToken.serialize(True)
+
+    def __asHyperwalletException(self, e):
+        '''
+        Reports any failure of a batch item as a HyperwalletException.
+        '''
+
+        return e if isinstance(e, HyperwalletException) else HyperwalletException(str(e))
+
+    def __verifyJws(self, token):
+        '''
+        Checks expiration and signature of a compact JWS in a single pass,
+        decoding its header and payload only once.
+
+        :param token:
+            Compact serialization of the JWS. **REQUIRED**
+        :returns:
+            The verified JWS payload, decoded as UTF-8 text.
+        '''
+
+        encodedHeader, encodedPayload, encodedSignature, header = self.__splitJws(token)
+
+        self.__checkJwsHeaderExpiration(header)
+
+        if header.get('alg') != self.signAlgorithm:
+            raise HyperwalletException('The specified alg value is not allowed')
+
+        jwkCheckSignKey = self.__getJwkKeySet(location=self.hyperwalletKeySetLocation).findByKid(
+            header.get('kid'),
+            self.signAlgorithm
+        )
+        try:
+            JWA.signing_alg(self.signAlgorithm).verify(
+                jwkCheckSignKey.key,
+                (encodedHeader + '.' + encodedPayload).encode('utf-8'),
+                base64url_decode(encodedSignature)
+            )
+        except Exception:
+            raise HyperwalletException('Signature verification failed.')
+
+        return base64url_decode(encodedPayload).decode('utf-8')
+
+    def __splitJws(self, token):
+        '''
+        Splits a compact JWS and decodes its protected header.
+
+        :param token:
+            Compact serialization of the JWS. **REQUIRED**
+        :returns:
+            The encoded header, payload and signature and the decoded header.
+        '''
+
+        if isinstance(token, bytes):
+            token = token.decode('utf-8')
+
+        try:
+            encodedHeader, encodedPayload, encodedSignature = token.split('.')
+            header = json_decode(base64url_decode(encodedHeader))
+        except Exception:
+            raise HyperwalletException('Error decoding JWS token')
+
+        if not isinstance(header, dict):
+            raise HyperwalletException('Error decoding JWS token')
+
+        return encodedHeader, encodedPayload, encodedSignature, header
+
+    def __getUnverifiedHeader(self, token):
+        '''
+        Reads the protected header of a compact JWE or JWS without verifying it.
+
+        :param token:
+            Compact serialization of a JWE or JWS. **REQUIRED**
+        :returns:
+            The protected header, or an empty dictionary if it can't be read.
+        '''
+
+        if isinstance(token, bytes):
+            token = token.decode('utf-8')
+
+        try:
+            header = json_decode(base64url_decode(token.split('.', 1)[0]))
+        except Exception:
+            return {}
+
+        return header if isinstance(header, dict) else {}
 
     def __getJwkKeySet(self, location):
+        '''
+        Retrieves the parsed JWK key set for given location, loading it only
+        if it is not cached yet or its source has changed since.
+
+        :param location:
+            Location(can be a URL or path to file) of JWK key data. **REQUIRED**
+        :returns:
+            JWK key set found at given location.
+        '''
+
+        version = self.__getKeySetVersion(location)
+
+        cached = self.__keySets.get(location)
+        if cached is not None and cached[1] == version:
+            return cached[0]
+
+        with self.__keySetsLock:
+            keySet = self.__parseJwkKeySet(self.__loadJwkKeySet(location))
+            self.__keySets[location] = (keySet, version)
+
+        return keySet
+
+    def __loadJwkKeySet(self, location):
         '''
         Retrieves JWK key data from given location.
 
@@ -118,28 +408,74 @@ class Encryption(object):
         :returns:
             JWK key set found at given location.
         '''
+
+        fetcher = self.__getFetcher(location)
+        if fetcher is not None:
+            return fetcher.get()
+
+        if os.path.isfile(location):
+            with open(location) as f:
+                return f.read()
+
+        raise HyperwalletException('Wrong JWK key set location path = ' + location)
+
+    def __getKeySetVersion(self, location):
+        '''
+        Retrieves a value which changes whenever the JWK key data at given
+        location changes.
+
+        :param location:
+            Location(can be a URL or path to file) of JWK key data. **REQUIRED**
+        :returns:
+            The version of the fetched key set for URLs, the modification time
+            for files if checkKeySetModification is enabled, None otherwise.
+        '''
+
+        fetcher = self.__getFetcher(location)
+        if fetcher is not None:
+            fetcher.get()
+            return fetcher.version
+
+        if not self.checkKeySetModification:
+            return None
+
         try:
-            url = urlparse(location)
-            if url.scheme and url.netloc and url.path:
-                return requests.get(location).text
-            raise HyperwalletException('Failed to parse url from string = ' + location)
-        except Exception as e:
-            if os.path.isfile(location):
-                with open(location) as f:
-                    return f.read()
-            else:
-                raise HyperwalletException('Wrong JWK key set location path = ' + location)
+            return os.path.getmtime(location)
+        except (OSError, TypeError):
+            return None
+
+    def __getFetcher(self, location):
+        '''
+        Retrieves the JwksFetcher for given location if it is a URL, creating
+        it only once also when called from several threads at a time.
+
+        :param location:
+            Location(can be a URL or path to file) of JWK key data. **REQUIRED**
+        :returns:
+            A JwksFetcher, or None if the location is not a URL.
+        '''
 
-    def __findJwkKeyByAlgorithm(self, jwkKeySet, algorithm):
+        if location in self.__fetchers:
+            return self.__fetchers[location]
+
+        with self.__fetchersLock:
+            if location not in self.__fetchers:
+                url = urlparse(location)
+                fetcher = None
+                if url.scheme and url.netloc and url.path:
+                    fetcher = JwksFetcher(location, session=self.__jwksSession, **self.keySetFetcherData)
+                self.__fetchers[location] = fetcher
+
+        return self.__fetchers[location]
+
+    def __parseJwkKeySet(self, jwkKeySet):
         '''
-        Finds JWK key by given algorithm.
+        Parses JWK key set data and prepares its keys.
 
         :param jwkKeySet:
             JSON representation of JWK key set. **REQUIRED**
-        :param algorithm:
-            Algorithm of the JWK key to be found in key set. **REQUIRED**
         :returns:
-            JWK key with given algorithm.
+            The parsed JwkKeySet.
         '''
 
         try:
@@ -147,11 +483,52 @@ class Encryption(object):
         except ValueError:
             raise HyperwalletException('Wrong JWK key set ' + jwkKeySet)
 
-        for key in keySet['keys']:
-            if key['alg'] == algorithm:
-                return key
+        return JwkKeySet(keySet)
+
+    def __getJwsProtectedHeader(self, jwkKey):
+        '''
+        Builds the JWS protected header from a template serialized once per key.
+
+        :param jwkKey:
+            JwkKey used for signing. **REQUIRED**
+        :returns:
+            Serialized JWS protected header.
+        '''
 
-        raise HyperwalletException('JWK set doesn\'t contain key with algorithm = ' + algorithm)
+        cacheKey = ('JWS', jwkKey.alg, jwkKey.kid)
+        template = self.__headerTemplates.get(cacheKey)
+        if template is None:
+            template = json_encode({
+                "alg": self.signAlgorithm,
+                "kid": jwkKey.kid,
+                "exp": "{exp}"
+            }).replace('{', '{{').replace('}', '}}').replace('"{{exp}}"', '{exp}')
+            self.__headerTemplates[cacheKey] = template
+
+        return template.format(exp=self.__getJwsExpirationTime())
+
+    def __getJweProtectedHeader(self, jwkKey):
+        '''
+        Builds the JWE protected header, serialized once per key.
+
+        :param jwkKey:
+            JwkKey used for encryption. **REQUIRED**
+        :returns:
+            Serialized JWE protected header.
+        '''
+
+        cacheKey = ('JWE', jwkKey.alg, jwkKey.kid)
+        header = self.__headerTemplates.get(cacheKey)
+        if header is None:
+            header = json_encode({
+                "alg": self.encryptionAlgorithm,
+                "enc": self.encryptionMethod,
+                "typ": "JWE",
+                "kid": jwkKey.kid,
+            })
+            self.__headerTemplates[cacheKey] = header
+
+        return header
 
     def __getJwsExpirationTime(self):
         '''
@@ -169,7 +546,12 @@ class Encryption(object):
         Check if JWS signature has not expired.
         '''
 
-        header = jws.get_unverified_header(payload)
+        self.__checkJwsHeaderExpiration(self.__splitJws(payload)[3])
+
+    def __checkJwsHeaderExpiration(self, header):
+        '''
+        Check if JWS signature has not expired, given its decoded header.
+        '''
 
         if 'exp' not in header:
             raise HyperwalletException('While trying to verify JWS signature no [exp] header is found')
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+
+import re
+import threading
+
+import requests
+
+from hyperwallet.exceptions import HyperwalletException
+from hyperwallet.utils.clock import clock
+
+
+class JwksFetcher(object):
+    '''
+    Fetches a remote JWK key set and keeps it fresh.
+
+    The key set is fetched synchronously only the first time. Afterwards it is
+    refreshed in the background shortly before it expires, using conditional
+    GETs driven by the ``ETag``, ``Last-Modified`` and ``Cache-Control``
+    response headers. The last good key set keeps being served while a
+    refresh is in flight or failing.
+
+    :param url:
+        The URL of the JWK key set. **REQUIRED**
+    :param session:
+        The requests.Session used for fetching. A pooled session is created
+        if not given.
+    :param timeout:
+        Timeout in seconds for each fetch.
+    :param defaultMaxAge:
+        Time in seconds the key set is fresh when the response does not
+        carry a ``Cache-Control: max-age``.
+    :param refreshAhead:
+        Time in seconds before expiry at which the background refresh starts.
+    :param retryInterval:
+        Time in seconds to wait before retrying a failed refresh.
+    :param minRefreshInterval:
+        Least time in seconds between two refreshes, also when the response
+        is ``no-cache`` or has ``max-age=0``.
+    '''
+
+    def __init__(self,
+                 url,
+                 session=None,
+                 timeout=10,
+                 defaultMaxAge=300,
+                 refreshAhead=30,
+                 retryInterval=30,
+                 minRefreshInterval=5):
+        '''
+        Create a fetcher for the given URL. Nothing is fetched until get().
+        '''
+
+        self.url = url
+        self.session = session if session is not None else requests.Session()
+        self.timeout = timeout
+        self.defaultMaxAge = defaultMaxAge
+        self.refreshAhead = refreshAhead
+        self.retryInterval = retryInterval
+        self.minRefreshInterval = minRefreshInterval
+
+        self.text = None
+        self.version = 0
+        self.etag = None
+        self.lastModified = None
+        self.refreshAt = None
+        self.lastError = None
+
+        self.__lock = threading.Lock()
+        self.__refreshing = False
+
+    def get(self):
+        '''
+        Retrieves the key set, fetching it on first use and starting a
+        background refresh when it is about to expire.
+
+        :returns:
+            The JSON representation of the JWK key set.
+        '''
+
+        if self.text is None:
+            with self.__lock:
+                if self.text is None:
+                    self.__fetch()
+            return self.text
+
+        if clock() >= self.refreshAt:
+            self.__startRefresh()
+
+        return self.text
+
+    def refresh(self):
+        '''
+        Refreshes the key set synchronously.
+
+        :returns:
+            The JSON representation of the JWK key set.
+        '''
+
+        with self.__lock:
+            self.__fetch()
+
+        return self.text
+
+    def __startRefresh(self):
+        '''
+        Starts a background refresh unless one is already in flight.
+        '''
+
+        with self.__lock:
+            if self.__refreshing:
+                return
+            self.__refreshing = True
+
+        thread = threading.Thread(target=self.__backgroundRefresh)
+        thread.daemon = True
+        thread.start()
+
+    def __backgroundRefresh(self):
+        '''
+        Refreshes the key set, keeping the last good one on failure.
+        '''
+
+        try:
+            with self.__lock:
+                self.__fetch()
+        except HyperwalletException:
+            pass
+        finally:
+            self.__refreshing = False
+
+    def __fetch(self):
+        '''
+        Fetches the key set, conditionally if it has been fetched before.
+        Must be called with the lock held.
+        '''
+
+        headers = {}
+        if self.text is not None:
+            if self.etag is not None:
+                headers['If-None-Match'] = self.etag
+            if self.lastModified is not None:
+                headers['If-Modified-Since'] = self.lastModified
+
+        try:
+            response = self.session.get(self.url, headers=headers, timeout=self.timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except Exception as e:
+            self.lastError = e
+            now = clock()
+            self.refreshAt = now + self.retryInterval
+            if self.text is None:
+                raise HyperwalletException('Failed to fetch JWK key set from ' + self.url)
+            return
+
+        if response.status_code != 304:
+            self.text = response.text
+            self.version += 1
+            self.etag = response.headers.get('ETag')
+            self.lastModified = response.headers.get('Last-Modified')
+
+        now = clock()
+        self.lastError = None
+        expiresAt = now + self.__getMaxAge(response)
+        self.refreshAt = max(now + self.minRefreshInterval, expiresAt - self.refreshAhead)
+
+    def __getMaxAge(self, response):
+        '''
+        Reads the freshness lifetime from the Cache-Control header.
+
+        :param response:
+            The key set response. **REQUIRED**
+        :returns:
+            Time in seconds the key set is fresh.
+        '''
+
+        cacheControl = response.headers.get('Cache-Control') or ''
+
+        if 'no-cache' in cacheControl or 'no-store' in cacheControl:
+            return 0
+
+        match = re.search(r'max-age=(\d+)', cacheControl)
+        if match:
+            return int(match.group(1))
+
+        return self.defaultMaxAge
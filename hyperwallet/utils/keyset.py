@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+from jwcrypto import jwk
+
+from hyperwallet.exceptions import HyperwalletException
+
+# Key type, curve and use of the keys each algorithm works with, to select
+# keys which don't name their algorithm. None matches any curve.
+ALGORITHM_KEY_TYPES = {
+    'RS256': ('RSA', None, 'sig'),
+    'RS384': ('RSA', None, 'sig'),
+    'RS512': ('RSA', None, 'sig'),
+    'PS256': ('RSA', None, 'sig'),
+    'PS384': ('RSA', None, 'sig'),
+    'PS512': ('RSA', None, 'sig'),
+    'ES256': ('EC', 'P-256', 'sig'),
+    'ES384': ('EC', 'P-384', 'sig'),
+    'ES512': ('EC', 'P-521', 'sig'),
+    'RSA-OAEP': ('RSA', None, 'enc'),
+    'RSA-OAEP-256': ('RSA', None, 'enc'),
+    'ECDH-ES': ('EC', None, 'enc'),
+    'ECDH-ES+A128KW': ('EC', None, 'enc'),
+    'ECDH-ES+A192KW': ('EC', None, 'enc'),
+    'ECDH-ES+A256KW': ('EC', None, 'enc')
+}
+
+
+class JwkKey(object):
+    '''
+    A JWK key from a key set together with its ready-to-use key object.
+
+    :param params:
+        The JSON representation of the JWK key. **REQUIRED**
+    '''
+
+    def __init__(self, params):
+        '''
+        Build the key object once so it can be reused for every operation.
+        '''
+
+        self.params = params
+        self.alg = params.get('alg')
+        self.kid = params.get('kid')
+        self.use = params.get('use')
+        self.kty = params.get('kty')
+        self.crv = params.get('crv')
+        self.key = jwk.JWK(**params)
+
+    @property
+    def algorithms(self):
+        '''
+        The algorithms this key can be used with: its own algorithm if it
+        names one, otherwise all algorithms matching its type, curve and use.
+        '''
+
+        if self.alg is not None:
+            return [self.alg]
+
+        return sorted(
+            algorithm
+            for (algorithm, (kty, crv, use)) in ALGORITHM_KEY_TYPES.items()
+            if kty == self.kty and crv in (None, self.crv) and self.use in (None, use)
+        )
+
+    def __repr__(self):
+        return "JwkKey({alg}, {kid})".format(
+            alg=self.alg,
+            kid=self.kid
+        )
+
+
+class JwkKeySet(object):
+    '''
+    A parsed JWK key set with its keys indexed by algorithm, key id and use.
+
+    :param keySet:
+        The parsed JSON representation of the JWK key set. **REQUIRED**
+    '''
+
+    def __init__(self, keySet):
+        '''
+        Prepare all keys of the key set and build the lookup index.
+        '''
+
+        self.keys = [JwkKey(params) for params in keySet['keys']]
+
+        # Every key is reachable by any combination of (alg, kid, use) where
+        # a None part matches anything. Earlier keys win, like a linear scan.
+        # Keys without an algorithm are reachable by every algorithm they fit.
+        self.__index = {}
+        for key in self.keys:
+            for alg in key.algorithms + [None]:
+                for kid in (key.kid, None):
+                    for use in (key.use, None):
+                        self.__index.setdefault((alg, kid, use), key)
+
+    def find(self, algorithm=None, kid=None, use=None):
+        '''
+        Finds the JWK key matching all given criteria.
+
+        :param algorithm:
+            Algorithm of the JWK key.
+        :param kid:
+            Id of the JWK key.
+        :param use:
+            Intended use of the JWK key (``enc`` or ``sig``).
+        :returns:
+            The matching JwkKey or None.
+        '''
+
+        return self.__index.get((algorithm, kid, use))
+
+    def findByAlgorithm(self, algorithm):
+        '''
+        Finds JWK key by given algorithm.
+
+        :param algorithm:
+            Algorithm of the JWK key to be found in key set. **REQUIRED**
+        :returns:
+            JwkKey with given algorithm.
+        '''
+
+        key = self.find(algorithm)
+        if key is None:
+            raise HyperwalletException('JWK set doesn\'t contain key with algorithm = ' + algorithm)
+
+        return key
+
+    def findByKid(self, kid, algorithm):
+        '''
+        Finds JWK key by given key id, falling back to the first key with
+        given algorithm if the key id is unknown.
+
+        :param kid:
+            Id of the JWK key to be found in key set.
+        :param algorithm:
+            Algorithm of the JWK key to be found in key set. **REQUIRED**
+        :returns:
+            JwkKey with given key id and algorithm.
+        '''
+
+        if kid is not None:
+            key = self.find(algorithm, kid)
+            if key is not None:
+                return key
+
+        return self.findByAlgorithm(algorithm)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+import json
+import threading
+
+from six.moves import queue
+
+# Marks the end of the work for the next stage.
+_DONE = object()
+
+
+class RequestPipeline(object):
+    '''
+    Executes many API requests in three overlapping stages: request bodies
+    are encrypted in one thread, sent by **concurrency** threads and the
+    responses are decrypted in another thread. With encryption enabled the
+    next request is encrypted while the previous one is in flight, so a bulk
+    job takes about max(CPU time, network time) instead of their sum.
+
+    :param apiClient:
+        The ApiClient to send the requests with. **REQUIRED**
+    :param concurrency:
+        The number of requests in flight at once.
+    :param depth:
+        The number of encrypted requests and of undecrypted responses which
+        may wait between the stages. Defaults to twice the concurrency.
+    '''
+
+    def __init__(self, apiClient, concurrency=1, depth=None):
+        '''
+        Create a pipeline for the given API client.
+        '''
+
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+
+        self.apiClient = apiClient
+        self.concurrency = concurrency
+        self.depth = depth or 2 * concurrency
+
+    def execute(self, requests):
+        '''
+        Execute the requests.
+
+        :param requests:
+            Dictionaries describing the requests (keys: method, url, data,
+            headers, params). **REQUIRED**
+        :returns:
+            A list in input order holding for each request either the JSON
+            response or the exception it failed with.
+        '''
+
+        requests = list(requests)
+        results = [None] * len(requests)
+
+        sendQueue = queue.Queue(self.depth)
+        processQueue = queue.Queue(self.depth)
+
+        def encryptStage():
+            for (index, request) in enumerate(requests):
+                try:
+                    data = request.get('data')
+                    if data is not None:
+                        data = json.dumps(data).encode('utf-8')
+                    sendQueue.put((index, request, self.apiClient._getRequestData(data)))
+                except Exception as e:
+                    results[index] = e
+            for _ in range(self.concurrency):
+                sendQueue.put(_DONE)
+
+        def sendStage():
+            while True:
+                item = sendQueue.get()
+                if item is _DONE:
+                    processQueue.put(_DONE)
+                    return
+                (index, request, data) = item
+                try:
+                    processQueue.put((index, self.__send(request, data)))
+                except Exception as e:
+                    results[index] = e
+
+        def processStage():
+            remaining = self.concurrency
+            while remaining:
+                item = processQueue.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                (index, response) = item
+                try:
+                    results[index] = self.apiClient._processResponse(response)
+                except Exception as e:
+                    results[index] = e
+
+        threads = [threading.Thread(target=encryptStage)]
+        threads.extend(threading.Thread(target=sendStage) for _ in range(self.concurrency))
+        threads.append(threading.Thread(target=processStage))
+
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    def __send(self, request, data):
+        '''
+        Send one request, through the admission queue if there is one.
+        '''
+
+        arguments = (
+            request.get('method'),
+            request.get('url'),
+            data,
+            request.get('headers'),
+            request.get('params')
+        )
+
+        if self.apiClient.admission is None:
+            return self.apiClient._sendRequest(*arguments)
+
+        with self.apiClient.admission:
+            return self.apiClient._sendRequest(*arguments)
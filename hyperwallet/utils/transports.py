@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+import socket
+import threading
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse  # Python 2
+
+
+class UnixSocketConnection(HTTPConnection):
+    '''
+    A plain HTTP connection over a Unix domain socket.
+
+    :param socketPath:
+        The filesystem path of the Unix domain socket. **REQUIRED**
+    '''
+
+    def __init__(self, *args, **kwargs):
+        '''
+        Create a connection which ignores the TCP host and port and connects
+        to the Unix domain socket instead.
+        '''
+
+        self.socketPath = kwargs.pop('socketPath')
+
+        super(UnixSocketConnection, self).__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        '''
+        Open the Unix domain socket.
+
+        :returns:
+            A connected socket.
+        '''
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        if self.timeout is not None and self.timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+            sock.settimeout(self.timeout)
+
+        try:
+            sock.connect(self.socketPath)
+        except Exception:
+            sock.close()
+            raise
+
+        return sock
+
+
+class UnixSocketConnectionPool(HTTPConnectionPool):
+    '''
+    A connection pool whose connections all go to one Unix domain socket.
+
+    :param socketPath:
+        The filesystem path of the Unix domain socket. **REQUIRED**
+    :param host:
+        The host the requests are addressed to. **REQUIRED**
+    :param port:
+        The port the requests are addressed to.
+    '''
+
+    ConnectionCls = UnixSocketConnection
+
+    def __init__(self, socketPath, host, port=None, **kwargs):
+        '''
+        Create a connection pool for the given Unix domain socket.
+        '''
+
+        kwargs['socketPath'] = socketPath
+
+        super(UnixSocketConnectionPool, self).__init__(host, port, **kwargs)
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    '''
+    A transport adapter which sends every request as plain HTTP to a local
+    proxy listening on a Unix domain socket.
+
+    The request URL, authentication and body are left untouched, the original
+    host is sent in the ``Host`` header and the original scheme in the
+    ``X-Forwarded-Proto`` header so that the proxy can terminate TLS towards
+    the API on our behalf.
+
+    :param socketPath:
+        The filesystem path of the Unix domain socket. **REQUIRED**
+    :param poolMaxSize:
+        The maximum number of connections to keep open to the proxy.
+    '''
+
+    def __init__(self, socketPath, poolMaxSize=10, **kwargs):
+        '''
+        Create a transport adapter for the given Unix domain socket.
+        '''
+
+        self.socketPath = socketPath
+        self.poolMaxSize = poolMaxSize
+        self.pools = {}
+        self.poolsLock = threading.Lock()
+
+        super(UnixSocketAdapter, self).__init__(**kwargs)
+
+    def get_connection(self, url, proxies=None):
+        '''
+        Retrieve the connection pool for the host of the given URL. Proxies
+        are ignored as the socket already leads to a proxy.
+
+        :param url:
+            The URL the request is sent to. **REQUIRED**
+        :returns:
+            A UnixSocketConnectionPool.
+        '''
+
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.hostname, parsed.port)
+
+        with self.poolsLock:
+            pool = self.pools.get(key)
+            if pool is None:
+                pool = UnixSocketConnectionPool(
+                    self.socketPath,
+                    parsed.hostname,
+                    parsed.port,
+                    maxsize=self.poolMaxSize
+                )
+                self.pools[key] = pool
+
+        return pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        '''
+        Retrieve the connection pool for the given request. TLS settings do
+        not apply as the proxy terminates TLS.
+        '''
+
+        return self.get_connection(request.url, proxies)
+
+    def cert_verify(self, conn, url, verify, cert):
+        '''
+        Certificates are verified by the proxy, not by this adapter.
+        '''
+
+        pass
+
+    def request_url(self, request, proxies):
+        '''
+        Always send the origin-form path, never an absolute proxy URL.
+        '''
+
+        return request.path_url
+
+    def add_headers(self, request, **kwargs):
+        '''
+        Add the original host and scheme so the proxy can route the request.
+        '''
+
+        parsed = urlparse(request.url)
+
+        host = parsed.hostname
+        if parsed.port is not None:
+            host = '{}:{}'.format(host, parsed.port)
+
+        request.headers['Host'] = host
+        request.headers['X-Forwarded-Proto'] = parsed.scheme
+
+    def close(self):
+        '''
+        Close all pooled connections to the proxy.
+        '''
+
+        with self.poolsLock:
+            pools = list(self.pools.values())
+            self.pools.clear()
+
+        for pool in pools:
+            pool.close()
+
+        super(UnixSocketAdapter, self).close()
@@ -33,8 +33,9 @@ setup(
                         read('CHANGELOG.rst')),
     maintainer = extract_metaitem('author'),
     maintainer_email = extract_metaitem('email'),
-    packages = find_packages(exclude = ('tests', 'doc')),
-    install_requires = ['requests', 'requests-toolbelt', 'jwcrypto', 'python-jose'],
+    packages = find_packages(exclude = ('tests', 'doc', 'benchmarks')),
+    install_requires = ['requests', 'requests-toolbelt', 'jwcrypto', 'six'],
+    extras_require = {'dataframe': ['numpy', 'pandas'], 'msgpack': ['msgpack']},
     test_suite = 'nose.collector',
     tests_require = [ 'mock', 'nose'],
     keywords='hyperwallet api',